@@ -0,0 +1,80 @@
+"""
+캘린더 요약 정보 read-through 캐시
+- 이름/색상/공개 여부 등 자주 읽고 거의 바뀌지 않는 값을 calendar_id별로 캐싱
+- 여러 캘린더를 get_many 한 번으로 읽고, 없는 것만 DB에서 한 번에 조회해 채움
+- Calendar 저장/삭제, 생성자 닉네임 변경 시 signals에서 무효화
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from calendars.models import Calendar
+
+SUMMARY_FIELDS = (
+    "calendar_id",
+    "name",
+    "description",
+    "color",
+    "is_public",
+    "creator_id",
+    "invitation_code",
+    "created_at",
+)
+
+
+class CalendarSummaryCache:
+    """
+    {calendar_id: 요약 dict} 캐시
+    - 요약 dict 키: SUMMARY_FIELDS + creator_nickname
+    - 존재하지 않는 캘린더는 결과에서 빠짐 (캐싱하지 않음)
+    """
+
+    @staticmethod
+    def cache_key(calendar_id):
+        return f"calendars:summary:{calendar_id}"
+
+    @staticmethod
+    def load_summaries(calendar_ids):
+        """DB에서 요약 일괄 조회"""
+        return {
+            row["calendar_id"]: row
+            for row in Calendar.objects.filter(calendar_id__in=calendar_ids)
+            .order_by()
+            .values(*SUMMARY_FIELDS, creator_nickname=F("creator__nickname"))
+        }
+
+    @classmethod
+    def get_many(cls, calendar_ids):
+        """캘린더 ID 목록의 {calendar_id: 요약} 반환"""
+        keys = {cls.cache_key(pk): pk for pk in set(calendar_ids)}
+        if not keys:
+            return {}
+
+        summaries = {keys[key]: value for key, value in cache.get_many(keys).items()}
+        missing = [pk for pk in keys.values() if pk not in summaries]
+        if missing:
+            loaded = cls.load_summaries(missing)
+            cache.set_many(
+                {cls.cache_key(pk): summary for pk, summary in loaded.items()},
+                settings.CALENDAR_SUMMARY_CACHE_TTL,
+            )
+            summaries.update(loaded)
+        return summaries
+
+    @classmethod
+    def get(cls, calendar_id):
+        return cls.get_many([calendar_id]).get(calendar_id)
+
+    @classmethod
+    def invalidate(cls, calendar_ids):
+        """
+        캐시 무효화
+        - 커밋 전 다른 요청이 이전 값을 다시 캐싱할 수 있으므로 커밋 후에 한 번 더 삭제
+        """
+        keys = [cls.cache_key(pk) for pk in set(calendar_ids)]
+        if not keys:
+            return
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
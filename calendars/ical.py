@@ -0,0 +1,134 @@
+"""
+iCalendar (RFC 5545) 내보내기
+- 이벤트를 한 줄씩 생성하는 제너레이터로 구성해 StreamingHttpResponse로 전송
+"""
+
+from datetime import timezone as dt_timezone
+from types import SimpleNamespace
+
+from django.utils import timezone
+
+from event.recurrence import get_exceptions
+
+PRODID = "-//PoodingDev//Evento//KO"
+MAX_LINE_OCTETS = 75
+
+ICAL_FREQS = {
+    "daily": "DAILY",
+    "weekly": "WEEKLY",
+    "monthly": "MONTHLY",
+}
+
+# iCalendar 변환에 필요한 이벤트 필드 (values()로 조회)
+EVENT_FIELDS = [
+    "event_id",
+    "title",
+    "description",
+    "location",
+    "start_time",
+    "end_time",
+    "updated_at",
+    "is_public",
+    "recurrence_freq",
+    "recurrence_interval",
+    "recurrence_until",
+    "recurrence_count",
+    "recurrence_exceptions",
+]
+
+
+def escape_text(value):
+    """TEXT 값 이스케이프"""
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def format_datetime(value):
+    """UTC 기준 DATE-TIME (예: 20241201T010000Z)"""
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def fold_line(line):
+    """
+    75 octet 단위로 줄 접기
+    - 한글 등 멀티바이트 문자가 중간에 잘리지 않도록 문자 단위로 계산
+    """
+    chunks = []
+    current = ""
+    current_octets = 0
+    for char in line:
+        octets = len(char.encode("utf-8"))
+        limit = MAX_LINE_OCTETS if not chunks else MAX_LINE_OCTETS - 1
+        if current_octets + octets > limit:
+            chunks.append(current)
+            current = ""
+            current_octets = 0
+        current += char
+        current_octets += octets
+    chunks.append(current)
+    return "\r\n ".join(chunks) + "\r\n"
+
+
+def build_rrule(event):
+    parts = [f"FREQ={ICAL_FREQS[event['recurrence_freq']]}"]
+    if event["recurrence_interval"] and event["recurrence_interval"] > 1:
+        parts.append(f"INTERVAL={event['recurrence_interval']}")
+    if event["recurrence_until"]:
+        parts.append(f"UNTIL={format_datetime(event['recurrence_until'])}")
+    if event["recurrence_count"]:
+        parts.append(f"COUNT={event['recurrence_count']}")
+    return ";".join(parts)
+
+
+def iter_vevent(event):
+    """이벤트 1건의 VEVENT 블록"""
+    yield "BEGIN:VEVENT"
+    yield f"UID:{event['event_id']}@evento"
+    yield f"DTSTAMP:{format_datetime(event['updated_at'] or timezone.now())}"
+    yield f"DTSTART:{format_datetime(event['start_time'])}"
+    yield f"DTEND:{format_datetime(event['end_time'])}"
+    yield f"SUMMARY:{escape_text(event['title'])}"
+    if event["description"]:
+        yield f"DESCRIPTION:{escape_text(event['description'])}"
+    if event["location"]:
+        yield f"LOCATION:{escape_text(event['location'])}"
+    yield f"CLASS:{'PUBLIC' if event['is_public'] else 'PRIVATE'}"
+    if event["recurrence_freq"]:
+        yield f"RRULE:{build_rrule(event)}"
+        exceptions = get_exceptions(
+            SimpleNamespace(recurrence_exceptions=event["recurrence_exceptions"])
+        )
+        if exceptions:
+            yield "EXDATE:" + ",".join(
+                format_datetime(value) for value in sorted(exceptions)
+            )
+    yield "END:VEVENT"
+
+
+def iter_calendar(calendar, events):
+    """
+    캘린더 전체를 iCalendar 텍스트 조각으로 반환
+    - events는 EVENT_FIELDS를 담은 dict 이터러블 (queryset.values().iterator())
+    """
+    header = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{escape_text(calendar.name)}",
+        f"X-WR-TIMEZONE:{timezone.get_current_timezone_name()}",
+    ]
+    if calendar.description:
+        header.append(f"X-WR-CALDESC:{escape_text(calendar.description)}")
+    yield "".join(fold_line(line) for line in header)
+
+    for event in events:
+        yield "".join(fold_line(line) for line in iter_vevent(event))
+
+    yield fold_line("END:VCALENDAR")
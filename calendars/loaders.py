@@ -0,0 +1,118 @@
+from django.db import models
+from rest_framework import serializers
+
+from calendars.cache import CalendarSummaryCache
+from calendars.models import CalendarAdmin, Subscription
+from favorite_event.models import FavoriteEvent
+
+
+class BatchLoader:
+    """
+    요청 단위 배치 로더
+    - 직렬화할 객체들의 ID를 모아 종류별로 한 번의 IN 쿼리로 조회
+    - 조회 결과는 요청이 끝날 때까지 재사용
+    """
+
+    def __init__(self, user=None):
+        self.user = user if user is not None and user.is_authenticated else None
+        self._calendars = {}
+        self._favorite_event_ids = set()
+        self._checked_event_ids = set()
+        self._subscribed_calendar_ids = set()
+        self._checked_calendar_ids = set()
+        self._admin_nicknames = {}
+
+    @classmethod
+    def for_request(cls, request):
+        """요청 객체에 로더를 저장해 같은 요청 안에서 공유"""
+        http_request = getattr(request, "_request", request)
+        loader = getattr(http_request, "_batch_loader", None)
+        if loader is None:
+            loader = cls(getattr(request, "user", None))
+            http_request._batch_loader = loader
+        return loader
+
+    @classmethod
+    def from_context(cls, context):
+        """Serializer context에서 로더 조회 (request가 없으면 context에 저장)"""
+        request = context.get("request")
+        if request is not None:
+            return cls.for_request(request)
+        if "batch_loader" not in context:
+            context["batch_loader"] = cls()
+        return context["batch_loader"]
+
+    def load_calendars(self, calendar_ids):
+        """캘린더 요약(이름/색상 등) 일괄 조회 (CalendarSummaryCache 경유)"""
+        missing = {pk for pk in calendar_ids if pk not in self._calendars}
+        if missing:
+            self._calendars.update(CalendarSummaryCache.get_many(missing))
+            for pk in missing:
+                self._calendars.setdefault(pk, None)
+
+    def load_favorites(self, event_ids):
+        """현재 사용자의 즐겨찾기 여부 일괄 조회"""
+        missing = set(event_ids) - self._checked_event_ids
+        if not missing or self.user is None:
+            return
+        self._favorite_event_ids.update(
+            FavoriteEvent.objects.filter(
+                user_id=self.user, event_id__in=missing
+            ).values_list("event_id", flat=True)
+        )
+        self._checked_event_ids.update(missing)
+
+    def load_subscriptions(self, calendar_ids):
+        """현재 사용자의 구독 여부 일괄 조회"""
+        missing = set(calendar_ids) - self._checked_calendar_ids
+        if not missing or self.user is None:
+            return
+        self._subscribed_calendar_ids.update(
+            Subscription.objects.filter(
+                user=self.user, calendar_id__in=missing
+            ).values_list("calendar_id", flat=True)
+        )
+        self._checked_calendar_ids.update(missing)
+
+    def load_admin_nicknames(self, calendar_ids):
+        """캘린더별 관리자 닉네임 일괄 조회"""
+        missing = {pk for pk in calendar_ids if pk not in self._admin_nicknames}
+        if not missing:
+            return
+        for pk in missing:
+            self._admin_nicknames[pk] = []
+        rows = CalendarAdmin.objects.filter(calendar_id__in=missing).values_list(
+            "calendar_id", "user__nickname"
+        )
+        for calendar_id, nickname in rows:
+            self._admin_nicknames[calendar_id].append(nickname)
+
+    def get_calendar(self, calendar_id):
+        """캘린더 요약 dict (없는 캘린더면 None)"""
+        self.load_calendars([calendar_id])
+        return self._calendars.get(calendar_id)
+
+    def is_liked(self, event_id):
+        self.load_favorites([event_id])
+        return event_id in self._favorite_event_ids
+
+    def is_subscribed(self, calendar_id):
+        self.load_subscriptions([calendar_id])
+        return calendar_id in self._subscribed_calendar_ids
+
+    def get_admin_nicknames(self, calendar_id):
+        self.load_admin_nicknames([calendar_id])
+        return self._admin_nicknames[calendar_id]
+
+
+class BatchLoadListSerializer(serializers.ListSerializer):
+    """
+    many=True 직렬화 시 child의 prime_batch()를 먼저 호출해
+    per-object 조회를 일괄 조회로 바꾸는 ListSerializer
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        instances = list(iterable)
+        self.child.prime_batch(BatchLoader.from_context(self.context), instances)
+        return super().to_representation(instances)
@@ -25,8 +25,12 @@ class Calendar(models.Model):
     description = models.TextField(null=True, blank=True)
     is_public = models.BooleanField(default=True)
     color = models.CharField(max_length=7)
+    # 켜면 이 캘린더의 단일 이벤트끼리 시간이 겹칠 수 없음
+    no_overlap = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     invitation_code = models.CharField(max_length=255, null=True, blank=True)
+    # 캘린더/이벤트/관리자/구독 변경 시 증가 (피드 ETag 계산용)
+    version = models.PositiveBigIntegerField(default=0)
 
     class Meta:
         ordering = ["-created_at"]
@@ -37,7 +41,14 @@ class Calendar(models.Model):
             is_new = self.pk is None
             if not self.invitation_code:
                 self.invitation_code = self.generate_invitation_code()
+            if not is_new:
+                # 동시 수정 시에도 버전이 유실되지 않도록 DB에서 증가
+                self.version = models.F("version") + 1
+                if kwargs.get("update_fields") is not None:
+                    kwargs["update_fields"] = {*kwargs["update_fields"], "version"}
             super().save(*args, **kwargs)
+            if not is_new:
+                self.refresh_from_db(fields=["version"])
 
             if is_new:
                 CalendarAdmin.objects.get_or_create(user=self.creator, calendar=self)
@@ -61,9 +72,14 @@ class Calendar(models.Model):
     def generate_invitation_code():
         return "".join(random.choices(string.ascii_uppercase + string.digits, k=6))
 
-    def has_admin_permission(self, user):
-        """사용자의 관리자 권한 확인"""
-        return user == self.creator or self.admins.filter(id=user.id).exists()
+    @staticmethod
+    def bump_versions(calendar_ids):
+        """캘린더 버전 일괄 증가 (signals를 거치지 않는 일괄 변경 후 호출)"""
+        calendar_ids = {pk for pk in calendar_ids if pk is not None}
+        if calendar_ids:
+            Calendar.objects.filter(calendar_id__in=calendar_ids).update(
+                version=models.F("version") + 1
+            )
 
 
 class Subscription(models.Model):
@@ -97,6 +113,7 @@ class CalendarAdmin(models.Model):
         Calendar, on_delete=models.CASCADE, related_name="calendar_admins"
     )
     added_at = models.DateTimeField(auto_now_add=True)
+    is_active = models.BooleanField(default=True)  # 체크박스 상태 (피드 표시 여부)
 
     def __str__(self):
         return f"{self.user} is admin of {self.calendar}"
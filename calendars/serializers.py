@@ -1,6 +1,10 @@
 from rest_framework import serializers
 
+from event.services import EventConflictService
+
+from .loaders import BatchLoader, BatchLoadListSerializer
 from .models import Calendar, Subscription
+from .services import ROLE_CREATOR, CalendarRoleResolver
 
 
 class CalendarCreateSerializer(serializers.ModelSerializer):
@@ -16,6 +20,7 @@ class CalendarCreateSerializer(serializers.ModelSerializer):
             "description",
             "is_public",
             "color",
+            "no_overlap",
             "admins",
         ]
         # exclude = ['calendar_id']  # 생성 시 캘린더 ID 제외
@@ -27,8 +32,14 @@ class CalendarCreateSerializer(serializers.ModelSerializer):
         representation = super().to_representation(instance)
         request = self.context.get("request")
 
-        # 관리자 권한이 없는 경우 초대 코드 제거
-        if request and not instance.has_admin_permission(request.user):
+        # 관리자 권한이 없는 경우 초대 코드 제거 (생성 직후에는 역할 맵에 없을 수 있음)
+        if (
+            request
+            and instance.creator_id != request.user.pk
+            and not CalendarRoleResolver.for_request(request).is_admin(
+                instance.calendar_id
+            )
+        ):
             representation.pop("invitation_code", None)
 
         return representation
@@ -46,10 +57,13 @@ class CalendarSearchResultSerializer(serializers.ModelSerializer):
     class Meta:
         model = Calendar
         fields = ["name", "creator_nickname", "is_subscribed"]
+        list_serializer_class = BatchLoadListSerializer
+
+    def prime_batch(self, loader, instances):
+        loader.load_subscriptions([obj.calendar_id for obj in instances])
 
     def get_is_subscribed(self, obj):
-        user = self.context["request"].user
-        return Subscription.objects.filter(user=user, calendar=obj).exists()
+        return BatchLoader.from_context(self.context).is_subscribed(obj.calendar_id)
 
 
 class CalendarDetailSerializer(serializers.ModelSerializer):
@@ -72,8 +86,22 @@ class CalendarDetailSerializer(serializers.ModelSerializer):
             "creator_nickname",
             "invitation_code",
             "admins",
+            "no_overlap",
         ]
 
+    def validate_no_overlap(self, value):
+        """이미 겹치는 이벤트가 있으면 겹침 금지를 켤 수 없음"""
+        if (
+            value
+            and self.instance is not None
+            and not self.instance.no_overlap
+            and EventConflictService.has_overlapping_events(self.instance.calendar_id)
+        ):
+            raise serializers.ValidationError(
+                "이미 시간이 겹치는 이벤트가 있어 겹침 금지를 설정할 수 없습니다."
+            )
+        return value
+
 
 class SubscriptionSerializer(serializers.ModelSerializer):
     """
@@ -163,7 +191,10 @@ class AdminInvitationSerializer(serializers.Serializer):
             calendar = Calendar.objects.get(invitation_code=value)
         except Calendar.DoesNotExist:
             raise serializers.ValidationError("유효하지 않은 초대 코드입니다.")
-        if self.context["request"].user in calendar.admins.all():
+        resolver = CalendarRoleResolver.for_request(self.context["request"])
+        if resolver.get_role(calendar.calendar_id) == ROLE_CREATOR:
+            raise serializers.ValidationError("캘린더 생성자는 이미 관리자입니다.")
+        if resolver.is_admin(calendar.calendar_id):
             raise serializers.ValidationError("이미 캘린더 관리자로 추가되었습니다.")
         self.calendar = calendar
         return value
@@ -186,9 +217,15 @@ class AdminCalendarSerializer(serializers.ModelSerializer):
     class Meta:
         model = Calendar
         fields = ["name", "creator_id", "admin_members"]
+        list_serializer_class = BatchLoadListSerializer
+
+    def prime_batch(self, loader, instances):
+        loader.load_admin_nicknames([obj.calendar_id for obj in instances])
 
     def get_admin_members(self, obj):
-        return list(obj.admins.values_list("nickname", flat=True))
+        return BatchLoader.from_context(self.context).get_admin_nicknames(
+            obj.calendar_id
+        )
 
 
 class CalendarSearchSerializer(serializers.ModelSerializer):
@@ -198,11 +235,15 @@ class CalendarSearchSerializer(serializers.ModelSerializer):
     class Meta:
         model = Calendar
         fields = ["calendar_id", "name", "creator_nickname", "is_subscribed"]
+        list_serializer_class = BatchLoadListSerializer
+
+    def prime_batch(self, loader, instances):
+        loader.load_subscriptions([obj.calendar_id for obj in instances])
 
     def get_is_subscribed(self, obj):
         request = self.context.get("request")
         if request and request.user.is_authenticated:
-            return Subscription.objects.filter(user=request.user, calendar=obj).exists()
+            return BatchLoader.from_context(self.context).is_subscribed(obj.calendar_id)
         return False
 
 
@@ -213,3 +254,18 @@ class UpdateCalendarActiveSerializer(serializers.Serializer):
 
     calendar_id = serializers.IntegerField(required=True, help_text="캘린더 ID")
     is_active = serializers.BooleanField(required=True, help_text="활성화 상태")
+
+
+class BulkUpdateCalendarActiveSerializer(serializers.Serializer):
+    """
+    여러 캘린더의 활성화 상태 일괄 업데이트를 위한 Serializer
+    """
+
+    calendar_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=1000,
+        help_text="캘린더 ID 목록 (생략 시 모든 관리 캘린더)",
+    )
+    is_active = serializers.BooleanField(required=True, help_text="활성화 상태")
@@ -0,0 +1,227 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Value
+from django.utils.http import parse_etags
+
+from calendars.cache import CalendarSummaryCache
+from calendars.models import Calendar, CalendarAdmin, Subscription
+
+ROLE_CREATOR = "creator"
+ROLE_ADMIN = "admin"
+ROLE_SUBSCRIBER = "subscriber"
+
+# 관리 권한이 있는 역할 (생성자 + 관리자)
+ADMIN_ROLES = (ROLE_CREATOR, ROLE_ADMIN)
+
+# 한 캘린더에 여러 역할이 있으면 높은 쪽을 사용
+ROLE_PRIORITY = {ROLE_SUBSCRIBER: 0, ROLE_ADMIN: 1, ROLE_CREATOR: 2}
+
+
+class VisibleCalendarService:
+    """
+    사용자별로 볼 수 있는 캘린더 목록 관리
+    - {calendar_id: 역할} 형태로 캐시에 저장하고, 캐시에 없으면 DB에서 계산
+    - Subscription / CalendarAdmin 변경 시 signals에서 무효화
+    """
+
+    @staticmethod
+    def cache_key(user_id):
+        return f"calendars:visible:{user_id}"
+
+    @staticmethod
+    def load_roles(user_id):
+        """
+        DB에서 역할 맵 계산
+        - OR 조인 + DISTINCT 대신 테이블별 단순 조회를 UNION ALL 한 번으로 묶고
+          우선순위대로 병합
+        """
+        role_field = models.CharField()
+        rows = (
+            Subscription.objects.filter(user_id=user_id, is_active=True)
+            .order_by()
+            .values_list("calendar_id", Value(ROLE_SUBSCRIBER, output_field=role_field))
+            .union(
+                CalendarAdmin.objects.filter(user_id=user_id)
+                .order_by()
+                .values_list("calendar_id", Value(ROLE_ADMIN, output_field=role_field)),
+                Calendar.objects.filter(creator_id=user_id)
+                .order_by()
+                .values_list(
+                    "calendar_id", Value(ROLE_CREATOR, output_field=role_field)
+                ),
+                all=True,
+            )
+        )
+        roles = {}
+        for calendar_id, role in rows:
+            current = roles.get(calendar_id)
+            if current is None or ROLE_PRIORITY[role] > ROLE_PRIORITY[current]:
+                roles[calendar_id] = role
+        return roles
+
+    @classmethod
+    def get_roles(cls, user):
+        """사용자의 {calendar_id: 역할} 맵 반환"""
+        if not user.is_authenticated:
+            return {}
+
+        key = cls.cache_key(user.pk)
+        roles = cache.get(key)
+        if roles is None:
+            roles = cls.load_roles(user.pk)
+            cache.set(key, roles, settings.VISIBLE_CALENDARS_CACHE_TTL)
+        return roles
+
+    @classmethod
+    def get_calendar_ids(cls, user, roles=None):
+        """
+        볼 수 있는 캘린더 ID 목록 반환
+        - roles를 지정하면 해당 역할의 캘린더만 반환
+        """
+        return [
+            calendar_id
+            for calendar_id, role in cls.get_roles(user).items()
+            if roles is None or role in roles
+        ]
+
+    @classmethod
+    def invalidate(cls, user_id):
+        """
+        캐시 무효화
+        - 트랜잭션 커밋 전 다른 요청이 이전 상태를 다시 캐싱할 수 있으므로
+          커밋 후에 한 번 더 삭제
+        """
+        key = cls.cache_key(user_id)
+        cache.delete(key)
+        transaction.on_commit(lambda: cache.delete(key))
+
+
+class CalendarRoleResolver:
+    """
+    요청 단위 캘린더 권한 확인
+    - 요청 사용자의 역할 맵을 요청당 한 번 DB에서 읽어(UNION 쿼리 1회) 요청 객체에 저장
+    - 권한 확인은 프로세스 캐시(get_roles)를 쓰지 않음 → 만료 전 역할 변경이 반영되지 않는 문제 방지
+    - 이후 권한 확인은 dict 조회
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._roles = None
+
+    @classmethod
+    def for_request(cls, request):
+        """요청 객체에 resolver를 저장해 같은 요청 안에서 공유"""
+        http_request = getattr(request, "_request", request)
+        resolver = getattr(http_request, "_calendar_role_resolver", None)
+        if resolver is None:
+            resolver = cls(request.user)
+            http_request._calendar_role_resolver = resolver
+        return resolver
+
+    @property
+    def roles(self):
+        if self._roles is None:
+            self._roles = (
+                VisibleCalendarService.load_roles(self.user.pk)
+                if self.user.is_authenticated
+                else {}
+            )
+        return self._roles
+
+    def get_role(self, calendar_id):
+        """캘린더에 대한 역할 (creator / admin / subscriber, 없으면 None)"""
+        return self.roles.get(calendar_id)
+
+    def is_admin(self, calendar_id):
+        """관리 권한(생성자 또는 관리자) 여부"""
+        return self.get_role(calendar_id) in ADMIN_ROLES
+
+
+class CalendarVersionService:
+    """
+    캘린더 버전 기반 조건부 GET (ETag / 304)
+    - 피드에 포함되는 캘린더들의 (calendar_id, version)으로 ETag 계산
+    - 이벤트 조회/직렬화 전에 If-None-Match와 비교
+    """
+
+    @staticmethod
+    def get_versions(calendar_ids):
+        return sorted(
+            Calendar.objects.filter(calendar_id__in=calendar_ids).values_list(
+                "calendar_id", "version"
+            )
+        )
+
+    @staticmethod
+    def make_etag(*parts):
+        digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+        return f'W/"{digest}"'
+
+    @classmethod
+    def get_etag(cls, calendar_ids, *extra):
+        return cls.make_etag(cls.get_versions(calendar_ids), *extra)
+
+    @staticmethod
+    def is_not_modified(request, etag):
+        """If-None-Match 헤더가 현재 ETag와 일치하는지 확인"""
+        header = request.headers.get("If-None-Match")
+        if not header:
+            return False
+        etags = parse_etags(header)
+        # 약한 비교: W/ 접두어 무시
+        return "*" in etags or etag.removeprefix("W/") in {
+            tag.removeprefix("W/") for tag in etags
+        }
+
+
+class CalendarSearchService:
+    """
+    생성자 닉네임 앞부분으로 공개 캘린더 검색
+    - 검색어별 캘린더 ID 목록을 짧게 캐싱 (자주 입력되는 짧은 검색어의 반복 조회 방지)
+    - 공개 여부는 캘린더 저장 시 무효화되는 요약 캐시로, 구독 여부는 매 요청 확인
+    """
+
+    @staticmethod
+    def cache_key(prefix):
+        digest = hashlib.sha1(prefix.upper().encode()).hexdigest()
+        return f"calendars:search:{digest}"
+
+    @classmethod
+    def get_calendar_ids(cls, prefix):
+        """닉네임이 prefix로 시작하는 사용자가 만든 공개 캘린더 ID (최대 개수 제한)"""
+        key = cls.cache_key(prefix)
+        calendar_ids = cache.get(key)
+        if calendar_ids is None:
+            calendar_ids = list(
+                Calendar.objects.filter(
+                    is_public=True, creator__nickname__istartswith=prefix
+                ).values_list("calendar_id", flat=True)[
+                    : settings.CALENDAR_SEARCH_MAX_RESULTS
+                ]
+            )
+            cache.set(key, calendar_ids, settings.CALENDAR_SEARCH_CACHE_TTL)
+        return calendar_ids
+
+    @classmethod
+    def search(cls, user, prefix):
+        """
+        검색 결과 (요약 dict 목록, 최신 순)
+        - 캘린더 정보는 CalendarSummaryCache, 구독 여부는 한 번의 IN 쿼리로 조회
+        - 캘린더 행을 DB에서 읽지 않으므로 Exists를 annotate할 쿼리가 없음
+          → 구독 여부만 (user_id, calendar_id IN ...)으로 따로 조회
+        """
+        calendar_ids = cls.get_calendar_ids(prefix)
+        summaries = CalendarSummaryCache.get_many(calendar_ids)
+        subscribed_ids = set(
+            Subscription.objects.filter(
+                user_id=user.pk, calendar_id__in=calendar_ids
+            ).values_list("calendar_id", flat=True)
+        )
+        return [
+            {**summary, "is_subscribed": calendar_id in subscribed_ids}
+            for calendar_id in calendar_ids
+            if (summary := summaries.get(calendar_id)) and summary["is_public"]
+        ]
@@ -0,0 +1,82 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from calendars.cache import CalendarSummaryCache
+from calendars.models import Calendar, CalendarAdmin, Subscription
+from calendars.services import VisibleCalendarService
+from user.models import User
+
+
+@receiver(post_save, sender=Subscription)
+@receiver(post_delete, sender=Subscription)
+@receiver(post_save, sender=CalendarAdmin)
+@receiver(post_delete, sender=CalendarAdmin)
+def invalidate_visible_calendars(sender, instance, **kwargs):
+    """구독/관리자 변경 시 해당 사용자의 캘린더 목록 캐시 무효화 및 버전 증가"""
+    VisibleCalendarService.invalidate(instance.user_id)
+    Calendar.bump_versions([instance.calendar_id])
+
+
+@receiver(post_save, sender=Calendar)
+def invalidate_creator_calendars(sender, instance, created, **kwargs):
+    """캘린더 생성 시 생성자의 캘린더 목록 캐시 무효화"""
+    if created:
+        VisibleCalendarService.invalidate(instance.creator_id)
+
+
+@receiver(post_save, sender=Calendar)
+@receiver(post_delete, sender=Calendar)
+def invalidate_calendar_summary(sender, instance, **kwargs):
+    """캘린더 수정/삭제 시 요약 캐시 무효화"""
+    CalendarSummaryCache.invalidate([instance.pk])
+
+
+@receiver(post_save, sender=Calendar)
+def sync_event_no_overlap(sender, instance, created, update_fields, **kwargs):
+    """겹침 금지 설정을 이벤트의 enforce_no_overlap에 반영 (배제 제약 조건용)"""
+    if created or (update_fields is not None and "no_overlap" not in update_fields):
+        return
+    instance.events.exclude(enforce_no_overlap=instance.no_overlap).update(
+        enforce_no_overlap=instance.no_overlap
+    )
+
+
+@receiver(m2m_changed, sender=Calendar.admins.through)
+def invalidate_admin_calendars(sender, instance, action, pk_set, reverse, **kwargs):
+    """
+    calendar.admins.add()/remove()/clear()는 post_save를 보내지 않으므로
+    m2m_changed로 무효화
+    """
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if reverse:
+        # user.admin_calendars.add(...) 형태
+        VisibleCalendarService.invalidate(instance.pk)
+        Calendar.bump_versions(pk_set or ())
+        return
+
+    if action == "pre_clear":
+        pk_set = set(
+            CalendarAdmin.objects.filter(calendar=instance).values_list(
+                "user_id", flat=True
+            )
+        )
+    for user_id in pk_set or ():
+        VisibleCalendarService.invalidate(user_id)
+    Calendar.bump_versions([instance.pk])
+
+
+@receiver(post_save, sender=User)
+def bump_creator_calendar_versions(sender, instance, created, update_fields, **kwargs):
+    """
+    생성자 닉네임은 구독 피드와 캘린더 요약에 포함되므로
+    변경 시 생성한 캘린더 버전 증가 및 요약 캐시 무효화
+    """
+    if created or (update_fields is not None and "nickname" not in update_fields):
+        return
+    calendar_ids = list(
+        instance.created_calendars.values_list("calendar_id", flat=True)
+    )
+    Calendar.bump_versions(calendar_ids)
+    CalendarSummaryCache.invalidate(calendar_ids)
@@ -4,6 +4,11 @@ from .views import (
     ActiveSubscriptionsAPIView,
     AdminCalendarsAPIView,
     AdminInvitationView,
+    BulkUpdateCalendarAdminActiveView,
+    CalendarCloneAPIView,
+    CalendarConflictsAPIView,
+    CalendarExportAPIView,
+    CalendarFreeBusyAPIView,
     CalendarListCreateAPIView,
     CalendarMembersAPIView,
     CalendarRetrieveUpdateDestroyAPIView,
@@ -45,6 +50,24 @@ urlpatterns = [
     ),
     # 관리 권한이 있는 캘린더 조회
     path("admin/", AdminCalendarsAPIView.as_view(), name="admin-calendars"),
+    # 캘린더 iCalendar 내보내기
+    path(
+        "<int:pk>/export.ics", CalendarExportAPIView.as_view(), name="calendar-export"
+    ),
+    # 캘린더 관리자 빈 시간 조회
+    path(
+        "<int:pk>/freebusy/",
+        CalendarFreeBusyAPIView.as_view(),
+        name="calendar-freebusy",
+    ),
+    # 캘린더 복제 (이벤트 포함)
+    path("<int:pk>/clone/", CalendarCloneAPIView.as_view(), name="calendar-clone"),
+    # 캘린더 이벤트 시간 겹침 조회
+    path(
+        "<int:pk>/conflicts/",
+        CalendarConflictsAPIView.as_view(),
+        name="calendar-conflicts",
+    ),
     # 캘린더 멤버 조회
     path(
         "<int:pk>/members/", CalendarMembersAPIView.as_view(), name="calendar-members"
@@ -56,6 +79,11 @@ urlpatterns = [
         UpdateCalendarAdminActiveView.as_view(),
         name="update-calendar-admin-active",
     ),
+    path(
+        "admins/update/bulk/",
+        BulkUpdateCalendarAdminActiveView.as_view(),
+        name="bulk-update-calendar-admin-active",
+    ),
     path(
         "subscriptions/update-subscription/",
         UpdateSubscriptionActiveView.as_view(),
@@ -1,5 +1,10 @@
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
 from django.db import models, transaction
-from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
@@ -12,14 +17,36 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from config.pagination import SubscriptionKeysetPagination
+from event.bulkload import clone_calendar
+from event.freebusy import get_free_busy
+from event.models import Event
+from event.serializers import EventSerializer
+from event.services import (
+    EventConflictService,
+    EventService,
+    InvalidEventWindowException,
+)
+
+from .cache import CalendarSummaryCache
+from .ical import EVENT_FIELDS, iter_calendar
+from .loaders import BatchLoader
 from .models import Calendar, CalendarAdmin, Subscription
 from .serializers import (
     AdminInvitationSerializer,
+    BulkUpdateCalendarActiveSerializer,
     CalendarCreateSerializer,
     CalendarDetailSerializer,
     SubscriptionSerializer,
     UpdateCalendarActiveSerializer,
 )
+from .services import (
+    ADMIN_ROLES,
+    CalendarRoleResolver,
+    CalendarSearchService,
+    CalendarVersionService,
+    VisibleCalendarService,
+)
 
 
 class CalendarListCreateAPIView(ListCreateAPIView):
@@ -31,16 +58,6 @@ class CalendarListCreateAPIView(ListCreateAPIView):
     serializer_class = CalendarCreateSerializer
     permission_classes = [IsAuthenticated]
 
-    def get_queryset(self):
-        user = self.request.user
-        if not user.is_authenticated:
-            return Calendar.objects.none()
-
-        return Calendar.objects.filter(
-            Q(creator=user)
-            | Q(calendar_admins__user=user, calendar_admins__is_active=True)
-        ).distinct()
-
     @extend_schema(
         summary="캘린더 목록 조회",
         description="현재 사용자가 생성한 캘린더 목록을 반환합니다.",
@@ -61,6 +78,8 @@ class CalendarListCreateAPIView(ListCreateAPIView):
     def get_queryset(self):
         if self.request.user.is_authenticated:
             # 생성자 또는 관리자로 속한 캘린더 조회 가능
+            # - 표시 여부(CalendarAdmin.is_active)는 피드에만 적용하고, 목록에는
+            #   숨긴 캘린더도 포함해 다시 표시할 수 있게 함
             return self.queryset.filter(
                 models.Q(creator=self.request.user) | models.Q(admins=self.request.user)
             ).distinct()
@@ -181,6 +200,7 @@ class SubscriptionListCreateAPIView(ListCreateAPIView):
 
     serializer_class = SubscriptionSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = SubscriptionKeysetPagination
 
     def get_queryset(self):
         return Subscription.objects.filter(user=self.request.user)
@@ -191,25 +211,46 @@ class SubscriptionListCreateAPIView(ListCreateAPIView):
         responses={200: SubscriptionSerializer(many=True)},
     )
     def get(self, request, *args, **kwargs):
-        subscriptions = self.get_queryset()
+        # 구독 상태와 캘린더 버전이 그대로면 직렬화 없이 304 반환
+        subscription_state = list(
+            self.get_queryset()
+            .order_by("id")
+            .values_list("id", "is_active", "calendar_id", "calendar__version")
+        )
+        etag = CalendarVersionService.make_etag(
+            request.user.pk, subscription_state, request.get_full_path()
+        )
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if CalendarVersionService.is_not_modified(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        subscriptions = self.paginate_queryset(self.get_queryset())
+        calendars = CalendarSummaryCache.get_many(
+            [subscription.calendar_id for subscription in subscriptions]
+        )
         data = []
 
         for subscription in subscriptions:
-            calendar = subscription.calendar
+            calendar = calendars.get(subscription.calendar_id)
+            if calendar is None:
+                continue
             subscription_data = {
                 "subscription_id": subscription.id,
-                "calendar_id": calendar.calendar_id,
-                "name": calendar.name,
-                "description": calendar.description,
-                "is_public": calendar.is_public,
-                "color": calendar.color,
-                "creator_id": calendar.creator_id,
-                "creator_nickname": calendar.creator.nickname,
+                "calendar_id": calendar["calendar_id"],
+                "name": calendar["name"],
+                "description": calendar["description"],
+                "is_public": calendar["is_public"],
+                "color": calendar["color"],
+                "creator_id": calendar["creator_id"],
+                "creator_nickname": calendar["creator_nickname"],
                 "is_active": subscription.is_active,  # Subscription 모델의 is_active 사용
             }
             data.append(subscription_data)
 
-        return Response(data, status=200)
+        response = self.get_paginated_response(data)
+        for name, value in headers.items():
+            response[name] = value
+        return response
 
     @extend_schema(
         summary="캘린더 구독 추가",
@@ -317,7 +358,10 @@ class CalendarSearchAPIView(ListAPIView):
 
     @extend_schema(
         summary="닉네임으로 시작하는 유저가 만든 공개 캘린더 검색",
-        description="닉네임으로 시작하는 유저가 생성한 공개 캘린더를 검색합니다.",
+        description=(
+            "닉네임으로 시작하는 유저가 생성한 공개 캘린더를 검색합니다. "
+            f"최신 순으로 최대 {settings.CALENDAR_SEARCH_MAX_RESULTS}개를 반환합니다."
+        ),
         parameters=[
             OpenApiParameter(
                 name="nickname",
@@ -347,42 +391,23 @@ class CalendarSearchAPIView(ListAPIView):
         if not nickname:
             return Response({"error": "닉네임을 입력해주세요."}, status=400)
 
-        calendars = (
-            Calendar.objects.filter(
-                is_public=True, creator__nickname__istartswith=nickname
-            )
-            .select_related("creator")
-            .distinct()
-        )
-
-        data = []
-        for calendar in calendars:
-            is_subscribed = Subscription.objects.filter(
-                user=request.user, calendar=calendar
-            ).exists()
-
-            calendar_data = {
-                "calendar_id": calendar.calendar_id,
-                "name": calendar.name,
-                "description": calendar.description,
-                "creator_nickname": calendar.creator.nickname,
-                "is_public": calendar.is_public,
-                "color": calendar.color,
-                "created_at": calendar.created_at,
-                "is_subscribed": is_subscribed,
+        data = [
+            {
+                "calendar_id": calendar["calendar_id"],
+                "name": calendar["name"],
+                "description": calendar["description"],
+                "creator_nickname": calendar["creator_nickname"],
+                "is_public": calendar["is_public"],
+                "color": calendar["color"],
+                "created_at": calendar["created_at"],
+                "is_subscribed": calendar["is_subscribed"],
             }
-            data.append(calendar_data)
+            for calendar in CalendarSearchService.search(request.user, nickname)
+        ]
 
         return Response(data, status=200)
 
 
-from threading import Lock
-
-# thread-safe 전역 변수 저장소
-calendar_admin_active_status = {}
-lock = Lock()
-
-
 class UpdateCalendarAdminActiveView(APIView):
     permission_classes = [IsAuthenticated]
     serializer_class = UpdateCalendarActiveSerializer
@@ -430,12 +455,19 @@ class UpdateCalendarAdminActiveView(APIView):
 
         calendar_id = serializer.validated_data["calendar_id"]
         is_active = serializer.validated_data["is_active"]
+        calendar_admins = CalendarAdmin.objects.filter(
+            user=request.user, calendar_id=calendar_id
+        )
+        if not calendar_admins.exists():
+            return Response(
+                {"error": "해당 캘린더를 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
 
-        user_key = getattr(request.user, "id", request.user.username)
-
-        # thread-safe 방식으로 데이터 업데이트
-        with lock:
-            calendar_admin_active_status[(user_key, calendar_id)] = is_active
+        # update()는 signals를 거치지 않으므로 캐시 무효화와 버전 증가를 직접 처리
+        if calendar_admins.exclude(is_active=is_active).update(is_active=is_active):
+            VisibleCalendarService.invalidate(request.user.pk)
+            Calendar.bump_versions([calendar_id])
 
         return Response(
             {"message": "캘린더 표시 여부가 성공적으로 업데이트되었습니다."},
@@ -443,67 +475,67 @@ class UpdateCalendarAdminActiveView(APIView):
         )
 
 
-# 메모리 내 상태 저장소
-# calendar_admin_active_status = {}
-#
-#
-# class UpdateCalendarAdminActiveView(APIView):
-#     permission_classes = [IsAuthenticated]
-#     serializer_class = UpdateCalendarActiveSerializer
-#
-#     @extend_schema(
-#         summary="관리 캘린더 표시여부 업데이트",
-#         description="체크박스 상태에 따라 관리 캘린더의 표시 여부를 업데이트합니다.",
-#         request=UpdateCalendarActiveSerializer,
-#         responses={
-#             200: {
-#                 "description": "성공",
-#                 "content": {
-#                     "application/json": {
-#                         "example": {
-#                             "message": "캘린더 표시 여부가 성공적으로 업데이트되었습니다."
-#                         }
-#                     }
-#                 },
-#             },
-#             400: {
-#                 "description": "잘못된 요청",
-#                 "content": {
-#                     "application/json": {
-#                         "example": {"error": "요청 데이터가 유효하지 않습니다."}
-#                     }
-#                 },
-#             },
-#             404: {
-#                 "description": "찾을 수 없음",
-#                 "content": {
-#                     "application/json": {
-#                         "example": {"error": "해당 구독을 찾을 수 없습니다."}
-#                     }
-#                 },
-#             },
-#         },
-#     )
-#     def patch(self, request):
-#         serializer = UpdateCalendarActiveSerializer(data=request.data)
-#         if not serializer.is_valid():
-#             return Response(
-#                 {"error": "요청 데이터가 유효하지 않습니다."},
-#                 status=status.HTTP_400_BAD_REQUEST,
-#             )
-#
-#         calendar_id = serializer.validated_data["calendar_id"]
-#         is_active = serializer.validated_data["is_active"]
-#
-#         # 사용자별로 캘린더의 is_active 상태 저장
-#         user_key = getattr(request.user, "id", request.user.username)
-#         calendar_admin_active_status[(user_key, calendar_id)] = is_active
-#
-#         return Response(
-#             {"message": "캘린더 표시 여부가 성공적으로 업데이트되었습니다."},
-#             status=status.HTTP_200_OK,
-#         )
-#
+class BulkUpdateCalendarAdminActiveView(APIView):
+    """
+    관리 캘린더 표시 여부 일괄 업데이트
+    - 여러 캘린더를 UPDATE 한 번으로 변경 (관리 권한이 없는 캘린더 ID는 무시)
+    - updated_count: 표시 여부가 실제로 바뀐 캘린더 수
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = BulkUpdateCalendarActiveSerializer
+
+    @extend_schema(
+        summary="관리 캘린더 표시여부 일괄 업데이트",
+        description=(
+            "여러 관리 캘린더의 표시 여부를 한 번에 업데이트합니다. "
+            "calendar_ids를 생략하면 모든 관리 캘린더에 적용합니다."
+        ),
+        request=BulkUpdateCalendarActiveSerializer,
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "message": {"type": "string"},
+                    "updated_count": {"type": "integer"},
+                },
+            },
+            400: {"description": "요청 데이터가 유효하지 않습니다."},
+        },
+    )
+    def patch(self, request):
+        serializer = self.serializer_class(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error": "요청 데이터가 유효하지 않습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        is_active = serializer.validated_data["is_active"]
+        calendar_admins = CalendarAdmin.objects.filter(user=request.user).exclude(
+            is_active=is_active
+        )
+        calendar_ids = serializer.validated_data.get("calendar_ids")
+        if calendar_ids is not None:
+            calendar_admins = calendar_admins.filter(calendar_id__in=calendar_ids)
+
+        # 실제로 바뀌는 캘린더만 UPDATE 한 번으로 변경
+        # update()는 signals를 거치지 않으므로 캐시 무효화와 버전 증가를 직접 처리
+        changed_ids = list(calendar_admins.values_list("calendar_id", flat=True))
+        updated = calendar_admins.filter(calendar_id__in=changed_ids).update(
+            is_active=is_active
+        )
+        if updated:
+            VisibleCalendarService.invalidate(request.user.pk)
+            Calendar.bump_versions(changed_ids)
+
+        return Response(
+            {
+                "message": "캘린더 표시 여부가 성공적으로 업데이트되었습니다.",
+                "updated_count": updated,
+            },
+            status=status.HTTP_200_OK,
+        )
 
 
 class AdminCalendarsAPIView(ListAPIView):
@@ -534,30 +566,37 @@ class AdminCalendarsAPIView(ListAPIView):
         },
     )
     def get(self, request, *args, **kwargs):
-        calendars = Calendar.objects.filter(
-            Q(creator=request.user) | Q(admins=request.user)
-        ).distinct()
-
-        data = []
-        user_key = getattr(request.user, "id", request.user.username)
-        for calendar in calendars:
-            # 메모리 내 상태에서 is_active 값 가져오기
-            is_active = calendar_admin_active_status.get(
-                (user_key, calendar.calendar_id), True
-            )
-
-            calendar_data = {
-                "calendar_id": calendar.calendar_id,
-                "name": calendar.name,
-                "description": calendar.description,
-                "is_public": calendar.is_public,
-                "color": calendar.color,
-                "invitation_code": calendar.invitation_code,
-                "creator_id": calendar.creator_id,
-                "admins": list(calendar.admins.values_list("nickname", flat=True)),
-                "is_active": is_active,
+        # 캘린더 정보는 요약 캐시, 표시 여부는 요청 사용자의 CalendarAdmin.is_active
+        calendar_ids = VisibleCalendarService.get_calendar_ids(
+            request.user, roles=ADMIN_ROLES
+        )
+        calendars = sorted(
+            CalendarSummaryCache.get_many(calendar_ids).values(),
+            key=lambda calendar: calendar["created_at"],
+            reverse=True,
+        )
+        hidden_calendar_ids = set(
+            CalendarAdmin.objects.filter(
+                user=request.user, is_active=False
+            ).values_list("calendar_id", flat=True)
+        )
+        loader = BatchLoader.for_request(request)
+        loader.load_admin_nicknames([calendar["calendar_id"] for calendar in calendars])
+
+        data = [
+            {
+                "calendar_id": calendar["calendar_id"],
+                "name": calendar["name"],
+                "description": calendar["description"],
+                "is_public": calendar["is_public"],
+                "color": calendar["color"],
+                "invitation_code": calendar["invitation_code"],
+                "creator_id": calendar["creator_id"],
+                "admins": loader.get_admin_nicknames(calendar["calendar_id"]),
+                "is_active": calendar["calendar_id"] not in hidden_calendar_ids,
             }
-            data.append(calendar_data)
+            for calendar in calendars
+        ]
 
         return Response(data, status=200)
 
@@ -569,6 +608,7 @@ class CalendarMembersAPIView(ListAPIView):
 
     serializer_class = SubscriptionSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = SubscriptionKeysetPagination
     # permission_classes = [AllowAny]  # 인증 없이 접근 가능
 
     @extend_schema(
@@ -627,38 +667,16 @@ class AdminInvitationView(APIView):
         serializer = AdminInvitationSerializer(
             data=request.data, context={"request": request}
         )
+        # 초대 코드 확인 + 이미 관리자(생성자 포함)인지 확인은 serializer에서 처리
         serializer.is_valid(raise_exception=True)
-        invitation_code = serializer.validated_data["invitation_code"]
-
-        try:
-            # 초대 코드에 해당하는 캘린더 찾기
-            calendar = Calendar.objects.get(invitation_code=invitation_code)
+        calendar = serializer.calendar
 
-            # 이미 관리자인지 확인
-            if request.user == calendar.creator:
-                return Response(
-                    {"error": "캘린더 생성자는 이미 관리자입니다."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+        # 관리자로 추가
+        calendar.admins.add(request.user)
 
-            if request.user in calendar.admins.all():
-                return Response(
-                    {"error": "이미 관리자로 추가된 캘린더입니다."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            # 관리자로 추가
-            calendar.admins.add(request.user)
-
-            return Response(
-                CalendarDetailSerializer(calendar).data, status=status.HTTP_200_OK
-            )
-
-        except Calendar.DoesNotExist:
-            return Response(
-                {"error": "유효하지 않은 초대 코드입니다."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        return Response(
+            CalendarDetailSerializer(calendar).data, status=status.HTTP_200_OK
+        )
 
 
 class ActiveSubscriptionsAPIView(ListAPIView):
@@ -848,3 +866,342 @@ class UpdateSubscriptionActiveView(APIView):
                 {"error": "해당 구독 정보를 찾을 수 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+
+
+class CalendarExportAPIView(APIView):
+    """
+    캘린더 iCalendar(.ics) 내보내기
+    - 이벤트를 chunk 단위로 읽어 바로 전송하므로 이벤트 수와 관계없이 메모리 사용량 일정
+    - 캘린더 버전이 그대로면 304 반환
+    """
+
+    permission_classes = [IsAuthenticated]
+    chunk_size = 500
+
+    @extend_schema(
+        summary="캘린더 iCalendar 내보내기",
+        description=(
+            "캘린더의 이벤트를 iCalendar(.ics) 형식으로 내보냅니다. "
+            "생성자/관리자는 모든 이벤트를, 그 외 사용자는 공개 캘린더의 공개 이벤트만 받습니다. "
+            "If-None-Match 헤더가 현재 ETag와 같으면 304를 반환합니다."
+        ),
+        responses={
+            (200, "text/calendar"): OpenApiTypes.STR,
+            304: None,
+            404: {"type": "object", "properties": {"error": {"type": "string"}}},
+        },
+    )
+    def get(self, request, pk):
+        calendar = Calendar.objects.filter(calendar_id=pk).first()
+        role = CalendarRoleResolver.for_request(request).get_role(pk)
+        include_private = role in ADMIN_ROLES
+        if calendar is None or not (include_private or calendar.is_public):
+            return Response(
+                {"error": "캘린더를 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        etag = CalendarVersionService.make_etag(
+            calendar.calendar_id, calendar.version, include_private
+        )
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if CalendarVersionService.is_not_modified(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        events = Event.objects.filter(calendar_id=calendar.calendar_id)
+        if not include_private:
+            events = events.filter(is_public=True)
+        events = (
+            events.order_by("start_time", "event_id")
+            .values(*EVENT_FIELDS)
+            .iterator(chunk_size=self.chunk_size)
+        )
+
+        response = StreamingHttpResponse(
+            iter_calendar(calendar, events), content_type="text/calendar; charset=utf-8"
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="calendar-{calendar.calendar_id}.ics"'
+        )
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+
+class CalendarFreeBusyAPIView(APIView):
+    """
+    캘린더 관리자들의 바쁜 시간 / 빈 시간 조회
+    - 관리자(생성자 포함)들이 관리하는 캘린더 중 요청자가 볼 수 있는 캘린더의
+      이벤트를 병합해 계산 (구독 캘린더는 공개 이벤트만)
+    """
+
+    permission_classes = [IsAuthenticated]
+    default_duration = 30
+
+    @extend_schema(
+        summary="캘린더 관리자 빈 시간 조회",
+        description=(
+            "캘린더 관리자(생성자 포함)들이 관리하는 캘린더 중 요청자가 볼 수 있는 "
+            "캘린더의 이벤트(구독 캘린더는 공개 이벤트만)를 기준으로 "
+            "조회 기간 안의 바쁜 구간과, duration(분) 이상 비어 있는 구간을 반환합니다. "
+            "이벤트 상세 정보는 포함하지 않으며 캘린더 관리자만 조회할 수 있습니다."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="start",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description="조회 시작 시점 (기본값: 이번 달 1일)",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="end",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description="조회 종료 시점 (기본값: start + 최대 조회 기간)",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="duration",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="빈 구간 최소 길이 (분, 기본값: 30)",
+                required=False,
+            ),
+        ],
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "start": {"type": "string", "format": "date-time"},
+                    "end": {"type": "string", "format": "date-time"},
+                    "duration": {"type": "integer"},
+                    "busy": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "start": {"type": "string", "format": "date-time"},
+                                "end": {"type": "string", "format": "date-time"},
+                            },
+                        },
+                    },
+                    "free": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "start": {"type": "string", "format": "date-time"},
+                                "end": {"type": "string", "format": "date-time"},
+                            },
+                        },
+                    },
+                },
+            },
+            400: {"description": "조회 기간 또는 duration이 올바르지 않습니다."},
+            404: {"description": "캘린더를 찾을 수 없습니다."},
+        },
+    )
+    def get(self, request, pk):
+        calendar = Calendar.objects.filter(calendar_id=pk).first()
+        resolver = CalendarRoleResolver.for_request(request)
+        if calendar is None or not resolver.is_admin(pk):
+            return Response(
+                {"error": "캘린더를 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        try:
+            start, end = EventService.get_window(request.query_params)
+        except InvalidEventWindowException as e:
+            return Response(
+                {"error": e.error, "message": e.message},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            duration = int(request.query_params.get("duration", self.default_duration))
+        except ValueError:
+            duration = 0
+        if duration <= 0:
+            return Response(
+                {
+                    "error": "잘못된 요청",
+                    "message": "duration은 1 이상의 정수(분)여야 합니다.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        busy, free = get_free_busy(
+            calendar, resolver.roles, start, end, timedelta(minutes=duration)
+        )
+        localtime = timezone.localtime
+        return Response(
+            {
+                "start": localtime(start),
+                "end": localtime(end),
+                "duration": duration,
+                "busy": [{"start": localtime(s), "end": localtime(e)} for s, e in busy],
+                "free": [{"start": localtime(s), "end": localtime(e)} for s, e in free],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class CalendarConflictsAPIView(APIView):
+    """
+    캘린더 이벤트 시간 겹침 미리보기
+    - 이벤트 생성/수정 전에 [start, end)와 겹치는 이벤트 확인
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="캘린더 이벤트 시간 겹침 조회",
+        description=(
+            "캘린더에서 start~end와 시간이 겹치는 이벤트를 시작 시간 순으로 반환합니다. "
+            "반복 일정은 겹치는 발생만 포함하며, exclude로 수정 중인 이벤트를 제외할 수 있습니다. "
+            "캘린더 관리자만 조회할 수 있습니다."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="start",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description="확인할 시작 시점",
+                required=True,
+            ),
+            OpenApiParameter(
+                name="end",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description="확인할 종료 시점",
+                required=True,
+            ),
+            OpenApiParameter(
+                name="exclude",
+                type=OpenApiTypes.UUID,
+                location=OpenApiParameter.QUERY,
+                description="제외할 이벤트 ID (수정 중인 이벤트)",
+                required=False,
+            ),
+        ],
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "conflicts": {"type": "array", "items": {"type": "object"}}
+                },
+            },
+            400: {"description": "조회 기간 또는 이벤트 ID가 올바르지 않습니다."},
+            404: {"description": "캘린더를 찾을 수 없습니다."},
+        },
+    )
+    def get(self, request, pk):
+        role = CalendarRoleResolver.for_request(request).get_role(pk)
+        if (
+            role not in ADMIN_ROLES
+            or not Calendar.objects.filter(calendar_id=pk).exists()
+        ):
+            return Response(
+                {"error": "캘린더를 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        try:
+            start = EventService.parse_datetime_param(request.query_params.get("start"))
+            end = EventService.parse_datetime_param(request.query_params.get("end"))
+            if start is None or end is None:
+                raise InvalidEventWindowException("start와 end를 모두 입력해주세요.")
+            if end <= start:
+                raise InvalidEventWindowException(
+                    "종료 시점은 시작 시점 이후여야 합니다."
+                )
+        except InvalidEventWindowException as e:
+            return Response(
+                {"error": e.error, "message": e.message},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        exclude = request.query_params.get("exclude")
+        if exclude:
+            try:
+                exclude = uuid.UUID(exclude)
+            except ValueError:
+                return Response(
+                    {
+                        "error": "잘못된 요청",
+                        "message": "exclude가 올바른 이벤트 ID가 아닙니다.",
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        conflicts = EventConflictService.get_conflicts(
+            pk, start, end, exclude_event_id=exclude or None
+        )
+        return Response(
+            {
+                "conflicts": EventSerializer(
+                    conflicts, many=True, context={"request": request}
+                ).data
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class CalendarCloneAPIView(APIView):
+    """
+    캘린더 복제
+    - 캘린더 설정과 모든 이벤트를 새 캘린더로 복사 (요청 사용자가 생성자)
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="캘린더 복제",
+        description=(
+            "캘린더를 모든 이벤트와 함께 복제합니다. 요청한 사용자가 새 캘린더의 "
+            "생성자이자 이벤트 관리자가 되며, 관리자/구독/댓글/좋아요는 복사하지 않습니다. "
+            "캘린더 관리자만 복제할 수 있습니다."
+        ),
+        request={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "새 캘린더 이름 (기본값: 원본 이름)",
+                },
+            },
+        },
+        responses={
+            201: CalendarDetailSerializer,
+            400: {"description": "캘린더 이름이 올바르지 않습니다."},
+            404: {"description": "캘린더를 찾을 수 없습니다."},
+        },
+    )
+    def post(self, request, pk):
+        calendar = Calendar.objects.filter(calendar_id=pk).first()
+        role = CalendarRoleResolver.for_request(request).get_role(pk)
+        if calendar is None or role not in ADMIN_ROLES:
+            return Response(
+                {"error": "캘린더를 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        name = request.data.get("name")
+        max_length = Calendar._meta.get_field("name").max_length
+        if name is not None and (
+            not isinstance(name, str) or not name.strip() or len(name) > max_length
+        ):
+            return Response(
+                {
+                    "error": "잘못된 요청",
+                    "message": f"캘린더 이름은 1~{max_length}자여야 합니다.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        clone, event_count = clone_calendar(calendar, request.user, name)
+        data = CalendarDetailSerializer(clone, context={"request": request}).data
+        data["event_count"] = event_count
+        return Response(data, status=status.HTTP_201_CREATED)
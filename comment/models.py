@@ -11,3 +11,14 @@ class Comment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     admin_id = models.ForeignKey(User, on_delete=models.CASCADE)
+    # 좋아요 수 (좋아요/취소 시 F()로 증감, 분산 카운터 값은 별도 합산)
+    like_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            # 이벤트별 댓글 목록 keyset 페이지네이션 (created_at, comment_id)용 인덱스
+            models.Index(
+                fields=["event_id", "created_at", "comment_id"],
+                name="comment_event_created_idx",
+            ),
+        ]
@@ -29,6 +29,19 @@ class CommentSerializer(CommentBaseSerializer):
         ]
 
 
+class CommentListSerializer(CommentSerializer):
+    """
+    댓글 목록용 시리얼라이저
+    - like_count(분산 카운터 포함), liked_by_me는 목록 쿼리에서 annotate한 값 사용
+    """
+
+    like_count = serializers.IntegerField(source="total_like_count", read_only=True)
+    liked_by_me = serializers.BooleanField(read_only=True)
+
+    class Meta(CommentSerializer.Meta):
+        fields = [*CommentSerializer.Meta.fields, "like_count", "liked_by_me"]
+
+
 class CommentCreateSerializer(CommentBaseSerializer):
     """댓글 생성 요청용 시리얼라이저"""
 
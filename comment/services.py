@@ -1,12 +1,14 @@
 import uuid
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Exists, OuterRef
 from rest_framework import status
 from rest_framework.response import Response
 
-from calendars.models import Calendar
+from calendars.services import CalendarRoleResolver
 from comment.models import Comment
 from comment.serializers import CommentCreateSerializer, CommentSerializer
+from comment_like.models import CommentLike, CommentLikeCounter
 from event.models import Event
 
 
@@ -58,25 +60,15 @@ class CommentService:
             raise ValidationError("유효한 UUID 형식이 아닙니다.")
 
     @staticmethod
-    def check_comment_permission(user, event_id):
+    def check_comment_permission(request, event_id):
         """
-        댓글 작성 권한 확인
+        댓글 작성 권한 확인 후 이벤트 반환
         - 캘린더의 creator나 admin만 댓글 작성 가능
         """
-        try:
-            # UUID 추출 및 변환
-            event_uuid = CommentService.extract_uuid(event_id)
-            event = Event.objects.get(event_id=event_uuid)
-            calendar = event.calendar_id
-
-            if user == calendar.creator or user in calendar.admins.all():
-                return True
+        event = CommentService.get_event(event_id)
+        if not CalendarRoleResolver.for_request(request).is_admin(event.calendar_id_id):
             raise CommentPermissionDeniedException()
-
-        except Event.DoesNotExist:
-            raise EventNotFoundException()
-        except Calendar.DoesNotExist:
-            raise CalendarNotFoundException()
+        return event
 
     @staticmethod
     def get_event(event_id):
@@ -99,13 +91,21 @@ class CommentService:
     def get_comments(cls, request, event_id):
         try:
             # 권한 확인
-            cls.check_comment_permission(request.user, event_id)
-
-            # UUID 추출 및 변환
-            event_uuid = cls.extract_uuid(event_id)
-
-            # 해당 이벤트의 댓글 조회 (event_id로 필터링)
-            comments = Comment.objects.filter(event_id=event_uuid)
+            event = cls.check_comment_permission(request, event_id)
+
+            # 해당 이벤트의 댓글 조회 (작성자, 좋아요 수, 내 좋아요 여부를 한 쿼리로)
+            comments = (
+                Comment.objects.filter(event_id=event.event_id)
+                .select_related("admin_id")
+                .annotate(
+                    total_like_count=CommentLikeCounter.total_count(),
+                    liked_by_me=Exists(
+                        CommentLike.objects.filter(
+                            comment_id=OuterRef("pk"), user_id=request.user.pk
+                        )
+                    ),
+                )
+            )
             return comments, None
 
         except CommentPermissionDeniedException as e:
@@ -114,11 +114,8 @@ class CommentService:
     @classmethod
     def create_comment(cls, request, event_id):
         """댓글 생성"""
-        # 권한 확인
-        cls.check_comment_permission(request.user, event_id)
-
-        # 이벤트 조회
-        event = cls.get_event(event_id)
+        # 권한 확인 및 이벤트 조회
+        event = cls.check_comment_permission(request, event_id)
 
         serializer = CommentCreateSerializer(data=request.data)
         if serializer.is_valid():
@@ -4,7 +4,11 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from comment.serializers import CommentCreateSerializer, CommentSerializer
+from comment.serializers import (
+    CommentCreateSerializer,
+    CommentListSerializer,
+    CommentSerializer,
+)
 from comment.services import (
     CalendarNotFoundException,
     CommentNotFoundException,
@@ -12,17 +16,22 @@ from comment.services import (
     CommentService,
     EventNotFoundException,
 )
+from config.pagination import CommentKeysetPagination
 
 
 class CommentListCreateView(APIView):
-    @extend_schema(tags=["댓글"], responses={200: CommentSerializer(many=True)})
+    pagination_class = CommentKeysetPagination
+
+    @extend_schema(tags=["댓글"], responses={200: CommentListSerializer(many=True)})
     def get(self, request, event_id):
         try:
             comments, error = CommentService.get_comments(request, event_id)
             if error:
                 return Response(error, status=status.HTTP_403_FORBIDDEN)
-            serializer = CommentSerializer(comments, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            paginator = self.pagination_class()
+            page = paginator.paginate_queryset(comments, request, view=self)
+            serializer = CommentListSerializer(page, many=True)
+            return paginator.get_paginated_response(serializer.data)
         except (
             EventNotFoundException,
             CalendarNotFoundException,
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CommentLikeConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "comment_like"
+
+    def ready(self):
+        import comment_like.signals  # noqa: F401
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from comment_like.services import CommentLikeService
+
+
+class Command(BaseCommand):
+    help = (
+        "댓글 좋아요 분산 카운터 값을 Comment.like_count로 합칩니다. "
+        "--rebuild를 지정하면 좋아요 행 수로 like_count를 다시 계산합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="CommentLike 행 수로 모든 댓글의 like_count를 다시 계산",
+        )
+
+    def handle(self, *args, **options):
+        if options["rebuild"]:
+            updated = CommentLikeService.rebuild_counts()
+            message = f"{updated}개 댓글의 좋아요 수를 다시 계산했습니다."
+        else:
+            updated = CommentLikeService.flush_counters()
+            message = f"{updated}개 댓글의 분산 카운터를 합쳤습니다."
+        self.stdout.write(self.style.SUCCESS(message))
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 
 from comment.models import Comment
 from user.models import User
@@ -9,3 +11,48 @@ class CommentLike(models.Model):
     comment_id = models.ForeignKey(Comment, on_delete=models.CASCADE)
     user_id = models.ForeignKey(User, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            # 같은 사용자는 한 댓글에 한 번만 좋아요 (INSERT ... ON CONFLICT 대상)
+            models.UniqueConstraint(
+                fields=["comment_id", "user_id"], name="comment_like_unique"
+            ),
+        ]
+
+
+class CommentLikeCounter(models.Model):
+    """
+    좋아요가 많은 댓글의 분산 카운터
+    - 동시 좋아요가 Comment 한 행의 잠금을 기다리지 않도록 여러 shard 행에 나눠 증감
+    - 댓글의 좋아요 수 = Comment.like_count + 모든 shard의 count 합
+    - flush_comment_like_counters 명령이 shard 값을 Comment.like_count로 합침
+    """
+
+    counter_id = models.BigAutoField(primary_key=True)
+    comment_id = models.ForeignKey(
+        Comment, on_delete=models.CASCADE, related_name="like_counters"
+    )
+    shard = models.PositiveSmallIntegerField()
+    count = models.IntegerField(default=0)  # 취소가 다른 shard에 기록되면 음수 가능
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["comment_id", "shard"], name="comment_like_counter_unique"
+            ),
+        ]
+
+    @staticmethod
+    def total_count():
+        """댓글의 전체 좋아요 수 식 (Comment 쿼리에 annotate해서 사용)"""
+        return F("like_count") + Coalesce(
+            Subquery(
+                CommentLikeCounter.objects.filter(comment_id=OuterRef("pk"))
+                .order_by()
+                .values("comment_id")
+                .annotate(total=Sum("count"))
+                .values("total")
+            ),
+            0,
+        )
@@ -0,0 +1,193 @@
+import random
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+from comment.models import Comment
+from comment.services import CommentNotFoundException, CommentService
+from comment_like.models import CommentLike, CommentLikeCounter
+
+
+def quote_columns(model, *names):
+    return [
+        connection.ops.quote_name(model._meta.get_field(name).column) for name in names
+    ]
+
+
+class CommentLikeService:
+    """
+    댓글 좋아요 / 좋아요 취소
+    - 좋아요 행은 INSERT ... ON CONFLICT DO NOTHING으로 추가해 중복 요청에도 한 번만 반영
+    - 실제로 추가/삭제된 경우에만 좋아요 수를 F()로 증감
+    - 사용자 삭제로 지워지는 좋아요는 삭제 전에 댓글별로 묶어 감소 (signals)
+    - 좋아요가 많은 댓글은 Comment 행 대신 분산 카운터 shard 중 하나에 증감
+    """
+
+    @staticmethod
+    def get_comment(request, event_id, comment_id):
+        """권한 확인 후 이벤트에 속한 댓글 반환"""
+        event = CommentService.check_comment_permission(request, event_id)
+        try:
+            return Comment.objects.only("comment_id", "like_count").get(
+                comment_id=comment_id, event_id=event.event_id
+            )
+        except Comment.DoesNotExist:
+            raise CommentNotFoundException()
+
+    @staticmethod
+    def insert_like(comment_id, user_id):
+        """좋아요 행 추가 (이미 있으면 무시), 새로 추가했으면 True"""
+        table = connection.ops.quote_name(CommentLike._meta.db_table)
+        comment_column, user_column, created_column = quote_columns(
+            CommentLike, "comment_id", "user_id", "created_at"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} "
+                f"({comment_column}, {user_column}, {created_column}) "
+                f"VALUES (%s, %s, now()) "
+                f"ON CONFLICT ({comment_column}, {user_column}) DO NOTHING",
+                [comment_id, user_id],
+            )
+            return cursor.rowcount == 1
+
+    @staticmethod
+    def add_to_count(comment, delta):
+        """
+        좋아요 수 증감
+        - 좋아요 수가 COMMENT_LIKE_SHARD_THRESHOLD 이상이면 임의의 shard 행에 upsert
+        - 그 외에는 Comment.like_count를 F()로 증감
+        """
+        shards = settings.COMMENT_LIKE_COUNTER_SHARDS
+        if shards > 1 and comment.like_count >= settings.COMMENT_LIKE_SHARD_THRESHOLD:
+            table = connection.ops.quote_name(CommentLikeCounter._meta.db_table)
+            comment_column, shard_column, count_column = quote_columns(
+                CommentLikeCounter, "comment_id", "shard", "count"
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"INSERT INTO {table} "
+                    f"({comment_column}, {shard_column}, {count_column}) "
+                    f"VALUES (%s, %s, %s) "
+                    f"ON CONFLICT ({comment_column}, {shard_column}) DO UPDATE "
+                    f"SET {count_column} = {table}.{count_column} + %s",
+                    [comment.pk, random.randrange(shards), delta, delta],
+                )
+            return
+
+        like_count = F("like_count") + delta
+        if delta < 0:
+            like_count = Greatest(like_count, 0)
+        Comment.objects.filter(pk=comment.pk).update(like_count=like_count)
+
+    @classmethod
+    def remove_user_likes(cls, user_id):
+        """
+        사용자가 누른 좋아요만큼 댓글별 좋아요 수 감소 (사용자 삭제 전 호출)
+        - 댓글마다 한 번씩 감소
+        - 사용자가 작성한 댓글은 함께 삭제되므로 제외
+        """
+        rows = (
+            CommentLike.objects.filter(user_id=user_id)
+            .exclude(comment_id__admin_id=user_id)
+            .order_by()
+            .values("comment_id", "comment_id__like_count")
+            .annotate(total=Count("pk"))
+        )
+        for row in rows:
+            comment = Comment(
+                comment_id=row["comment_id"], like_count=row["comment_id__like_count"]
+            )
+            cls.add_to_count(comment, -row["total"])
+
+    @staticmethod
+    def get_like_count(comment_id):
+        return (
+            Comment.objects.filter(pk=comment_id)
+            .annotate(total_like_count=CommentLikeCounter.total_count())
+            .values_list("total_like_count", flat=True)
+            .get()
+        )
+
+    @classmethod
+    def like(cls, request, event_id, comment_id):
+        """좋아요 (이미 좋아요한 댓글이면 변경 없음), 반환: 전체 좋아요 수"""
+        comment = cls.get_comment(request, event_id, comment_id)
+        if cls.insert_like(comment.pk, request.user.pk):
+            cls.add_to_count(comment, 1)
+        return cls.get_like_count(comment.pk)
+
+    @classmethod
+    def unlike(cls, request, event_id, comment_id):
+        """좋아요 취소 (좋아요하지 않은 댓글이면 변경 없음), 반환: 전체 좋아요 수"""
+        comment = cls.get_comment(request, event_id, comment_id)
+        deleted, _ = CommentLike.objects.filter(
+            comment_id=comment.pk, user_id=request.user.pk
+        ).delete()
+        if deleted:
+            cls.add_to_count(comment, -1)
+        return cls.get_like_count(comment.pk)
+
+    @staticmethod
+    def flush_counters():
+        """
+        분산 카운터 값을 Comment.like_count로 합치고 shard 행 삭제
+        - DELETE ... RETURNING과 UPDATE를 한 문장으로 실행해 그 사이의 증감이 유실되지 않음
+        - 반환: 갱신한 댓글 수
+        """
+        comment_table = connection.ops.quote_name(Comment._meta.db_table)
+        counter_table = connection.ops.quote_name(CommentLikeCounter._meta.db_table)
+        (pk_column,) = quote_columns(Comment, "comment_id")
+        (like_count_column,) = quote_columns(Comment, "like_count")
+        comment_column, count_column = quote_columns(
+            CommentLikeCounter, "comment_id", "count"
+        )
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"""
+                WITH flushed AS (
+                    DELETE FROM {counter_table}
+                    RETURNING {comment_column} AS comment_id, {count_column} AS count
+                ), totals AS (
+                    SELECT comment_id, SUM(count) AS total
+                    FROM flushed
+                    GROUP BY comment_id
+                )
+                UPDATE {comment_table}
+                SET {like_count_column} =
+                    GREATEST({like_count_column} + totals.total, 0)
+                FROM totals
+                WHERE {comment_table}.{pk_column} = totals.comment_id
+                """)
+            return cursor.rowcount
+
+    @staticmethod
+    def rebuild_counts():
+        """
+        CommentLike 행 수로 모든 댓글의 like_count를 다시 계산하고 shard 행 삭제
+        - like_count 추가 이전의 좋아요 반영, 불일치 복구용
+        - 반환: 갱신한 댓글 수
+        """
+        comment_table = connection.ops.quote_name(Comment._meta.db_table)
+        like_table = connection.ops.quote_name(CommentLike._meta.db_table)
+        (pk_column,) = quote_columns(Comment, "comment_id")
+        (like_count_column,) = quote_columns(Comment, "like_count")
+        (comment_column,) = quote_columns(CommentLike, "comment_id")
+        with transaction.atomic(), connection.cursor() as cursor:
+            # 진행 중인 좋아요/취소와 섞이지 않도록 잠금
+            cursor.execute(f"LOCK TABLE {like_table} IN SHARE ROW EXCLUSIVE MODE")
+            CommentLikeCounter.objects.all().delete()
+            cursor.execute(f"""
+                UPDATE {comment_table}
+                SET {like_count_column} = COALESCE(likes.total, 0)
+                FROM {comment_table} AS comments
+                LEFT JOIN (
+                    SELECT {comment_column} AS comment_id, COUNT(*) AS total
+                    FROM {like_table} GROUP BY {comment_column}
+                ) AS likes ON likes.comment_id = comments.{pk_column}
+                WHERE {comment_table}.{pk_column} = comments.{pk_column}
+                  AND {comment_table}.{like_count_column}
+                      IS DISTINCT FROM COALESCE(likes.total, 0)
+                """)
+            return cursor.rowcount
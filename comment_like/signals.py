@@ -0,0 +1,16 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from comment_like.services import CommentLikeService
+from user.models import User
+
+
+@receiver(pre_delete, sender=User)
+def remove_user_likes(sender, instance, **kwargs):
+    """
+    사용자 삭제 시 CASCADE로 지워질 좋아요만큼 댓글 좋아요 수 감소
+    - CommentLike에는 receiver를 두지 않아 댓글/이벤트/캘린더/사용자 삭제 시
+      좋아요 행이 한 번의 DELETE로 지워지도록 함
+    - 좋아요 취소는 CommentLikeService.unlike에서 직접 감소
+    """
+    CommentLikeService.remove_user_likes(instance.pk)
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from comment_like.views import CommentLikeView
+
+app_name = "comment_like"
+
+urlpatterns = [
+    path(
+        "comments/<int:comment_id>/like/",
+        CommentLikeView.as_view(),
+        name="comment-like",
+    ),
+]
@@ -1,3 +1,60 @@
-from django.shortcuts import render
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from comment.services import (
+    CommentNotFoundException,
+    CommentPermissionDeniedException,
+    EventNotFoundException,
+)
+from comment_like.services import CommentLikeService
+
+LIKE_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "comment_id": {"type": "integer"},
+        "liked": {"type": "boolean"},
+        "like_count": {"type": "integer"},
+    },
+}
+
+
+class CommentLikeView(APIView):
+    """
+    댓글 좋아요 / 좋아요 취소
+    - 같은 요청을 반복해도 결과가 같음 (이미 좋아요/취소한 상태면 변경 없음)
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def handle(self, method, request, event_id, comment_id, liked):
+        try:
+            like_count = method(request, event_id, comment_id)
+        except CommentPermissionDeniedException as e:
+            return Response(
+                {"error": e.error, "message": e.message},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        except (EventNotFoundException, CommentNotFoundException) as e:
+            return Response(
+                {"error": e.error, "message": e.message},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(
+            {"comment_id": comment_id, "liked": liked, "like_count": like_count},
+            status=status.HTTP_200_OK,
+        )
+
+    @extend_schema(tags=["댓글"], request=None, responses={200: LIKE_RESPONSE_SCHEMA})
+    def post(self, request, event_id, comment_id):
+        return self.handle(
+            CommentLikeService.like, request, event_id, comment_id, liked=True
+        )
+
+    @extend_schema(tags=["댓글"], responses={200: LIKE_RESPONSE_SCHEMA})
+    def delete(self, request, event_id, comment_id):
+        return self.handle(
+            CommentLikeService.unlike, request, event_id, comment_id, liked=False
+        )
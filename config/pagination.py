@@ -0,0 +1,177 @@
+import base64
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    복합 키 기반 커서(keyset) 페이지네이션
+    - ordering에 지정한 필드 값 (예: (start_time, event_id))을 커서로 사용
+    - OFFSET 없이 "마지막 항목 이후" 조건으로 조회하므로 테이블이 커져도 비용 일정
+    - 마지막 필드는 반드시 유일해야 함 (보통 기본 키)
+    """
+
+    ordering = ("pk",)
+    page_size = 50
+    max_page_size = 200
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request, queryset)
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position))
+
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        results = results[: self.page_size]
+        self.next_position = (
+            self.get_position(results[-1]) if self.has_next and results else None
+        )
+        return results
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_position(self, instance):
+        """항목의 정렬 키 값 튜플"""
+        return [getattr(instance, field.lstrip("-")) for field in self.ordering]
+
+    def get_position_filter(self, position):
+        """
+        (a, b) > (x, y) 형태의 조건을 ORM Q로 변환
+        - a > x OR (a = x AND b > y)
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def encode_cursor(self, position):
+        payload = json.dumps(
+            [value if isinstance(value, int) else str(value) for value in position],
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def get_ordering_fields(self, queryset):
+        """ordering 필드별 모델 필드 (annotate로 추가한 값이면 output_field)"""
+        fields = []
+        for field in self.ordering:
+            name = field.lstrip("-")
+            try:
+                fields.append(queryset.model._meta.get_field(name))
+            except FieldDoesNotExist:
+                fields.append(queryset.query.annotations[name].output_field)
+        return fields
+
+    def decode_cursor(self, request, queryset=None):
+        """
+        커서를 정렬 키 값 목록으로 변환
+        - queryset을 지정하면 각 값을 정렬 필드 타입으로 변환해 검증
+          (형식이 맞지 않는 값이 조회 조건에서 500 오류를 내지 않도록 404로 처리)
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padding = "=" * (-len(encoded) % 4)
+            position = json.loads(base64.urlsafe_b64decode(encoded + padding))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        if queryset is None:
+            return position
+
+        try:
+            position = [
+                field.to_python(value)
+                for field, value in zip(self.get_ordering_fields(queryset), position)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if None in position:
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "다음 페이지 커서",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"페이지 크기 (최대 {self.max_page_size})",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class EventKeysetPagination(KeysetPagination):
+    ordering = ("start_time", "event_id")
+
+
+class EventSearchKeysetPagination(KeysetPagination):
+    ordering = ("-rank", "event_id")
+    page_size = 20
+    max_page_size = 50
+
+
+class CommentKeysetPagination(KeysetPagination):
+    ordering = ("created_at", "comment_id")
+
+
+class SubscriptionKeysetPagination(KeysetPagination):
+    ordering = ("created_at", "id")
+
+
+class FavoriteEventKeysetPagination(KeysetPagination):
+    ordering = ("favorite_event_id",)
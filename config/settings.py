@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 import environ
@@ -46,6 +47,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # rest_framework
     "rest_framework",
     "rest_framework.authtoken",
@@ -63,6 +65,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "config.middleware.CompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -74,11 +77,29 @@ MIDDLEWARE = [
 
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_RENDERER_CLASSES": [
+        "config.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "config.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework_simplejwt.authentication.JWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
 }
+# msgpack이 설치된 경우에만 Accept: application/msgpack 응답/요청 지원
+if find_spec("msgpack"):
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append(
+        "config.renderers.MessagePackRenderer"
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"].append(
+        "config.renderers.MessagePackParser"
+    )
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
     "https://localhost:5173",
@@ -124,6 +145,12 @@ DATABASES = {
 }
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# 여러 워커가 캐시를 공유해야 하는 경우 CACHE_URL 지정 (예: dbcache://evento_cache)
+
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -169,3 +196,48 @@ AUTH_USER_MODEL = "user.User"
 SIMPLE_JWT = {
     "USER_ID_FIELD": "user_id",
 }
+
+# 이벤트 목록 조회 시 허용하는 최대 기간 (일)
+EVENT_WINDOW_MAX_DAYS = 92
+
+# 사용자별 캘린더 목록 캐시 유지 시간 (초)
+VISIBLE_CALENDARS_CACHE_TTL = 300
+
+# 캘린더 요약(이름/색상/공개 여부 등) 캐시 유지 시간 (초)
+CALENDAR_SUMMARY_CACHE_TTL = 3600
+
+# 이벤트 동기화: 동시 트랜잭션 누락 방지용 중첩 구간(초), 삭제 기록 보관 기간(일)
+EVENT_SYNC_OVERLAP_SECONDS = 30
+EVENT_TOMBSTONE_RETENTION_DAYS = 30
+# 이벤트 동기화 한 페이지의 최대 이벤트 수
+EVENT_SYNC_PAGE_SIZE = 500
+
+# 캘린더 검색: 최대 결과 수, 검색어별 결과 캐시 유지 시간(초)
+CALENDAR_SEARCH_MAX_RESULTS = 50
+CALENDAR_SEARCH_CACHE_TTL = 30
+
+# 이벤트 일괄 업로드: bulk_create 한 번에 쓰는 행 수,
+# 한 번에 저장할 행이 이 수 이상이면 bulk_create 대신 COPY로 저장
+EVENT_IMPORT_BATCH_SIZE = 1000
+EVENT_IMPORT_COPY_MIN_ROWS = 1000
+
+# 이벤트 업로드 파일을 한 번에 읽고 검증하는 행 수 (메모리 사용량이 이 값에 비례)
+EVENT_IMPORT_CHUNK_SIZE = 5000
+
+# 이벤트 업로드 작업: 이 크기(바이트)를 넘는 파일은 작업으로 저장해 워커가 처리,
+# 저장할 최대 행 오류 수, 이 시간(초) 동안 갱신이 없으면 멈춘 작업으로 간주
+EVENT_IMPORT_SYNC_MAX_SIZE = 1024 * 1024
+EVENT_IMPORT_JOB_MAX_ERRORS = 1000
+EVENT_IMPORT_JOB_STALE_SECONDS = 600
+
+# 이벤트 일괄 작업 API: 한 요청의 모든 작업에 포함할 수 있는 최대 이벤트 수
+EVENT_BULK_MAX_ITEMS = 5000
+
+# 댓글 좋아요: 좋아요 수가 이 값 이상인 댓글은 분산 카운터(shard 행)에 증감,
+# 분산 카운터 shard 수 (1 이하이면 분산 카운터를 사용하지 않음)
+COMMENT_LIKE_SHARD_THRESHOLD = 1000
+COMMENT_LIKE_COUNTER_SHARDS = 16
+
+# 응답 압축: 이 크기(바이트) 이상인 응답만 압축, brotli 품질(0~11)
+RESPONSE_COMPRESSION_MIN_SIZE = 1024
+RESPONSE_BROTLI_QUALITY = 5
@@ -20,6 +20,8 @@ urlpatterns = [
     path("api/events/", include("event.urls")),
     # 댓글 관련 (특정 이벤트에 종속)
     path("api/events/<uuid:event_id>/", include("comment.urls")),
+    # 댓글 좋아요 관련
+    path("api/events/<uuid:event_id>/", include("comment_like.urls")),
     # 유저별 즐겨찾기 관련
     path("api/users/<str:user_id>/", include("favorite_event.urls")),
 ]
@@ -0,0 +1,239 @@
+"""
+PostgreSQL COPY 기반 이벤트 일괄 저장 / 캘린더 복제 / 일괄 삭제
+- 행을 임시 테이블로 COPY FROM STDIN 스트리밍한 뒤
+  INSERT ... SELECT ... ON CONFLICT (event_id) DO UPDATE 한 번으로 event_event에 병합
+- bulk_create와 달리 행마다 파라미터를 바인딩하지 않아 대량 저장에 사용
+- signals를 거치지 않으므로 캘린더 버전 증가, 이동 기록 등은 호출 측에서 처리
+"""
+
+import json
+from datetime import datetime
+from operator import attrgetter
+
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from calendars.models import Calendar
+from event.models import Event
+
+STAGE_TABLE = "event_import_stage"
+COPY_BUFFER_SIZE = 64 * 1024
+
+# COPY text 형식에서 이스케이프해야 하는 문자
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def quote_columns(columns):
+    return ", ".join(connection.ops.quote_name(column) for column in columns)
+
+
+def get_copy_converter(field):
+    """필드 값을 COPY text 형식으로 바꾸는 함수 (NULL은 호출 측에서 처리)"""
+    if isinstance(field, models.JSONField):
+        return lambda value: json.dumps(
+            value, cls=field.encoder, ensure_ascii=False
+        ).translate(COPY_ESCAPES)
+    if isinstance(field, models.BooleanField):
+        return lambda value: "t" if value else "f"
+    if isinstance(field, (models.CharField, models.TextField)):
+        return lambda value: str(value).translate(COPY_ESCAPES)
+    if isinstance(field, models.DateTimeField):
+        return datetime.isoformat
+    return str
+
+
+def iter_copy_lines(events, fields):
+    """
+    이벤트를 COPY 입력 줄로 변환
+    - auto_now 필드(updated_at)는 save()와 같이 현재 시간으로 채움
+    - 필드별 변환 함수를 미리 정해 두고 행마다 값만 변환
+    """
+    now = timezone.now()
+    columns = [
+        (
+            (
+                (lambda event: now)
+                if getattr(field, "auto_now", False)
+                else attrgetter(field.attname)
+            ),
+            get_copy_converter(field),
+        )
+        for field in fields
+    ]
+    for event in events:
+        values = []
+        for get_value, convert in columns:
+            value = get_value(event)
+            values.append(r"\N" if value is None else convert(value))
+        yield "\t".join(values) + "\n"
+
+
+class LineReader:
+    """
+    줄 iterator를 copy_expert가 읽는 파일 객체로 감쌈
+    - 요청한 크기만큼만 만들어 전달하므로 전체 입력을 메모리에 올리지 않음
+    """
+
+    def __init__(self, lines):
+        self.lines = iter(lines)
+        self.buffer = ""
+
+    def read(self, size=-1):
+        chunks = [self.buffer]
+        length = len(self.buffer)
+        while size < 0 or length < size:
+            line = next(self.lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            length += len(line)
+        data = "".join(chunks)
+        if size < 0:
+            self.buffer = ""
+            return data
+        self.buffer = data[size:]
+        return data[:size]
+
+
+def load_events(events, update_fields):
+    """
+    이벤트를 COPY로 임시 테이블에 넣은 뒤 event_event에 한 번에 병합
+    - 같은 event_id가 이미 있으면 update_fields만 덮어씀
+    - save()에서 계산하는 값(recurrence_end_time, enforce_no_overlap)은 호출 측에서 채움
+    - 반환: (생성 수, 업데이트 수)
+    """
+    fields = Event._meta.concrete_fields
+    columns = quote_columns(field.column for field in fields)
+    table = connection.ops.quote_name(Event._meta.db_table)
+    stage = connection.ops.quote_name(STAGE_TABLE)
+    updates = ", ".join(
+        f"{column} = EXCLUDED.{column}"
+        for column in (
+            connection.ops.quote_name(Event._meta.get_field(name).column)
+            for name in update_fields
+        )
+    )
+    conflict_action = f"UPDATE SET {updates}" if updates else "NOTHING"
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"CREATE TEMP TABLE {stage} (LIKE {table}) ON COMMIT DROP")
+        cursor.copy_expert(
+            f"COPY {stage} ({columns}) FROM STDIN",
+            LineReader(iter_copy_lines(events, fields)),
+            size=COPY_BUFFER_SIZE,
+        )
+        # xmax = 0이면 새로 삽입된 행, 아니면 충돌로 업데이트된 행
+        cursor.execute(f"""
+            WITH merged AS (
+                INSERT INTO {table} ({columns})
+                SELECT {columns} FROM {stage}
+                ON CONFLICT (event_id) DO {conflict_action}
+                RETURNING (xmax = 0) AS inserted
+            )
+            SELECT
+                count(*) FILTER (WHERE inserted),
+                count(*) FILTER (WHERE NOT inserted)
+            FROM merged
+            """)
+        inserted, updated = cursor.fetchone()
+        cursor.execute(f"DROP TABLE {stage}")
+    return inserted, updated
+
+
+def delete_related_rows(model, queryset):
+    """
+    queryset 행을 CASCADE로 참조하는 행을 모델별로 삭제 (하위 참조부터)
+    - 하위 참조를 먼저 지우므로 각 QuerySet.delete()는 행을 읽어 오지 않고
+      DELETE ... WHERE IN (subquery) 한 번으로 처리됨 (receiver가 없는 모델)
+    - receiver가 있는 모델은 Django가 행마다 signals를 보냄
+    """
+    for related in model._meta.related_objects:
+        if related.on_delete is not models.CASCADE:
+            continue
+        rows = related.related_model._base_manager.filter(
+            **{f"{related.field.name}__in": queryset.values("pk")}
+        )
+        delete_related_rows(related.related_model, rows)
+        rows.delete()
+
+
+def delete_events(event_ids):
+    """
+    이벤트와 이벤트를 참조하는 행(댓글, 좋아요, 즐겨찾기)을 일괄 삭제
+    - QuerySet.delete()는 signals 때문에 행마다 처리하므로
+      참조 행을 모델별로 한 번에 지운 뒤 DELETE ... RETURNING 한 번으로 삭제
+    - 반환: 삭제한 (event_id, calendar_id) 목록
+    """
+    event_ids = [str(event_id) for event_id in event_ids]
+    if not event_ids:
+        return []
+
+    table = connection.ops.quote_name(Event._meta.db_table)
+    event_column = connection.ops.quote_name(Event._meta.pk.column)
+    calendar_column = connection.ops.quote_name(
+        Event._meta.get_field("calendar_id").column
+    )
+    with transaction.atomic():
+        delete_related_rows(Event, Event.objects.filter(event_id__in=event_ids))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {table} WHERE {event_column} = ANY(%s::uuid[]) "
+                f"RETURNING {event_column}, {calendar_column}",
+                [event_ids],
+            )
+            return cursor.fetchall()
+
+
+def clone_events(source_calendar_id, target_calendar_id, admin_id):
+    """
+    캘린더의 모든 이벤트를 새 event_id로 다른 캘린더에 복사
+    - 원본 행이 이미 DB에 있으므로 COPY로 주고받지 않고 INSERT ... SELECT 한 번으로 처리
+    - 반환: 복사한 이벤트 수
+    """
+    replaced = {
+        "event_id": "gen_random_uuid()",
+        "calendar_id": "%s",
+        "admin_id": "%s",
+        "updated_at": "now()",
+    }
+    fields = Event._meta.concrete_fields
+    columns = quote_columns(field.column for field in fields)
+    values = ", ".join(
+        replaced.get(field.name, connection.ops.quote_name(field.column))
+        for field in fields
+    )
+    params = [
+        target_calendar_id if field.name == "calendar_id" else admin_id
+        for field in fields
+        if field.name in ("calendar_id", "admin_id")
+    ]
+    table = connection.ops.quote_name(Event._meta.db_table)
+    calendar_column = connection.ops.quote_name(
+        Event._meta.get_field("calendar_id").column
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({columns}) "
+            f"SELECT {values} FROM {table} WHERE {calendar_column} = %s",
+            [*params, source_calendar_id],
+        )
+        return cursor.rowcount
+
+
+def clone_calendar(calendar, creator, name=None):
+    """
+    캘린더를 모든 이벤트와 함께 복제 (복제한 사용자가 생성자/이벤트 관리자)
+    - 관리자, 구독, 댓글, 좋아요는 복사하지 않음
+    - 반환: (새 캘린더, 복사한 이벤트 수)
+    """
+    with transaction.atomic():
+        clone = Calendar.objects.create(
+            name=name or calendar.name,
+            creator=creator,
+            description=calendar.description,
+            is_public=calendar.is_public,
+            color=calendar.color,
+            no_overlap=calendar.no_overlap,
+        )
+        count = clone_events(calendar.calendar_id, clone.calendar_id, creator.pk)
+    return clone, count
@@ -0,0 +1,110 @@
+"""
+바쁜 시간 / 빈 시간 계산
+- 조회 기간의 이벤트(반복 일정은 발생으로 펼침)를 시작 시간 순으로 정렬한 뒤
+  한 번 훑으면서 겹치거나 맞닿은 구간을 병합 (O(n log n))
+"""
+
+from django.db.models import Q
+
+from calendars.models import Calendar, CalendarAdmin
+from calendars.services import ADMIN_ROLES, ROLE_SUBSCRIBER
+from event.models import Event
+from event.recurrence import RECURRENCE_FIELDS, expand_rows
+from event.services import EventService
+
+
+def merge_intervals(intervals):
+    """
+    (start, end) 구간 목록을 병합
+    - 정렬 후 한 번 훑으며 겹치거나 맞닿은 구간을 합침
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+            continue
+        merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def find_free_slots(busy, start, end, min_length):
+    """
+    병합된 바쁜 구간 사이에서 min_length 이상인 빈 구간 목록
+    - busy는 merge_intervals 결과 (정렬되어 있고 겹치지 않음)
+    """
+    free = []
+    cursor = start
+    for busy_start, busy_end in busy:
+        if busy_start - cursor >= min_length:
+            free.append((cursor, busy_start))
+        cursor = max(cursor, busy_end)
+    if end - cursor >= min_length:
+        free.append((cursor, end))
+    return free
+
+
+def get_member_calendar_ids(calendar, roles):
+    """
+    캘린더 관리자(생성자 포함)들이 관리하는 캘린더 중 요청자가 볼 수 있는 캘린더 ID
+    - 관리자들의 일정이 어느 캘린더에 있든 바쁜 시간으로 계산하기 위함
+    - 요청자가 볼 수 없는 캘린더의 일정 시간이 드러나지 않도록 요청자의 역할 맵으로 제한
+    - 반환: (요청자가 관리하는 캘린더 ID 목록, 요청자가 구독하는 캘린더 ID 목록)
+    """
+    member_ids = {calendar.creator_id}
+    member_ids.update(
+        CalendarAdmin.objects.filter(calendar=calendar).values_list(
+            "user_id", flat=True
+        )
+    )
+    calendar_ids = set(
+        Calendar.objects.filter(creator_id__in=member_ids).values_list(
+            "calendar_id", flat=True
+        )
+    )
+    calendar_ids.update(
+        CalendarAdmin.objects.filter(user_id__in=member_ids).values_list(
+            "calendar_id", flat=True
+        )
+    )
+    admin_calendar_ids = sorted(
+        pk for pk in calendar_ids if roles.get(pk) in ADMIN_ROLES
+    )
+    subscribed_calendar_ids = sorted(
+        pk for pk in calendar_ids if roles.get(pk) == ROLE_SUBSCRIBER
+    )
+    return admin_calendar_ids, subscribed_calendar_ids
+
+
+def get_busy_intervals(admin_calendar_ids, start, end, subscribed_calendar_ids=()):
+    """
+    캘린더들의 이벤트로 조회 기간 안의 바쁜 구간 계산 (기간 밖은 잘라냄)
+    - 관리 캘린더: 시간 정보만 사용하므로 비공개 이벤트도 포함
+    - 구독 캘린더: 요청자가 볼 수 있는 공개 이벤트만 포함
+    """
+    events = Event.objects.filter(
+        Q(calendar_id__in=admin_calendar_ids)
+        | Q(calendar_id__in=subscribed_calendar_ids, is_public=True)
+    )
+    rows = EventService.filter_window(events, start, end).values(
+        "start_time", "end_time", *RECURRENCE_FIELDS
+    )
+
+    intervals = [
+        (max(row["start_time"], start), min(row["end_time"], end))
+        for row in expand_rows(rows, start, end)
+        if row["end_time"] > start and row["start_time"] < end
+    ]
+    return merge_intervals(intervals)
+
+
+def get_free_busy(calendar, roles, start, end, min_length):
+    """
+    캘린더 관리자들의 바쁜 구간과 min_length 이상인 빈 구간
+    - roles: 요청자의 {calendar_id: 역할} 맵
+    """
+    admin_calendar_ids, subscribed_calendar_ids = get_member_calendar_ids(
+        calendar, roles
+    )
+    busy = get_busy_intervals(admin_calendar_ids, start, end, subscribed_calendar_ids)
+    return busy, find_free_slots(busy, start, end, min_length)
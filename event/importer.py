@@ -0,0 +1,620 @@
+"""
+CSV / Excel 이벤트 일괄 업로드
+- 파일은 EVENT_IMPORT_CHUNK_SIZE행씩 읽고 청크마다 검증/저장 (메모리 사용량 제한)
+- 열 단위(pandas)로 형식 검증과 일시 변환을 한 번에 처리
+- 캘린더 권한, 기존 이벤트, 겹침 금지 여부는 청크마다 한 번씩만 조회
+- 잘못된 행이 하나라도 있으면 아무것도 저장하지 않고 모든 행의 오류를 함께 반환
+- 큰 파일은 업로드 작업(EventImportJob)으로 저장해 워커가 청크 단위로 처리
+  (잘못된 행은 건너뛰고 작업의 errors에 기록)
+- 저장은 bulk_create (업데이트는 ON CONFLICT DO UPDATE)로 일괄 처리하고
+  EVENT_IMPORT_COPY_MIN_ROWS행 이상이면 COPY 기반 로더(event.bulkload) 사용
+  (signals를 거치지 않으므로 캘린더 버전 증가, 이동 기록은 직접 처리)
+"""
+
+import csv
+import io
+import uuid
+from datetime import timedelta
+from itertools import islice
+
+import openpyxl
+import pandas as pd
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from calendars.models import Calendar
+from calendars.services import CalendarRoleResolver
+from event.bulkload import load_events
+from event.models import (
+    EVENT_NO_OVERLAP_CONSTRAINT,
+    Event,
+    EventImportJob,
+    EventTombstone,
+)
+from event.recurrence import get_recurrence_end_time
+from event.services import EventConflictService, InvalidEventImportException
+
+CSV_EXTENSION = ".csv"
+XLSX_EXTENSION = ".xlsx"
+SUPPORTED_EXTENSIONS = (CSV_EXTENSION, XLSX_EXTENSION)
+
+REQUIRED_COLUMNS = [
+    "calendar_id",
+    "title",
+    "description",
+    "start_time",
+    "end_time",
+    "is_public",
+]
+OPTIONAL_COLUMNS = ["event_id", "location"]
+
+# 업데이트 시 파일 값으로 덮어쓰는 필드
+UPDATE_FIELDS = [
+    "calendar_id",
+    "title",
+    "description",
+    "start_time",
+    "end_time",
+    "is_public",
+    "location",
+    "recurrence_end_time",
+    "enforce_no_overlap",
+    "updated_at",
+]
+
+BOOLEAN_VALUES = {
+    "true": True,
+    "1": True,
+    "1.0": True,
+    "y": True,
+    "yes": True,
+    "false": False,
+    "0": False,
+    "0.0": False,
+    "n": False,
+    "no": False,
+}
+
+# 시간대가 명시된 ISO 8601 일시 (Z 또는 +09:00 / +0900)
+AWARE_DATETIME_PATTERN = r"(?:[Zz]|[+-]\d{2}:?\d{2})$"
+
+TITLE_MAX_LENGTH = Event._meta.get_field("title").max_length
+LOCATION_MAX_LENGTH = Event._meta.get_field("location").max_length
+
+
+def iter_csv_chunks(file, chunk_size):
+    """CSV를 chunk_size행씩 읽음 (형식 추론 없이 모두 문자열로 읽고 검증 단계에서 변환)"""
+    with pd.read_csv(file, dtype=str, chunksize=chunk_size) as reader:
+        yield from reader
+
+
+def iter_xlsx_chunks(file, chunk_size):
+    """
+    Excel 첫 번째 시트를 chunk_size행씩 읽음
+    - openpyxl 읽기 전용 모드로 행을 순서대로 읽어 시트 전체를 메모리에 올리지 않음
+    - 모든 칸이 빈 행은 건너뜀 (행 번호는 유지)
+    """
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = ["" if value is None else str(value) for value in header]
+        start = 0
+        while batch := list(islice(rows, chunk_size)):
+            chunk = pd.DataFrame.from_records(
+                batch,
+                columns=columns,
+                index=pd.RangeIndex(start, start + len(batch)),
+            ).dropna(how="all")
+            start += len(batch)
+            if not chunk.empty:
+                yield chunk
+    finally:
+        workbook.close()
+
+
+def read_chunks(chunks):
+    """파일을 읽다가 발생한 오류(인코딩, 형식 등)를 업로드 오류로 변환"""
+    while True:
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            return
+        except Exception as e:
+            raise InvalidEventImportException(
+                f"파일 처리 중 오류가 발생했습니다: {str(e)}"
+            )
+        yield chunk
+
+
+def iter_chunks(file, chunk_size):
+    """
+    업로드 파일을 chunk_size행씩 DataFrame으로 읽음 (CSV / Excel)
+    - 메모리 사용량이 파일 크기가 아닌 청크 크기에 비례
+    - DataFrame 인덱스는 파일 전체 기준 행 위치 (헤더 제외, 0부터)
+    """
+    if file.name.endswith(CSV_EXTENSION):
+        return read_chunks(iter_csv_chunks(file, chunk_size))
+    if file.name.endswith(XLSX_EXTENSION):
+        return read_chunks(iter_xlsx_chunks(file, chunk_size))
+    raise InvalidEventImportException(
+        "지원하지 않는 파일 형식입니다. CSV 또는 Excel 파일을 사용하세요."
+    )
+
+
+def count_rows(file):
+    """
+    진행률 표시용 데이터 행 수 (헤더 제외, 알 수 없으면 None)
+    - CSV는 한 번 훑어서 세고, Excel은 시트에 기록된 범위를 사용
+    """
+    try:
+        if file.name.endswith(CSV_EXTENSION):
+            text = io.TextIOWrapper(file, encoding="utf-8", newline="")
+            try:
+                return max(0, sum(1 for row in csv.reader(text) if row) - 1)
+            finally:
+                text.detach()
+        workbook = openpyxl.load_workbook(file, read_only=True)
+        try:
+            max_row = workbook.active.max_row
+        finally:
+            workbook.close()
+        return None if max_row is None else max(0, max_row - 1)
+    except Exception:
+        return None
+    finally:
+        file.seek(0)
+
+
+def row_number(index):
+    """DataFrame 인덱스를 파일의 행 번호로 변환 (1행은 헤더)"""
+    return int(index) + 2
+
+
+def to_text(series):
+    """문자열 열로 변환 (빈 칸은 <NA>)"""
+    return series.astype("string")
+
+
+def parse_datetimes(series):
+    """
+    일시 열을 UTC aware datetime 열로 변환 (변환할 수 없으면 NaT)
+    - 시간대가 없는 값은 TIME_ZONE 기준으로 해석
+    """
+    tz = timezone.get_current_timezone()
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if series.dt.tz is None:
+            series = series.dt.tz_localize(tz, ambiguous="NaT", nonexistent="NaT")
+        return series.dt.tz_convert("UTC")
+
+    text = to_text(series).str.strip()
+    aware = text.str.contains(AWARE_DATETIME_PATTERN, na=False)
+    aware_values = pd.to_datetime(
+        text[aware], errors="coerce", utc=True, format="ISO8601"
+    )
+    naive_values = (
+        pd.to_datetime(text[~aware], errors="coerce", format="ISO8601")
+        .dt.tz_localize(tz, ambiguous="NaT", nonexistent="NaT")
+        .dt.tz_convert("UTC")
+    )
+    return pd.concat([aware_values, naive_values]).reindex(series.index)
+
+
+def parse_uuid(value):
+    """UUID 문자열 변환 (변환할 수 없으면 None)"""
+    try:
+        return uuid.UUID(str(value).strip())
+    except ValueError:
+        return None
+
+
+def find_overlapping_rows(intervals):
+    """
+    (start, end, index) 목록에서 다른 구간과 겹치는 행 인덱스
+    - 시작 시간 순으로 정렬한 뒤 가장 늦게 끝나는 구간과만 비교 (O(n log n))
+    - index가 None이면 DB에 이미 있는 이벤트
+    """
+    overlapping = set()
+    last_end = last_index = None
+    for start, end, index in sorted(intervals, key=lambda i: (i[0], i[1])):
+        if last_end is not None and start < last_end:
+            overlapping.add(index if index is not None else last_index)
+        if last_end is None or end > last_end:
+            last_end, last_index = end, index
+    overlapping.discard(None)
+    return overlapping
+
+
+class EventImporter:
+    """
+    업로드 파일의 행을 검증해 이벤트를 일괄 생성/업데이트
+    - event_id가 있는 행은 사용자가 관리하는 기존 이벤트 업데이트, 없으면 생성
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.errors = []
+
+    def add_errors(self, frame, mask, field, message):
+        """mask에 해당하는 행마다 오류 추가"""
+        for index in frame.index[mask]:
+            self.errors.append(
+                {"row": row_number(index), "field": field, "message": message}
+            )
+
+    def validate(self, data):
+        """
+        열 단위 형식 검증 및 변환
+        - 반환: 오류가 없는 행만 담은 정규화된 DataFrame
+        """
+        missing_fields = [
+            field for field in REQUIRED_COLUMNS if field not in data.columns
+        ]
+        if missing_fields:
+            raise InvalidEventImportException(
+                f"누락된 필드: {', '.join(missing_fields)}"
+            )
+
+        frame = pd.DataFrame(index=data.index)
+        invalid = pd.Series(False, index=data.index)
+
+        def reject(mask, field, message):
+            nonlocal invalid
+            mask = mask.fillna(False).astype(bool)
+            self.add_errors(frame, mask, field, message)
+            invalid |= mask
+
+        calendar_ids = pd.to_numeric(data["calendar_id"], errors="coerce")
+        reject(
+            calendar_ids.isna() | (calendar_ids % 1 != 0),
+            "calendar_id",
+            "캘린더 ID가 올바르지 않습니다.",
+        )
+        frame["calendar_id"] = calendar_ids.where(~invalid).astype("Int64")
+
+        titles = to_text(data["title"])
+        reject(
+            titles.isna() | (titles.str.strip() == ""), "title", "제목을 입력해주세요."
+        )
+        reject(
+            titles.str.len() > TITLE_MAX_LENGTH,
+            "title",
+            f"제목은 {TITLE_MAX_LENGTH}자 이하여야 합니다.",
+        )
+        frame["title"] = titles
+
+        frame["description"] = to_text(data["description"])
+
+        locations = (
+            to_text(data["location"])
+            if "location" in data.columns
+            else pd.Series(pd.NA, index=data.index, dtype="string")
+        )
+        reject(
+            locations.str.len() > LOCATION_MAX_LENGTH,
+            "location",
+            f"위치는 {LOCATION_MAX_LENGTH}자 이하여야 합니다.",
+        )
+        frame["location"] = locations
+
+        for field in ("start_time", "end_time"):
+            frame[field] = parse_datetimes(data[field])
+            reject(frame[field].isna(), field, "일시 형식이 올바르지 않습니다.")
+        reject(
+            frame["end_time"] <= frame["start_time"],
+            "end_time",
+            "종료 시간은 시작 시간 이후여야 합니다.",
+        )
+
+        is_public = to_text(data["is_public"]).str.strip().str.lower()
+        frame["is_public"] = is_public.map(BOOLEAN_VALUES)
+        reject(
+            frame["is_public"].isna(),
+            "is_public",
+            "공개 여부는 true 또는 false여야 합니다.",
+        )
+
+        event_ids = (
+            data["event_id"]
+            if "event_id" in data.columns
+            else pd.Series(pd.NA, index=data.index)
+        )
+        has_event_id = (to_text(event_ids).str.strip() != "").fillna(False).astype(bool)
+        frame["event_id"] = event_ids.where(has_event_id).map(
+            parse_uuid, na_action="ignore"
+        )
+        reject(
+            has_event_id & frame["event_id"].isna(),
+            "event_id",
+            "이벤트 ID가 올바르지 않습니다.",
+        )
+        reject(
+            frame["event_id"].notna() & frame["event_id"].duplicated(),
+            "event_id",
+            "파일 안에서 같은 이벤트 ID가 중복되었습니다.",
+        )
+
+        return frame[~invalid]
+
+    def check_calendars(self, frame):
+        """
+        관리 권한이 없는 캘린더의 행 제외
+        - 반환: (남은 행, {calendar_id: no_overlap})
+        """
+        resolver = CalendarRoleResolver(self.user)
+        admin_ids = [pk for pk in resolver.roles if resolver.is_admin(pk)]
+        allowed = frame["calendar_id"].isin(admin_ids)
+        self.add_errors(
+            frame,
+            ~allowed,
+            "calendar_id",
+            "캘린더를 찾을 수 없거나 이벤트를 등록할 권한이 없습니다.",
+        )
+        frame = frame[allowed]
+
+        no_overlap = dict(
+            Calendar.objects.filter(
+                calendar_id__in=frame["calendar_id"].unique().tolist()
+            ).values_list("calendar_id", "no_overlap")
+        )
+        return frame, no_overlap
+
+    def load_existing(self, frame):
+        """
+        업데이트할 기존 이벤트를 한 번에 조회 (사용자가 관리자인 이벤트만)
+        - 반환: (남은 행, {event_id: Event})
+        """
+        event_ids = frame["event_id"].dropna().tolist()
+        existing = Event.objects.filter(
+            event_id__in=event_ids, admin_id=self.user
+        ).in_bulk()
+        found = frame["event_id"].isna() | frame["event_id"].isin(list(existing))
+        self.add_errors(frame, ~found, "event_id", "이벤트를 찾을 수 없습니다.")
+        return frame[found], existing
+
+    def check_overlaps(self, frame, no_overlap, existing):
+        """
+        겹침 금지 캘린더에 들어갈 단일 이벤트의 시간 겹침 확인
+        - 캘린더별로 파일의 행과 DB의 기존 단일 이벤트를 함께 정렬해 한 번 훑음
+        """
+        calendar_ids = [pk for pk, enabled in no_overlap.items() if enabled]
+        recurring_ids = {pk for pk, event in existing.items() if event.recurrence_freq}
+        targets = frame[
+            frame["calendar_id"].isin(calendar_ids)
+            & ~frame["event_id"].isin(list(recurring_ids))
+        ]
+        if targets.empty:
+            return frame
+
+        stored = EventConflictService.filter_overlapping(
+            Event.objects.filter(
+                calendar_id__in=targets["calendar_id"].unique().tolist(),
+                recurrence_freq__isnull=True,
+            ).exclude(event_id__in=list(existing.keys())),
+            targets["start_time"].min().to_pydatetime(),
+            targets["end_time"].max().to_pydatetime(),
+        ).values_list("calendar_id", "start_time", "end_time")
+
+        intervals = {}
+        for calendar_id, start, end in stored:
+            intervals.setdefault(calendar_id, []).append((start, end, None))
+        for index, calendar_id, start, end in zip(
+            targets.index,
+            targets["calendar_id"],
+            targets["start_time"],
+            targets["end_time"],
+        ):
+            intervals.setdefault(calendar_id, []).append(
+                (start.to_pydatetime(), end.to_pydatetime(), index)
+            )
+
+        overlapping = set()
+        for calendar_intervals in intervals.values():
+            overlapping |= find_overlapping_rows(calendar_intervals)
+        mask = frame.index.isin(list(overlapping))
+        self.add_errors(
+            frame, mask, "start_time", "같은 캘린더의 다른 이벤트와 시간이 겹칩니다."
+        )
+        return frame[~mask]
+
+    def build_events(self, frame, no_overlap, existing):
+        """검증된 행으로 생성할 이벤트 / 업데이트할 이벤트 / 이동 기록 목록 생성"""
+        now = timezone.now()
+        created, updated, tombstones = [], [], []
+        records = frame.astype(object).where(frame.notna(), None)
+        for row in records.itertuples(index=False):
+            values = {
+                "calendar_id_id": int(row.calendar_id),
+                "title": row.title,
+                "description": row.description,
+                "start_time": row.start_time.to_pydatetime(),
+                "end_time": row.end_time.to_pydatetime(),
+                "is_public": bool(row.is_public),
+                "location": row.location,
+                "enforce_no_overlap": no_overlap[row.calendar_id],
+            }
+            if row.event_id is None:
+                created.append(Event(admin_id=self.user, **values))
+                continue
+
+            event = existing[row.event_id]
+            if event.calendar_id_id != values["calendar_id_id"]:
+                tombstones.append(
+                    EventTombstone(
+                        event_id=event.event_id, calendar_id=event.calendar_id_id
+                    )
+                )
+            for attr, value in values.items():
+                setattr(event, attr, value)
+            event.recurrence_end_time = get_recurrence_end_time(event)
+            event.updated_at = now
+            updated.append(event)
+        return created, updated, tombstones
+
+    def save(self, frame, no_overlap, existing):
+        """
+        검증된 행을 일괄 저장
+        - signals를 거치지 않으므로 캘린더 버전 증가와 이동 기록을 직접 처리
+        """
+        created, updated, tombstones = self.build_events(frame, no_overlap, existing)
+        previous_calendar_ids = {t.calendar_id for t in tombstones}
+        batch_size = settings.EVENT_IMPORT_BATCH_SIZE
+        try:
+            with transaction.atomic():
+                if len(created) + len(updated) >= settings.EVENT_IMPORT_COPY_MIN_ROWS:
+                    # 행이 많으면 COPY로 임시 테이블에 넣고 한 번에 병합
+                    load_events(created + updated, UPDATE_FIELDS)
+                else:
+                    Event.objects.bulk_create(created, batch_size=batch_size)
+                    # bulk_update는 필드마다 CASE WHEN 식을 만들어 행이 많으면 느리므로
+                    # 불러온 기존 행을 INSERT ... ON CONFLICT (event_id) DO UPDATE로 덮어씀
+                    Event.objects.bulk_create(
+                        updated,
+                        batch_size=batch_size,
+                        update_conflicts=True,
+                        unique_fields=["event_id"],
+                        update_fields=UPDATE_FIELDS,
+                    )
+                EventTombstone.objects.bulk_create(tombstones, batch_size=batch_size)
+                Calendar.bump_versions(
+                    {event.calendar_id_id for event in created + updated}
+                    | previous_calendar_ids
+                )
+        except IntegrityError as e:
+            # 검증 후 다른 요청이 겹치는 이벤트를 먼저 저장한 경우
+            if EVENT_NO_OVERLAP_CONSTRAINT not in str(e):
+                raise
+            raise InvalidEventImportException(
+                "같은 캘린더의 다른 이벤트와 시간이 겹치는 행이 있습니다."
+            )
+        return created, updated
+
+    def run(self, data, partial=False):
+        """
+        행을 검증한 뒤 일괄 저장
+        - partial=False: 잘못된 행이 하나라도 있으면 아무것도 저장하지 않음
+        - partial=True: 잘못된 행은 errors에만 남기고 나머지 행 저장 (업로드 작업용)
+        - 반환: (생성된 이벤트 목록, 업데이트된 이벤트 목록)
+        """
+        frame = self.validate(data)
+        frame, no_overlap = self.check_calendars(frame)
+        frame, existing = self.load_existing(frame)
+        frame = self.check_overlaps(frame, no_overlap, existing)
+        self.errors.sort(key=lambda error: error["row"])
+        if self.errors and not partial:
+            raise InvalidEventImportException(errors=self.errors)
+        return self.save(frame, no_overlap, existing)
+
+
+def import_file(user, file):
+    """
+    업로드 파일 전체를 청크 단위로 검증/저장
+    - 잘못된 행이 하나라도 있으면 모든 행의 오류와 함께 전체 롤백
+    - 반환: (생성된 이벤트 목록, 업데이트된 이벤트 목록)
+    """
+    importer = EventImporter(user)
+    created, updated = [], []
+    with transaction.atomic():
+        for chunk in iter_chunks(file, settings.EVENT_IMPORT_CHUNK_SIZE):
+            chunk_created, chunk_updated = importer.run(chunk, partial=True)
+            created += chunk_created
+            updated += chunk_updated
+        if importer.errors:
+            raise InvalidEventImportException(errors=importer.errors)
+    return created, updated
+
+
+def create_import_job(user, file):
+    """업로드 파일을 워커가 처리할 작업으로 저장"""
+    return EventImportJob.objects.create(
+        user=user, file_name=file.name, content=file.read()
+    )
+
+
+def claim_import_job():
+    """
+    처리할 작업 하나를 가져와 처리 중으로 표시
+    - 대기 중인 작업, 또는 워커가 멈춰 오래 갱신되지 않은 처리 중 작업을 오래된 순으로
+    - SKIP LOCKED로 잠가서 여러 워커가 동시에 실행돼도 같은 작업을 가져가지 않음
+    """
+    stale_before = timezone.now() - timedelta(
+        seconds=settings.EVENT_IMPORT_JOB_STALE_SECONDS
+    )
+    with transaction.atomic():
+        job = (
+            EventImportJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=EventImportJob.STATUS_PENDING)
+                | Q(status=EventImportJob.STATUS_RUNNING, updated_at__lt=stale_before)
+            )
+            .order_by("created_at")
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = EventImportJob.STATUS_RUNNING
+        job.started_at = job.started_at or timezone.now()
+        job.save(update_fields=["status", "started_at", "updated_at"])
+    return job
+
+
+def finish_import_job(job, status, message=None):
+    """작업 종료 처리 (업로드 파일 내용은 더 필요 없으므로 비움)"""
+    job.status = status
+    job.message = message
+    job.finished_at = timezone.now()
+    job.content = b""
+    job.save(
+        update_fields=["status", "message", "finished_at", "content", "updated_at"]
+    )
+
+
+def run_import_job(job):
+    """
+    작업의 파일을 청크 단위로 처리
+    - 청크마다 저장과 진행 상황 갱신을 한 트랜잭션으로 커밋하므로
+      중간에 멈춘 작업은 processed_rows 다음 행부터 이어서 처리
+    - 잘못된 행은 건너뛰고 errors에 기록
+    """
+    file = ContentFile(bytes(job.content), name=job.file_name)
+    job.content = b""
+    if job.total_rows is None:
+        job.total_rows = count_rows(file)
+        job.save(update_fields=["total_rows", "updated_at"])
+
+    max_errors = settings.EVENT_IMPORT_JOB_MAX_ERRORS
+    try:
+        for chunk in iter_chunks(file, settings.EVENT_IMPORT_CHUNK_SIZE):
+            # 이어서 처리하는 경우 이미 저장한 행은 건너뜀
+            chunk = chunk[chunk.index >= job.processed_rows]
+            if chunk.empty:
+                continue
+            importer = EventImporter(job.user)
+            with transaction.atomic():
+                created, updated = importer.run(chunk, partial=True)
+                job.processed_rows = int(chunk.index[-1]) + 1
+                job.created_count += len(created)
+                job.updated_count += len(updated)
+                job.error_count += len(importer.errors)
+                job.errors += importer.errors[: max(0, max_errors - len(job.errors))]
+                job.save(
+                    update_fields=[
+                        "processed_rows",
+                        "created_count",
+                        "updated_count",
+                        "error_count",
+                        "errors",
+                        "updated_at",
+                    ]
+                )
+    except InvalidEventImportException as e:
+        return finish_import_job(job, EventImportJob.STATUS_FAILED, e.message)
+
+    job.total_rows = job.processed_rows
+    job.save(update_fields=["total_rows", "updated_at"])
+    return finish_import_job(job, EventImportJob.STATUS_SUCCEEDED)
@@ -0,0 +1,93 @@
+"""
+벤치마크 명령 공용 도구 (명령으로 등록되지 않도록 _로 시작)
+"""
+
+import multiprocessing
+import os
+import resource
+import time
+from datetime import date, timedelta
+
+from django.utils import timezone
+
+from calendars.models import Calendar
+from event.models import Event
+from event.services import EventService
+from user.models import User
+
+
+def create_benchmark_events(size):
+    """
+    벤치마크용 사용자/캘린더/이벤트 생성
+    - 호출 측에서 트랜잭션 롤백으로 정리해야 함
+    - (user, 조회 기간 queryset, start, end) 반환
+    """
+    user = User.objects.create_user(
+        email="benchmark@evento.local",
+        username="benchmark",
+        birth=date(2000, 1, 1),
+        nickname="benchmark",
+    )
+    calendar = Calendar.objects.create(name="benchmark", creator=user, color="#ffffff")
+    start = timezone.now().replace(microsecond=0)
+    Event.objects.bulk_create(
+        (
+            Event(
+                calendar_id=calendar,
+                admin_id=user,
+                title=f"이벤트 {index}",
+                description="설명" if index % 2 else None,
+                start_time=start + timedelta(minutes=index),
+                end_time=start + timedelta(minutes=index + 30),
+                is_public=bool(index % 3),
+            )
+            for index in range(size)
+        ),
+        batch_size=5000,
+    )
+    end = start + timedelta(minutes=size + 30)
+    queryset = EventService.filter_window(
+        Event.objects.filter(calendar_id=calendar), start, end
+    )
+    return user, queryset, start, end
+
+
+def measure(func, repeat):
+    """repeat번 실행 중 가장 짧은 시간(초)과 마지막 결과 반환"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def current_rss():
+    """현재 프로세스의 RSS (바이트, Linux /proc 기준)"""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _run_and_report(func, queue):
+    baseline = current_rss()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    queue.put((elapsed, peak - baseline))
+
+
+def measure_peak_rss(func):
+    """
+    func를 별도 프로세스(fork)에서 실행해 (시간(초), 최대 RSS 증가량(바이트)) 반환
+    - 최대 RSS는 프로세스 단위로만 기록되므로 측정마다 새 프로세스 사용 (Linux 전용)
+    """
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=_run_and_report, args=(func, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
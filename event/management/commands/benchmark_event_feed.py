@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from event.recurrence import expand_events, expand_rows
+from event.serializers import EventFeedMapper, EventSerializer
+
+from ._benchmark import create_benchmark_events, measure
+
+
+class Command(BaseCommand):
+    help = (
+        "이벤트 피드 직렬화 경로(EventSerializer / EventFeedMapper)의 속도를 비교합니다. "
+        "임시 데이터는 트랜잭션 롤백으로 정리됩니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[1000, 10000, 100000],
+            help="비교할 이벤트 수 목록",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="경로별 반복 횟수 (최솟값 사용)"
+        )
+
+    def handle(self, *args, **options):
+        for size in options["sizes"]:
+            with transaction.atomic():
+                self.run(size, options["repeat"])
+                transaction.set_rollback(True)
+
+    def run(self, size, repeat):
+        user, queryset, start, end = create_benchmark_events(size)
+
+        def serializer_path():
+            context = {"request": SimpleNamespace(user=user)}
+            return EventSerializer(
+                expand_events(queryset.all(), start, end), many=True, context=context
+            ).data
+
+        def mapper_path():
+            mapper = EventFeedMapper({"request": SimpleNamespace(user=user)})
+            rows = queryset.values(*mapper.values_fields)
+            return mapper.to_representation(expand_rows(rows, start, end))
+
+        renderer = JSONRenderer()
+        serializer_seconds, serializer_data = measure(serializer_path, repeat)
+        mapper_seconds, mapper_data = measure(mapper_path, repeat)
+        identical = renderer.render(serializer_data) == renderer.render(mapper_data)
+
+        self.stdout.write(
+            f"{size:>7}개  EventSerializer {serializer_seconds * 1000:9.1f}ms  "
+            f"EventFeedMapper {mapper_seconds * 1000:9.1f}ms  "
+            f"x{serializer_seconds / mapper_seconds:5.1f}  "
+            f"출력 동일: {'예' if identical else '아니오'}"
+        )
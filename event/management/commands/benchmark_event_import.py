@@ -0,0 +1,116 @@
+import csv
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import openpyxl
+import pandas as pd
+from django.conf import settings
+from django.core.files import File
+from django.core.management.base import BaseCommand
+
+from event.importer import XLSX_EXTENSION, EventImporter, iter_chunks
+
+from ._benchmark import measure_peak_rss
+
+CSV_ROW_SIZE = 145  # 생성하는 CSV 한 행의 대략적인 크기 (바이트)
+
+
+def write_sample_file(path, size_mb):
+    """
+    벤치마크용 업로드 파일 생성 (CSV 기준 size_mb MB 분량의 행)
+    - Excel은 압축되므로 같은 행 수라도 파일 크기가 더 작음
+    """
+    rows = size_mb * 1024 * 1024 // CSV_ROW_SIZE
+    header = ["calendar_id", "title", "description", "start_time", "end_time"]
+    header += ["is_public", "location"]
+    base = datetime(2025, 1, 1, 9)
+
+    def iter_rows():
+        for index in range(rows):
+            start = base + timedelta(minutes=30 * index)
+            yield [
+                1,
+                f"이벤트 {index}",
+                f"설명 {index} " + "가" * 20,
+                start.isoformat(),
+                (start + timedelta(minutes=30)).isoformat(),
+                "true" if index % 2 else "false",
+                "서울",
+            ]
+
+    if path.endswith(XLSX_EXTENSION):
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(header)
+        for row in iter_rows():
+            sheet.append(row)
+        workbook.save(path)
+    else:
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            writer.writerows(iter_rows())
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        "이벤트 업로드 파일 읽기/검증의 최대 메모리(RSS)를 비교합니다. "
+        "파일 전체를 DataFrame으로 읽는 방식과 청크 단위로 읽는 방식을 "
+        "각각 별도 프로세스에서 실행하며, DB에는 저장하지 않습니다. (Linux 전용)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[10, 100],
+            help="비교할 입력 크기 목록 (CSV 기준 MB)",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["csv", "xlsx"],
+            default="csv",
+            help="업로드 파일 형식 (기본값: csv)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.EVENT_IMPORT_CHUNK_SIZE,
+            help="청크당 행 수 (기본값: EVENT_IMPORT_CHUNK_SIZE)",
+        )
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as directory:
+            for size_mb in options["sizes"]:
+                path = os.path.join(directory, f"events_{size_mb}.{options['format']}")
+                rows = write_sample_file(path, size_mb)
+                self.stdout.write(
+                    f"[{size_mb}MB 분량, {rows:,}행, "
+                    f"파일 {os.path.getsize(path) / 1024 / 1024:.1f}MB]"
+                )
+                self.run(path, options["chunk_size"])
+
+    def run(self, path, chunk_size):
+        importer = EventImporter(user=None)
+
+        def read_all():
+            with open(path, "rb") as file:
+                if path.endswith(XLSX_EXTENSION):
+                    data = pd.read_excel(file)
+                else:
+                    data = pd.read_csv(file)
+            importer.validate(data)
+
+        def read_chunked():
+            with open(path, "rb") as file:
+                for chunk in iter_chunks(File(file, name=path), chunk_size):
+                    importer.validate(chunk)
+
+        for name, func in [("전체 읽기", read_all), ("청크 읽기", read_chunked)]:
+            seconds, peak = measure_peak_rss(func)
+            self.stdout.write(
+                f"  {name}  {seconds:7.2f}s  최대 RSS 증가 {peak / 1024 / 1024:8.1f}MB"
+            )
@@ -0,0 +1,72 @@
+import gzip
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from config.renderers import MessagePackRenderer, ORJSONRenderer, msgpack
+from event.recurrence import expand_rows
+from event.serializers import EventFeedMapper
+
+from ._benchmark import create_benchmark_events, measure
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class Command(BaseCommand):
+    help = (
+        "이벤트 피드 응답의 렌더러별 렌더링 시간과 크기(압축 전/후)를 비교합니다. "
+        "임시 데이터는 트랜잭션 롤백으로 정리됩니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[1000, 10000],
+            help="비교할 이벤트 수 목록",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="렌더러별 반복 횟수 (최솟값 사용)"
+        )
+
+    def handle(self, *args, **options):
+        renderers = [("json", JSONRenderer()), ("orjson", ORJSONRenderer())]
+        if msgpack is not None:
+            renderers.append(("msgpack", MessagePackRenderer()))
+        else:
+            self.stdout.write("msgpack이 설치되어 있지 않아 MessagePack은 제외합니다.")
+
+        for size in options["sizes"]:
+            with transaction.atomic():
+                self.run(size, options["repeat"], renderers)
+                transaction.set_rollback(True)
+
+    def run(self, size, repeat, renderers):
+        user, queryset, start, end = create_benchmark_events(size)
+        mapper = EventFeedMapper({"request": SimpleNamespace(user=user)})
+        events = mapper.to_representation(
+            expand_rows(queryset.values(*mapper.values_fields), start, end)
+        )
+        # EventViewSet.list 응답과 같은 형태
+        data = {"admin_events": events, "subscription_events": []}
+
+        self.stdout.write(f"[{size}개]")
+        expected = JSONRenderer().render(data)
+        for name, renderer in renderers:
+            seconds, body = measure(lambda: renderer.render(data), repeat)
+            if renderer.media_type == "application/json" and body != expected:
+                self.stdout.write(
+                    self.style.WARNING(f"  {name}: JSON 출력이 다릅니다.")
+                )
+            sizes = [f"원본 {len(body):>10,}B", f"gzip {len(gzip.compress(body)):>9,}B"]
+            if brotli is not None:
+                sizes.append(f"br {len(brotli.compress(body, quality=5)):>9,}B")
+            self.stdout.write(
+                f"  {name:<8} {seconds * 1000:8.2f}ms  " + "  ".join(sizes)
+            )
@@ -0,0 +1,20 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from event.models import EventTombstone
+
+
+class Command(BaseCommand):
+    help = "보관 기간(EVENT_TOMBSTONE_RETENTION_DAYS)이 지난 이벤트 삭제 기록을 정리합니다."
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(
+            days=settings.EVENT_TOMBSTONE_RETENTION_DAYS
+        )
+        deleted, _ = EventTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(
+            self.style.SUCCESS(f"{deleted}개의 삭제 기록을 정리했습니다.")
+        )
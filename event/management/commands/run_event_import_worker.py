@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from event.importer import claim_import_job, finish_import_job, run_import_job
+from event.models import EventImportJob
+
+
+class Command(BaseCommand):
+    help = (
+        "이벤트 업로드 작업을 처리합니다. "
+        "별도 브로커 없이 DB의 작업 테이블을 주기적으로 확인하며, "
+        "여러 프로세스로 실행해도 같은 작업을 중복 처리하지 않습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="대기 중인 작업을 모두 처리한 뒤 종료",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="대기 중인 작업이 없을 때 다시 확인하기까지의 시간(초, 기본값: 5)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            job = claim_import_job()
+            if job is None:
+                if options["once"]:
+                    return
+                time.sleep(options["interval"])
+                continue
+
+            self.stdout.write(f"업로드 작업 처리 시작: {job.job_id} ({job.file_name})")
+            try:
+                run_import_job(job)
+            except Exception as e:
+                # 예상하지 못한 오류는 작업만 실패 처리하고 다음 작업 계속 처리
+                finish_import_job(job, EventImportJob.STATUS_FAILED, str(e))
+                self.stderr.write(f"업로드 작업 실패: {job.job_id} ({e})")
+                continue
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"업로드 작업 종료: {job.job_id} ({job.get_status_display()}, "
+                    f"생성 {job.created_count} / 업데이트 {job.updated_count} / "
+                    f"오류 {job.error_count})"
+                )
+            )
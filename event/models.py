@@ -1,11 +1,43 @@
 import uuid
 
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import (
+    DateTimeRangeField,
+    RangeBoundary,
+    RangeOperators,
+)
+from django.contrib.postgres.indexes import GinIndex, GistIndex, OpClass
+from django.contrib.postgres.search import SearchVector
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Upper
 
 from calendars.models import Calendar
+from event.recurrence import FREQ_CHOICES, get_recurrence_end_time
 from user.models import User
 
+# 이벤트 전문 검색용 tsvector (제목 > 위치 > 설명 순 가중치)
+# - 한국어 형태소 분석기가 없으므로 공백 단위로 나누는 simple 설정 사용
+# - 인덱스와 검색 쿼리가 같은 식을 사용해야 GIN 인덱스를 탐
+EVENT_SEARCH_CONFIG = "simple"
+EVENT_SEARCH_VECTOR = (
+    SearchVector("title", weight="A", config=EVENT_SEARCH_CONFIG)
+    + SearchVector("location", weight="B", config=EVENT_SEARCH_CONFIG)
+    + SearchVector("description", weight="C", config=EVENT_SEARCH_CONFIG)
+)
+
+
+class TsTzRange(models.Func):
+    """PostgreSQL tstzrange(lower, upper, bounds)"""
+
+    function = "TSTZRANGE"
+    output_field = DateTimeRangeField()
+
+
+# 이벤트 시간 구간 [start_time, end_time) (겹침 제약/충돌 조회가 같은 식을 사용)
+EVENT_TIME_RANGE = TsTzRange("start_time", "end_time", RangeBoundary())
+EVENT_NO_OVERLAP_CONSTRAINT = "event_no_overlap_excl"
+
 
 class Event(models.Model):
     """
@@ -40,6 +72,34 @@ class Event(models.Model):
     location = models.CharField(
         max_length=255, null=True, blank=True, verbose_name="위치"
     )  # 이벤트 위치 (선택적)
+    updated_at = models.DateTimeField(
+        auto_now=True, verbose_name="수정 시간"
+    )  # 마지막 수정 시간 (동기화용)
+    recurrence_freq = models.CharField(
+        max_length=10,
+        choices=FREQ_CHOICES,
+        null=True,
+        blank=True,
+        verbose_name="반복 주기",
+    )  # 반복 주기 (없으면 단일 이벤트)
+    recurrence_interval = models.PositiveSmallIntegerField(
+        default=1, verbose_name="반복 간격"
+    )  # N일/N주/N개월마다
+    recurrence_until = models.DateTimeField(
+        null=True, blank=True, verbose_name="반복 종료 시점"
+    )
+    recurrence_count = models.PositiveIntegerField(
+        null=True, blank=True, verbose_name="반복 횟수"
+    )
+    recurrence_exceptions = models.JSONField(
+        default=list, blank=True, verbose_name="반복 제외 일시"
+    )  # 제외할 발생의 시작 시간 목록 (ISO 8601)
+    recurrence_end_time = models.DateTimeField(
+        null=True, blank=True, editable=False, verbose_name="반복 마지막 종료 시간"
+    )  # 저장 시 계산 (끝이 없는 반복이면 null)
+    enforce_no_overlap = models.BooleanField(
+        default=False, editable=False, verbose_name="겹침 금지 적용"
+    )  # 캘린더의 no_overlap 값 (배제 제약 조건에서 참조하기 위해 복사)
 
     class Meta:
         """
@@ -49,6 +109,61 @@ class Event(models.Model):
         ordering = ["start_time"]  # 시작 시간을 기준으로 정렬
         verbose_name = "이벤트"
         verbose_name_plural = "이벤트"
+        indexes = [
+            # 캘린더별 기간 조회(월/주 단위)용 복합 인덱스
+            models.Index(
+                fields=["calendar_id", "start_time", "end_time"],
+                name="event_cal_start_end_idx",
+            ),
+            # 캘린더별 변경분 조회(동기화)용 인덱스
+            models.Index(
+                fields=["calendar_id", "updated_at"],
+                name="event_cal_updated_idx",
+            ),
+            # 반복 일정만 담는 부분 인덱스 (기간 조회 시 반복 구간 확인용)
+            models.Index(
+                fields=["calendar_id", "start_time", "recurrence_end_time"],
+                name="event_recurring_idx",
+                condition=models.Q(recurrence_freq__isnull=False),
+            ),
+            # 전문 검색용 GIN 인덱스
+            GinIndex(EVENT_SEARCH_VECTOR, name="event_search_vector_idx"),
+            # 부분 문자열 검색(icontains = UPPER(...) LIKE)용 trigram 인덱스
+            # - 한국어는 조사가 붙어 전문 검색 토큰과 일치하지 않는 경우가 많아 함께 사용
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="event_title_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("location"), name="gin_trgm_ops"),
+                name="event_location_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("description"), name="gin_trgm_ops"),
+                name="event_description_trgm_idx",
+            ),
+            # 충돌 미리보기(캘린더 + 시간 구간 겹침)용 GiST 인덱스
+            GistIndex(
+                models.F("calendar_id"),
+                EVENT_TIME_RANGE,
+                name="event_cal_time_range_gist",
+            ),
+        ]
+        constraints = [
+            # 겹침 금지 캘린더에서는 단일 이벤트끼리 시간이 겹칠 수 없음
+            # (반복 일정은 발생 단위로 표현할 수 없어 제외)
+            ExclusionConstraint(
+                name=EVENT_NO_OVERLAP_CONSTRAINT,
+                expressions=[
+                    ("calendar_id", RangeOperators.EQUAL),
+                    (EVENT_TIME_RANGE, RangeOperators.OVERLAPS),
+                ],
+                condition=models.Q(
+                    enforce_no_overlap=True, recurrence_freq__isnull=True
+                ),
+                violation_error_message="같은 캘린더의 다른 이벤트와 시간이 겹칩니다.",
+            ),
+        ]
 
     def __str__(self):
         """
@@ -60,9 +175,35 @@ class Event(models.Model):
         """
         유효성 검사
         - 종료 시간이 시작 시간보다 앞설 수 없음
+        - 반복 간격/횟수는 1 이상
         """
         if self.end_time <= self.start_time:
             raise ValidationError("종료 시간은 시작 시간 이후여야 합니다.")
+        if self.recurrence_interval < 1:
+            raise ValidationError("반복 간격은 1 이상이어야 합니다.")
+        if self.recurrence_count is not None and self.recurrence_count < 1:
+            raise ValidationError("반복 횟수는 1 이상이어야 합니다.")
+        if self.recurrence_until and self.recurrence_count:
+            raise ValidationError(
+                "반복 종료 시점과 반복 횟수는 함께 지정할 수 없습니다."
+            )
+
+    def save(self, *args, **kwargs):
+        self.recurrence_end_time = get_recurrence_end_time(self)
+        self.enforce_no_overlap = self.calendar_id.no_overlap
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {
+                *kwargs["update_fields"],
+                "recurrence_end_time",
+                "enforce_no_overlap",
+                # auto_now 필드도 update_fields에 없으면 저장되지 않음 (동기화 누락 방지)
+                "updated_at",
+            }
+        super().save(*args, **kwargs)
+
+    @property
+    def is_recurring(self):
+        return bool(self.recurrence_freq)
 
     @staticmethod
     def public_events():
@@ -77,3 +218,90 @@ class Event(models.Model):
         비공개 이벤트 조회
         """
         return Event.objects.filter(is_public=False)
+
+
+class EventTombstone(models.Model):
+    """
+    삭제된 이벤트 기록
+    - 동기화 API에서 삭제된 이벤트를 클라이언트에 알리기 위해 사용
+    - 다른 캘린더로 이동한 이벤트도 이전 캘린더 기준으로 기록
+    """
+
+    tombstone_id = models.BigAutoField(primary_key=True)
+    event_id = models.UUIDField(verbose_name="이벤트 ID")
+    calendar_id = models.BigIntegerField(verbose_name="캘린더 ID")
+    deleted_at = models.DateTimeField(auto_now_add=True, verbose_name="삭제 시간")
+
+    class Meta:
+        verbose_name = "삭제된 이벤트"
+        verbose_name_plural = "삭제된 이벤트"
+        indexes = [
+            models.Index(
+                fields=["calendar_id", "deleted_at"],
+                name="event_tomb_cal_deleted_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.event_id} (삭제: {self.deleted_at})"
+
+
+class EventImportJob(models.Model):
+    """
+    이벤트 일괄 업로드 작업
+    - 큰 파일은 요청에서 바로 처리하지 않고 작업으로 저장한 뒤
+      워커(run_event_import_worker 명령)가 청크 단위로 처리
+    - 업로드 파일은 별도 저장소 없이 content에 보관하고 처리가 끝나면 비움
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "대기"),
+        (STATUS_RUNNING, "처리 중"),
+        (STATUS_SUCCEEDED, "완료"),
+        (STATUS_FAILED, "실패"),
+    ]
+
+    job_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="event_import_jobs"
+    )
+    file_name = models.CharField(max_length=255, verbose_name="파일 이름")
+    content = models.BinaryField(verbose_name="파일 내용")
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        verbose_name="상태",
+    )
+    total_rows = models.PositiveIntegerField(null=True, verbose_name="전체 행 수")
+    processed_rows = models.PositiveIntegerField(default=0, verbose_name="처리한 행 수")
+    created_count = models.PositiveIntegerField(default=0, verbose_name="생성 수")
+    updated_count = models.PositiveIntegerField(default=0, verbose_name="업데이트 수")
+    error_count = models.PositiveIntegerField(default=0, verbose_name="오류 수")
+    errors = models.JSONField(
+        default=list, blank=True, verbose_name="행 오류"
+    )  # {row, field, message} 목록 (EVENT_IMPORT_JOB_MAX_ERRORS개까지)
+    message = models.TextField(null=True, blank=True, verbose_name="실패 사유")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")
+    updated_at = models.DateTimeField(
+        auto_now=True, verbose_name="수정 시간"
+    )  # 처리 중에는 청크마다 갱신 (멈춘 작업 판단용)
+    started_at = models.DateTimeField(null=True, verbose_name="시작 시간")
+    finished_at = models.DateTimeField(null=True, verbose_name="종료 시간")
+
+    class Meta:
+        verbose_name = "이벤트 업로드 작업"
+        verbose_name_plural = "이벤트 업로드 작업"
+        indexes = [
+            # 워커가 대기/멈춘 작업을 오래된 순으로 가져오기 위한 인덱스
+            models.Index(
+                fields=["status", "created_at"], name="event_import_status_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.file_name} ({self.get_status_display()})"
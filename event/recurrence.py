@@ -0,0 +1,181 @@
+"""
+반복 일정 (RRULE 일부: DAILY / WEEKLY / MONTHLY, INTERVAL, UNTIL / COUNT, EXDATE)
+- 반복 일정은 원본 1건만 저장하고, 조회 기간 안의 발생만 읽을 때 펼침
+"""
+
+import copy
+from datetime import timedelta
+from types import SimpleNamespace
+
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+FREQ_DAILY = "daily"
+FREQ_WEEKLY = "weekly"
+FREQ_MONTHLY = "monthly"
+
+FREQ_CHOICES = [
+    (FREQ_DAILY, "매일"),
+    (FREQ_WEEKLY, "매주"),
+    (FREQ_MONTHLY, "매월"),
+]
+
+RECURRENCE_FIELDS = [
+    "recurrence_freq",
+    "recurrence_interval",
+    "recurrence_until",
+    "recurrence_count",
+    "recurrence_exceptions",
+]
+
+FREQ_STEPS = {
+    FREQ_DAILY: timedelta(days=1),
+    FREQ_WEEKLY: timedelta(weeks=1),
+}
+
+
+def _nth_start(base, freq, interval, index):
+    """index번째 발생 시작 시간 (해당 날짜가 없는 달은 None)"""
+    if freq == FREQ_MONTHLY:
+        month_index = base.month - 1 + index * interval
+        try:
+            return base.replace(
+                year=base.year + month_index // 12, month=month_index % 12 + 1
+            )
+        except ValueError:
+            # 31일/29일 등 해당 달에 없는 날짜는 건너뜀
+            return None
+    return base + FREQ_STEPS[freq] * interval * index
+
+
+def iter_occurrence_starts(event, after=None):
+    """
+    반복 일정의 발생 시작 시간을 순서대로 반환
+    - COUNT는 제외 일시를 포함해 계산 (RFC 5545)
+    - after를 지정하면 after 이전에 끝나는 발생은 가능한 한 건너뜀
+    - UNTIL/COUNT가 없으면 끝없이 반환하므로 호출 측에서 범위를 제한해야 함
+    """
+    base = timezone.localtime(event.start_time)
+    freq = event.recurrence_freq
+    interval = event.recurrence_interval or 1
+    duration = event.end_time - event.start_time
+
+    index = 0
+    if after is not None and freq in FREQ_STEPS:
+        # 매일/매주는 간격이 일정하므로 조회 시작 직전 발생으로 바로 이동
+        step = FREQ_STEPS[freq] * interval
+        index = max(0, (after - duration - base) // step)
+
+    # 매일/매주는 index와 발생 횟수가 같음
+    count = index
+    while True:
+        start = _nth_start(base, freq, interval, index)
+        index += 1
+        if start is None:
+            continue
+        if event.recurrence_until and start > event.recurrence_until:
+            return
+        if event.recurrence_count and count >= event.recurrence_count:
+            return
+        count += 1
+        yield start
+
+
+def get_exceptions(event):
+    """제외 일시 목록을 aware datetime 집합으로 변환"""
+    exceptions = set()
+    for value in event.recurrence_exceptions or []:
+        parsed = parse_datetime(value) if isinstance(value, str) else value
+        if parsed is None:
+            continue
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        exceptions.add(parsed)
+    return exceptions
+
+
+def get_recurrence_end_time(event):
+    """
+    마지막 발생의 종료 시간 (조회 기간 인덱스용)
+    - 반복 일정이 아니거나 끝이 없으면 None
+    """
+    if not event.recurrence_freq:
+        return None
+    if not event.recurrence_count and not event.recurrence_until:
+        return None
+
+    freq = event.recurrence_freq
+    duration = event.end_time - event.start_time
+    if freq in FREQ_STEPS:
+        base = timezone.localtime(event.start_time)
+        step = FREQ_STEPS[freq] * (event.recurrence_interval or 1)
+        last_index = None
+        if event.recurrence_count:
+            last_index = event.recurrence_count - 1
+        if event.recurrence_until:
+            until_index = max(0, (event.recurrence_until - base) // step)
+            last_index = (
+                until_index if last_index is None else min(last_index, until_index)
+            )
+        return base + step * last_index + duration
+
+    last_start = event.start_time
+    for last_start in iter_occurrence_starts(event):
+        pass
+    return last_start + duration
+
+
+def iter_occurrences(event, start, end):
+    """조회 기간과 겹치는 발생의 (시작, 종료) 시간을 순서대로 반환 (제외 일시 제외)"""
+    duration = event.end_time - event.start_time
+    exceptions = get_exceptions(event)
+    for occurrence_start in iter_occurrence_starts(event, after=start):
+        if occurrence_start >= end:
+            break
+        occurrence_end = occurrence_start + duration
+        if occurrence_end <= start or occurrence_start in exceptions:
+            continue
+        yield occurrence_start, occurrence_end
+
+
+def expand_events(events, start, end):
+    """
+    조회 기간 안의 발생으로 펼친 이벤트 목록 반환
+    - 반복 일정의 각 발생은 start_time/end_time만 바뀐 복사본
+    - 결과는 시작 시간 순으로 정렬
+    """
+    expanded = []
+    for event in events:
+        if not event.recurrence_freq:
+            expanded.append(event)
+            continue
+
+        for occurrence_start, occurrence_end in iter_occurrences(event, start, end):
+            occurrence = copy.copy(event)
+            occurrence.start_time = occurrence_start
+            occurrence.end_time = occurrence_end
+            expanded.append(occurrence)
+
+    expanded.sort(key=lambda event: event.start_time)
+    return expanded
+
+
+def expand_rows(rows, start, end):
+    """
+    expand_events의 values() 행(dict) 버전
+    - 행에는 start_time/end_time과 RECURRENCE_FIELDS가 포함되어야 함
+    """
+    expanded = []
+    for row in rows:
+        if not row["recurrence_freq"]:
+            expanded.append(row)
+            continue
+
+        event = SimpleNamespace(**row)
+        for occurrence_start, occurrence_end in iter_occurrences(event, start, end):
+            expanded.append(
+                {**row, "start_time": occurrence_start, "end_time": occurrence_end}
+            )
+
+    expanded.sort(key=lambda row: row["start_time"])
+    return expanded
@@ -1,12 +1,114 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.db.models import Q
-from rest_framework import serializers
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
 
-from favorite_event.models import FavoriteEvent
+from calendars.loaders import BatchLoader, BatchLoadListSerializer
 
-from .models import Event
+from .models import EVENT_NO_OVERLAP_CONSTRAINT, Event, EventImportJob
+from .recurrence import RECURRENCE_FIELDS
+from .services import EventBulkService, EventConflictService
 
 
-class EventSerializer(serializers.ModelSerializer):
+class RecurrenceValidationMixin:
+    """
+    반복 일정 필드 검증
+    """
+
+    def validate_recurrence_exceptions(self, value):
+        if not isinstance(value, list):
+            raise serializers.ValidationError("제외 일시는 목록이어야 합니다.")
+        normalized = []
+        for item in value:
+            parsed = parse_datetime(item) if isinstance(item, str) else None
+            if parsed is None:
+                raise serializers.ValidationError(
+                    f"제외 일시 형식이 올바르지 않습니다: {item}"
+                )
+            if timezone.is_naive(parsed):
+                parsed = timezone.make_aware(parsed)
+            normalized.append(parsed.isoformat())
+        return normalized
+
+    def validate_recurrence_interval(self, value):
+        if value < 1:
+            raise serializers.ValidationError("반복 간격은 1 이상이어야 합니다.")
+        return value
+
+    def validate_recurrence_count(self, value):
+        # 0이면 반복 계산에서 횟수 제한이 없는 것으로 처리되므로 거부
+        if value is not None and value < 1:
+            raise serializers.ValidationError("반복 횟수는 1 이상이어야 합니다.")
+        return value
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        instance = getattr(self, "instance", None)
+        until = attrs.get(
+            "recurrence_until", getattr(instance, "recurrence_until", None)
+        )
+        count = attrs.get(
+            "recurrence_count", getattr(instance, "recurrence_count", None)
+        )
+        if until and count:
+            raise serializers.ValidationError(
+                "반복 종료 시점과 반복 횟수는 함께 지정할 수 없습니다."
+            )
+        return attrs
+
+
+class NoOverlapValidationMixin:
+    """
+    겹침 금지 캘린더의 단일 이벤트 시간 겹침 검증
+    - 검증과 저장 사이에 끼어든 요청은 DB 배제 제약 조건이 막고, 같은 오류로 변환
+    """
+
+    overlap_error_message = "같은 캘린더의 다른 이벤트와 시간이 겹칩니다."
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        instance = getattr(self, "instance", None)
+
+        def current(field):
+            return attrs.get(field, getattr(instance, field, None))
+
+        calendar = current("calendar_id")
+        start_time = current("start_time")
+        end_time = current("end_time")
+        if (
+            calendar is None
+            or not calendar.no_overlap
+            or current("recurrence_freq")
+            or not start_time
+            or not end_time
+        ):
+            return attrs
+
+        if EventConflictService.has_single_conflict(
+            calendar.calendar_id,
+            start_time,
+            end_time,
+            exclude_event_id=getattr(instance, "event_id", None),
+        ):
+            raise serializers.ValidationError(self.overlap_error_message)
+        return attrs
+
+    def save(self, **kwargs):
+        try:
+            with transaction.atomic():
+                return super().save(**kwargs)
+        except IntegrityError as e:
+            if EVENT_NO_OVERLAP_CONSTRAINT not in str(e):
+                raise
+            raise serializers.ValidationError(self.overlap_error_message)
+
+
+class EventSerializer(
+    NoOverlapValidationMixin, RecurrenceValidationMixin, serializers.ModelSerializer
+):
     """
     Event 모델에 대한 기본 Serializer
     """
@@ -30,32 +132,34 @@ class EventSerializer(serializers.ModelSerializer):
             "location",
             "is_liked",
             "calendar_color",
+            *RECURRENCE_FIELDS,
         ]
+        list_serializer_class = BatchLoadListSerializer
+
+    def prime_batch(self, loader, instances):
+        """
+        목록 직렬화 전 캘린더/즐겨찾기 정보를 일괄 조회
+        """
+        loader.load_calendars({obj.calendar_id_id for obj in instances})
+        loader.load_favorites([obj.event_id for obj in instances])
+
+    def _get_calendar(self, obj):
+        loader = BatchLoader.from_context(self.context)
+        return loader.get_calendar(obj.calendar_id_id)
 
     def get_calendar_title(self, obj):
         """
         이벤트가 속한 캘린더의 타이틀 반환
         """
-        try:
-            if hasattr(obj, "calendar_id") and obj.calendar_id:
-                calendar = obj.calendar_id
-                return calendar.name
-            return None
-        except Exception as e:
-            print(f"Error getting calendar title: {str(e)}")
-            return None
+        calendar = self._get_calendar(obj)
+        return calendar["name"] if calendar else None
 
     def get_calendar_color(self, obj):
         """
         이벤트가 속한 캘린더의 색상 반환
         """
-        try:
-            calendar = obj.calendar_id
-            if calendar:
-                return calendar.color
-            return None
-        except AttributeError:
-            return None
+        calendar = self._get_calendar(obj)
+        return calendar["color"] if calendar else None
 
     def get_is_liked(self, obj):
         """
@@ -65,19 +169,16 @@ class EventSerializer(serializers.ModelSerializer):
         if not request or not request.user.is_authenticated:
             return False
 
-        try:
-            return FavoriteEvent.objects.filter(
-                user_id=request.user.user_id, event_id=obj.event_id
-            ).exists()
-        except Exception:
-            return False
+        return BatchLoader.from_context(self.context).is_liked(obj.event_id)
 
     def create(self, validated_data):
         validated_data["admin_id"] = self.context["request"].user
         return super().create(validated_data)
 
 
-class PublicEventSerializer(serializers.ModelSerializer):
+class PublicEventSerializer(
+    NoOverlapValidationMixin, RecurrenceValidationMixin, serializers.ModelSerializer
+):
     """
     공개 이벤트용 Serializer
     """
@@ -94,6 +195,7 @@ class PublicEventSerializer(serializers.ModelSerializer):
             "admin_id",
             "is_public",
             "location",
+            *RECURRENCE_FIELDS,
         ]
         read_only_fields = ["event_id", "admin_id"]
 
@@ -103,7 +205,9 @@ class PublicEventSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class PrivateEventSerializer(serializers.ModelSerializer):
+class PrivateEventSerializer(
+    NoOverlapValidationMixin, RecurrenceValidationMixin, serializers.ModelSerializer
+):
     """
     비공개 이벤트용 Serializer
     """
@@ -120,6 +224,7 @@ class PrivateEventSerializer(serializers.ModelSerializer):
             "admin_id",
             "is_public",
             "location",
+            *RECURRENCE_FIELDS,
         ]
         read_only_fields = ["event_id", "admin_id", "is_public"]
 
@@ -127,3 +232,196 @@ class PrivateEventSerializer(serializers.ModelSerializer):
         validated_data["is_public"] = False  # 비공개 이벤트로 설정
         validated_data["admin_id"] = self.context["request"].user
         return super().create(validated_data)
+
+
+class EventImportJobSerializer(serializers.ModelSerializer):
+    """
+    이벤트 업로드 작업 진행 상황
+    """
+
+    progress = serializers.SerializerMethodField()
+
+    class Meta:
+        model = EventImportJob
+        fields = [
+            "job_id",
+            "file_name",
+            "status",
+            "progress",
+            "total_rows",
+            "processed_rows",
+            "created_count",
+            "updated_count",
+            "error_count",
+            "errors",
+            "message",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+    def get_progress(self, obj) -> int | None:
+        """처리한 행 비율 (%, 파일을 읽기 전에는 null)"""
+        if obj.status == EventImportJob.STATUS_SUCCEEDED:
+            return 100
+        if not obj.total_rows:
+            return None
+        return min(100, obj.processed_rows * 100 // obj.total_rows)
+
+
+class EventBulkChangesSerializer(serializers.Serializer):
+    """
+    일괄 수정할 필드 (모든 대상 이벤트에 같은 값 적용)
+    - 시간 변경은 이벤트별 반복/겹침 검증이 필요해 단건 수정 API를 사용
+    """
+
+    title = serializers.CharField(max_length=255, required=False)
+    description = serializers.CharField(
+        allow_null=True, allow_blank=True, required=False
+    )
+    location = serializers.CharField(
+        max_length=255, allow_null=True, allow_blank=True, required=False
+    )
+    is_public = serializers.BooleanField(required=False)
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError(
+                "수정할 필드를 하나 이상 지정해야 합니다."
+            )
+        return attrs
+
+
+class EventBulkOperationSerializer(serializers.Serializer):
+    """
+    이벤트 일괄 작업 하나
+    - delete: event_ids 삭제
+    - move: event_ids를 calendar_id 캘린더로 이동
+    - update: event_ids에 changes 적용
+    """
+
+    action = serializers.ChoiceField(choices=EventBulkService.ACTIONS)
+    event_ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+    calendar_id = serializers.IntegerField(required=False)
+    changes = EventBulkChangesSerializer(required=False)
+
+    def validate(self, attrs):
+        action = attrs["action"]
+        if action == EventBulkService.ACTION_MOVE and "calendar_id" not in attrs:
+            raise serializers.ValidationError(
+                {"calendar_id": "이동할 캘린더를 지정해야 합니다."}
+            )
+        if action == EventBulkService.ACTION_UPDATE and "changes" not in attrs:
+            raise serializers.ValidationError(
+                {"changes": "수정할 필드를 지정해야 합니다."}
+            )
+        return attrs
+
+
+class EventBulkSerializer(serializers.Serializer):
+    """
+    이벤트 일괄 작업 요청
+    """
+
+    operations = EventBulkOperationSerializer(many=True, allow_empty=False)
+
+    def validate_operations(self, value):
+        count = sum(len(operation["event_ids"]) for operation in value)
+        if count > settings.EVENT_BULK_MAX_ITEMS:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {settings.EVENT_BULK_MAX_ITEMS}개의 이벤트만 "
+                "처리할 수 있습니다."
+            )
+        return value
+
+
+class EventFeedMapper:
+    """
+    EventSerializer(many=True)의 빠른 경로 (이벤트 피드용)
+    - 모델 인스턴스와 필드 트리 대신 values() 행을 바로 응답 dict로 변환
+    - 출력은 EventSerializer와 동일 (필드 순서, UUID/날짜 표현 포함)
+    """
+
+    values_fields = [
+        "event_id",
+        "calendar_id",
+        "calendar_id__name",
+        "calendar_id__color",
+        "title",
+        "description",
+        "start_time",
+        "end_time",
+        "admin_id",
+        "is_public",
+        "location",
+        *RECURRENCE_FIELDS,
+    ]
+
+    def __init__(self, context):
+        self.loader = BatchLoader.from_context(context)
+        request = context.get("request")
+        self.check_liked = request is not None and request.user.is_authenticated
+        self.format_datetime = self.compile_datetime_formatter()
+
+    @staticmethod
+    def compile_datetime_formatter():
+        """
+        EventSerializer의 DateTimeField와 같은 표현을 만드는 함수
+        - 행마다 현재 시간대를 조회하지 않도록 시간대를 미리 결정
+        - ISO 8601 이외의 출력 형식이면 DRF 필드 변환을 그대로 사용
+        """
+        field = serializers.DateTimeField()
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        field_timezone = field.timezone if hasattr(field, "timezone") else None
+        field_timezone = field_timezone or field.default_timezone()
+        if output_format != ISO_8601 or field_timezone is None:
+            return field.to_representation
+
+        def format_datetime(value):
+            if value.tzinfo is None:
+                return field.to_representation(value)
+            value = value.astimezone(field_timezone).isoformat()
+            if value.endswith("+00:00"):
+                value = value[:-6] + "Z"
+            return value
+
+        return format_datetime
+
+    def to_representation(self, rows):
+        """values() 행 목록을 EventSerializer와 같은 dict 목록으로 변환"""
+        rows = list(rows)
+        if self.check_liked:
+            self.loader.load_favorites({row["event_id"] for row in rows})
+
+        format_datetime = self.format_datetime
+        is_liked = self.loader.is_liked if self.check_liked else None
+        data = []
+        for row in rows:
+            description = row["description"]
+            location = row["location"]
+            until = row["recurrence_until"]
+            data.append(
+                {
+                    "event_id": str(row["event_id"]),
+                    "calendar_id": row["calendar_id"],
+                    "calendar_title": row["calendar_id__name"],
+                    "title": str(row["title"]),
+                    "description": None if description is None else str(description),
+                    "start_time": format_datetime(row["start_time"]),
+                    "end_time": format_datetime(row["end_time"]),
+                    "admin_id": row["admin_id"],
+                    "is_public": bool(row["is_public"]),
+                    "location": None if location is None else str(location),
+                    "is_liked": is_liked(row["event_id"]) if is_liked else False,
+                    "calendar_color": row["calendar_id__color"],
+                    "recurrence_freq": row["recurrence_freq"],
+                    "recurrence_interval": row["recurrence_interval"],
+                    "recurrence_until": (
+                        None if until is None else format_datetime(until)
+                    ),
+                    "recurrence_count": row["recurrence_count"],
+                    "recurrence_exceptions": row["recurrence_exceptions"],
+                }
+            )
+        return data
@@ -0,0 +1,614 @@
+import base64
+import hashlib
+import json
+import uuid
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db import IntegrityError, transaction
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from django.db.models import Count, Exists, FloatField, Max, OuterRef, Q
+from django.db.models.functions import Cast, TruncDate
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from calendars.models import Calendar
+from calendars.services import (
+    ADMIN_ROLES,
+    CalendarRoleResolver,
+    VisibleCalendarService,
+)
+from event.bulkload import delete_events
+from event.models import (
+    EVENT_NO_OVERLAP_CONSTRAINT,
+    EVENT_SEARCH_CONFIG,
+    EVENT_SEARCH_VECTOR,
+    EVENT_TIME_RANGE,
+    Event,
+    EventTombstone,
+)
+from event.recurrence import RECURRENCE_FIELDS, expand_events
+from favorite_event.models import FavoriteEvent
+
+
+class EventException(Exception):
+    """기본 이벤트 예외 클래스"""
+
+    def __init__(self, error, message):
+        self.error = error
+        self.message = message
+
+
+class InvalidEventWindowException(EventException):
+    def __init__(self, message="조회 기간이 올바르지 않습니다."):
+        super().__init__("잘못된 기간", message)
+
+
+class InvalidSyncTokenException(EventException):
+    def __init__(self):
+        super().__init__("잘못된 토큰", "유효하지 않은 동기화 토큰입니다.")
+
+
+class InvalidSearchQueryException(EventException):
+    def __init__(self, message="검색어를 입력해주세요."):
+        super().__init__("잘못된 검색어", message)
+
+
+class InvalidEventImportException(EventException):
+    def __init__(self, message="업로드한 파일에 잘못된 행이 있습니다.", errors=None):
+        super().__init__("잘못된 파일", message)
+        self.errors = errors or []
+
+
+class EventService:
+    SEARCH_QUERY_MAX_LENGTH = 100
+
+    @staticmethod
+    def parse_datetime_param(value):
+        """
+        쿼리 파라미터(날짜 또는 ISO 8601 일시)를 aware datetime으로 변환
+        - 날짜만 주어지면 해당 날짜의 00:00 (TIME_ZONE 기준)
+        """
+        if not value:
+            return None
+
+        parsed = parse_datetime(value)
+        if parsed is None:
+            parsed_date = parse_date(value)
+            if parsed_date is None:
+                raise InvalidEventWindowException(
+                    f"날짜 형식이 올바르지 않습니다: {value}"
+                )
+            parsed = datetime.combine(parsed_date, time.min)
+
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    @classmethod
+    def get_window(cls, params):
+        """
+        ?start= / ?end= 파라미터로 조회 기간 계산
+        - start 생략 시 이번 달 1일, end 생략 시 start + 최대 기간
+        - 최대 기간(EVENT_WINDOW_MAX_DAYS)을 넘는 요청은 거부
+        """
+        max_span = timedelta(days=settings.EVENT_WINDOW_MAX_DAYS)
+
+        start = cls.parse_datetime_param(params.get("start"))
+        end = cls.parse_datetime_param(params.get("end"))
+
+        if start is None and end is None:
+            today = timezone.localdate()
+            start = timezone.make_aware(
+                datetime.combine(today.replace(day=1), time.min)
+            )
+        if start is None:
+            start = end - max_span
+        if end is None:
+            end = start + max_span
+
+        if end <= start:
+            raise InvalidEventWindowException("종료 시점은 시작 시점 이후여야 합니다.")
+        if end - start > max_span:
+            raise InvalidEventWindowException(
+                f"조회 기간은 최대 {settings.EVENT_WINDOW_MAX_DAYS}일입니다."
+            )
+        return start, end
+
+    @staticmethod
+    def filter_window(queryset, start, end):
+        """
+        조회 기간과 겹치는 이벤트만 필터링
+        - 단일 이벤트: (calendar_id, start_time, end_time) 인덱스 범위 스캔
+        - 반복 일정: 반복 구간(start_time ~ recurrence_end_time)이 겹치는 원본만
+          부분 인덱스로 조회 (발생은 expand_events에서 펼침)
+        """
+        return queryset.filter(
+            Q(start_time__lt=end, end_time__gt=start)
+            | Q(recurrence_freq__isnull=False, start_time__lt=end)
+            & (Q(recurrence_end_time__isnull=True) | Q(recurrence_end_time__gt=start))
+        )
+
+    @staticmethod
+    def get_favorite_state(user, calendar_ids):
+        """
+        캘린더들의 이벤트에 대한 사용자 즐겨찾기 상태 (개수, 최대 ID)
+        - 즐겨찾기 여부(is_liked)는 사용자별 값이라 캘린더 버전 대신 피드 ETag에 포함
+        - 추가하면 최대 ID가, 삭제하면 개수가 바뀜
+        """
+        state = FavoriteEvent.objects.filter(
+            user_id=user, event_id__calendar_id__in=calendar_ids
+        ).aggregate(count=Count("pk"), last_id=Max("pk"))
+        return state["count"], state["last_id"]
+
+    @staticmethod
+    def get_calendar_set_hash(roles):
+        """관리/구독 캘린더 구성 해시 (구성이 바뀌면 전체 동기화 필요)"""
+        calendar_set = sorted(
+            (calendar_id, role in ADMIN_ROLES) for calendar_id, role in roles.items()
+        )
+        return hashlib.sha1(repr(calendar_set).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def encode_sync_token(synced_at, calendar_set_hash):
+        payload = json.dumps({"t": synced_at.isoformat(), "c": calendar_set_hash})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_sync_token(token):
+        try:
+            padding = "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(token + padding))
+            synced_at = parse_datetime(payload["t"])
+            calendar_set_hash = payload["c"]
+        except (TypeError, ValueError, KeyError):
+            raise InvalidSyncTokenException()
+        if synced_at is None:
+            raise InvalidSyncTokenException()
+        if timezone.is_naive(synced_at):
+            synced_at = timezone.make_aware(synced_at)
+        return synced_at, calendar_set_hash
+
+    @staticmethod
+    def encode_page_token(since, synced_at, calendar_set_hash, position):
+        """
+        동기화 다음 페이지 토큰
+        - since: 이번 동기화의 기준 시점 (전체 동기화면 None)
+        - synced_at: 첫 페이지 조회 시점 (마지막 페이지에서 다음 토큰으로 발급)
+        - position: 마지막으로 보낸 이벤트의 (updated_at, event_id)
+        """
+        updated_at, event_id = position
+        payload = json.dumps(
+            {
+                "t": since.isoformat() if since else None,
+                "s": synced_at.isoformat(),
+                "c": calendar_set_hash,
+                "p": [updated_at.isoformat(), str(event_id)],
+            }
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_page_token(token):
+        try:
+            padding = "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(token + padding))
+            since = parse_datetime(payload["t"]) if payload["t"] else None
+            synced_at = parse_datetime(payload["s"])
+            calendar_set_hash = payload["c"]
+            updated_at, event_id = payload["p"]
+            position = (parse_datetime(updated_at), uuid.UUID(event_id))
+        except (TypeError, ValueError, KeyError, AttributeError):
+            raise InvalidSyncTokenException()
+        if synced_at is None or position[0] is None:
+            raise InvalidSyncTokenException()
+        return since, synced_at, calendar_set_hash, position
+
+    @classmethod
+    def sync(cls, user, token=None, page_token=None):
+        """
+        token 이후 변경된 이벤트를 (updated_at, event_id) 순으로 페이지 단위 조회
+        - 관리 캘린더: 모든 이벤트 / 구독 캘린더: 공개 이벤트만
+        - 캘린더 구성이 바뀌었거나 토큰이 보관 기간보다 오래되면 전체 동기화(reset)
+        - 다음 페이지가 있으면 page_token만 발급하고, 다음 토큰은 마지막 페이지에서 발급
+        - 삭제 목록과 reset 여부는 첫 페이지에만 포함
+        반환값: (이벤트 목록, 삭제된 event_id 목록, 다음 토큰, 다음 페이지 토큰, reset 여부)
+        """
+        synced_at = timezone.now()
+        roles = VisibleCalendarService.get_roles(user)
+        calendar_set_hash = cls.get_calendar_set_hash(roles)
+        admin_ids = [pk for pk, role in roles.items() if role in ADMIN_ROLES]
+        subscribed_ids = [pk for pk, role in roles.items() if role not in ADMIN_ROLES]
+
+        since = None
+        position = None
+        if page_token:
+            since, page_synced_at, previous_hash, position = cls.decode_page_token(
+                page_token
+            )
+            if previous_hash == calendar_set_hash:
+                synced_at = page_synced_at
+            else:
+                # 페이지를 받는 도중 캘린더 구성이 바뀌면 전체 동기화부터 다시 시작
+                since = None
+                position = None
+        elif token:
+            since, previous_hash = cls.decode_sync_token(token)
+            retention = timedelta(days=settings.EVENT_TOMBSTONE_RETENTION_DAYS)
+            if previous_hash != calendar_set_hash or since < synced_at - retention:
+                since = None
+
+        events = Event.objects.filter(
+            Q(calendar_id__in=admin_ids)
+            | Q(calendar_id__in=subscribed_ids, is_public=True)
+        )
+        deleted = []
+        if since is not None:
+            # 커밋 순서 차이로 누락되지 않도록 약간 겹치게 조회 (클라이언트는 upsert)
+            cutoff = since - timedelta(seconds=settings.EVENT_SYNC_OVERLAP_SECONDS)
+            events = events.filter(updated_at__gt=cutoff)
+
+            if position is None:
+                deleted = list(
+                    EventTombstone.objects.filter(
+                        calendar_id__in=admin_ids + subscribed_ids,
+                        deleted_at__gt=cutoff,
+                    ).values_list("event_id", flat=True)
+                )
+                # 비공개로 바뀐 구독 캘린더 이벤트는 구독자에게 삭제로 전달
+                deleted += list(
+                    Event.objects.filter(
+                        calendar_id__in=subscribed_ids,
+                        is_public=False,
+                        updated_at__gt=cutoff,
+                    ).values_list("event_id", flat=True)
+                )
+
+        if position is not None:
+            updated_at, event_id = position
+            events = events.filter(
+                Q(updated_at__gt=updated_at)
+                | Q(updated_at=updated_at, event_id__gt=event_id)
+            )
+
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        page_size = settings.EVENT_SYNC_PAGE_SIZE
+        page = list(events.order_by("updated_at", "event_id")[: page_size + 1])
+        reset = since is None and position is None
+        if len(page) > page_size:
+            page = page[:page_size]
+            last = page[-1]
+            next_page = cls.encode_page_token(
+                since,
+                synced_at,
+                calendar_set_hash,
+                (last.updated_at, last.event_id),
+            )
+            return page, deleted, None, next_page, reset
+
+        next_token = cls.encode_sync_token(synced_at, calendar_set_hash)
+        return page, deleted, next_token, None, reset
+
+    @classmethod
+    def get_density(cls, admin_ids, subscribed_ids, start, end):
+        """
+        날짜별/캘린더별 이벤트 수
+        - 단일 이벤트: 시작 시간을 TIME_ZONE 기준 날짜로 잘라 DB에서 GROUP BY
+        - 반복 일정: 조회 기간과 겹치는 원본만 가져와 발생을 펼쳐서 합산
+        반환값: [{"date", "calendar_id", "count"}, ...] (날짜, 캘린더 순)
+        """
+        visible = Q(calendar_id__in=admin_ids) | Q(
+            calendar_id__in=subscribed_ids, is_public=True
+        )
+        tzinfo = timezone.get_current_timezone()
+
+        counts = {}
+        rows = (
+            Event.objects.filter(
+                visible,
+                recurrence_freq__isnull=True,
+                start_time__gte=start,
+                start_time__lt=end,
+            )
+            .annotate(date=TruncDate("start_time", tzinfo=tzinfo))
+            .values("date", "calendar_id")
+            .annotate(count=Count("event_id"))
+            .order_by()
+        )
+        for row in rows:
+            counts[(row["date"], row["calendar_id"])] = row["count"]
+
+        recurring = cls.filter_window(
+            Event.objects.filter(visible, recurrence_freq__isnull=False).only(
+                "event_id",
+                "calendar_id",
+                "start_time",
+                "end_time",
+                *RECURRENCE_FIELDS,
+            ),
+            start,
+            end,
+        )
+        for occurrence in expand_events(recurring, start, end):
+            if occurrence.start_time < start:
+                continue
+            key = (
+                timezone.localtime(occurrence.start_time, tzinfo).date(),
+                occurrence.calendar_id_id,
+            )
+            counts[key] = counts.get(key, 0) + 1
+
+        return [
+            {"date": date, "calendar_id": calendar_id, "count": count}
+            for (date, calendar_id), count in sorted(counts.items())
+        ]
+
+    @classmethod
+    def search(cls, user, query):
+        """
+        볼 수 있는 이벤트의 제목/위치/설명 검색
+        - 관리 캘린더: 모든 이벤트 / 구독 캘린더: 공개 이벤트만
+        - 전문 검색(tsvector GIN) 또는 부분 문자열(trigram GIN) 중 하나라도 일치하면 포함
+        - rank: 전문 검색 순위 + 제목 trigram 유사도 (내림차순 정렬용)
+        """
+        query = (query or "").strip()
+        if not query:
+            raise InvalidSearchQueryException()
+        if len(query) > cls.SEARCH_QUERY_MAX_LENGTH:
+            raise InvalidSearchQueryException(
+                f"검색어는 최대 {cls.SEARCH_QUERY_MAX_LENGTH}자입니다."
+            )
+
+        roles = VisibleCalendarService.get_roles(user)
+        admin_ids = [pk for pk, role in roles.items() if role in ADMIN_ROLES]
+        subscribed_ids = [pk for pk, role in roles.items() if role not in ADMIN_ROLES]
+
+        search_query = SearchQuery(
+            query, config=EVENT_SEARCH_CONFIG, search_type="websearch"
+        )
+        return (
+            Event.objects.filter(
+                Q(calendar_id__in=admin_ids)
+                | Q(calendar_id__in=subscribed_ids, is_public=True)
+            )
+            .annotate(search=EVENT_SEARCH_VECTOR)
+            .filter(
+                Q(search=search_query)
+                | Q(title__icontains=query)
+                | Q(location__icontains=query)
+                | Q(description__icontains=query)
+            )
+            .annotate(
+                # real(float4) 그대로 받으면 커서 값이 DB 값과 정확히 일치하지 않으므로
+                # double precision으로 변환
+                rank=Cast(
+                    SearchRank(EVENT_SEARCH_VECTOR, search_query)
+                    + TrigramWordSimilarity(query, "title"),
+                    FloatField(),
+                )
+            )
+        )
+
+
+class EventConflictService:
+    """
+    이벤트 시간 겹침 조회
+    - 단일 이벤트: (calendar_id, tstzrange) GiST 인덱스로 겹침(&&) 조회
+    - 반복 일정: 반복 구간이 겹치는 원본만 가져와 발생을 펼쳐서 확인
+    """
+
+    @staticmethod
+    def filter_overlapping(queryset, start, end):
+        """[start, end)와 시간이 겹치는 단일 이벤트만 필터링"""
+        return queryset.annotate(time_range=EVENT_TIME_RANGE).filter(
+            time_range__overlap=DateTimeTZRange(start, end)
+        )
+
+    @classmethod
+    def get_conflicts(cls, calendar_id, start, end, exclude_event_id=None):
+        """
+        캘린더에서 [start, end)와 겹치는 이벤트 목록 (시작 시간 순)
+        - 반복 일정은 겹치는 발생만 반환
+        """
+        events = Event.objects.filter(calendar_id=calendar_id)
+        if exclude_event_id is not None:
+            events = events.exclude(event_id=exclude_event_id)
+
+        single = cls.filter_overlapping(
+            events.filter(recurrence_freq__isnull=True), start, end
+        )
+        recurring = EventService.filter_window(
+            events.filter(recurrence_freq__isnull=False), start, end
+        )
+        conflicts = list(single) + expand_events(recurring, start, end)
+        conflicts.sort(key=lambda event: event.start_time)
+        return conflicts
+
+    @classmethod
+    def has_single_conflict(cls, calendar_id, start, end, exclude_event_id=None):
+        """겹침 금지 검증용: 다른 단일 이벤트와 겹치는지 여부"""
+        events = Event.objects.filter(
+            calendar_id=calendar_id, recurrence_freq__isnull=True
+        )
+        if exclude_event_id is not None:
+            events = events.exclude(event_id=exclude_event_id)
+        return cls.filter_overlapping(events, start, end).exists()
+
+    @classmethod
+    def has_overlapping_events(cls, calendar_id):
+        """캘린더에 이미 서로 겹치는 단일 이벤트가 있는지 (겹침 금지 설정 전 확인)"""
+        events = Event.objects.filter(
+            calendar_id=calendar_id, recurrence_freq__isnull=True
+        ).annotate(time_range=EVENT_TIME_RANGE)
+        return events.filter(
+            Exists(
+                events.exclude(event_id=OuterRef("event_id")).filter(
+                    time_range__overlap=OuterRef("time_range")
+                )
+            )
+        ).exists()
+
+
+class EventBulkService:
+    """
+    이벤트 일괄 작업 (삭제 / 다른 캘린더로 이동 / 필드 수정)
+    - 대상 이벤트의 캘린더를 한 번에 조회하고 권한은 캘린더별로 한 번만 확인
+    - 작업마다 UPDATE / DELETE ... WHERE event_id IN 한 번으로 반영
+    - signals를 거치지 않으므로 캘린더 버전 증가와 삭제/이동 기록을 직접 처리
+    """
+
+    ACTION_DELETE = "delete"
+    ACTION_MOVE = "move"
+    ACTION_UPDATE = "update"
+    ACTIONS = (ACTION_DELETE, ACTION_MOVE, ACTION_UPDATE)
+
+    # 항목별 결과 상태 (성공 시 작업별 상태)
+    STATUS_DELETED = "deleted"
+    STATUS_MOVED = "moved"
+    STATUS_UPDATED = "updated"
+    STATUS_NOT_FOUND = "not_found"
+    STATUS_FORBIDDEN = "forbidden"
+    STATUS_CONFLICT = "conflict"
+
+    ERROR_MESSAGES = {
+        STATUS_NOT_FOUND: "해당 이벤트를 찾을 수 없습니다.",
+        STATUS_FORBIDDEN: "이 이벤트를 변경할 권한이 없습니다.",
+        STATUS_CONFLICT: "같은 캘린더의 다른 이벤트와 시간이 겹칩니다.",
+    }
+
+    @classmethod
+    def apply(cls, request, operations):
+        """
+        작업 목록을 순서대로 적용하고 항목별 결과 목록 반환
+        - 앞 작업에서 삭제/이동한 이벤트는 뒤 작업에서 바뀐 상태 기준으로 처리
+        - 대상 행을 FOR UPDATE로 잠근 뒤 캘린더를 읽으므로 권한 확인 후
+          다른 요청이 캘린더를 옮겨도 확인한 캘린더 기준으로만 변경됨
+        """
+        with transaction.atomic():
+            return cls.apply_locked(request, operations)
+
+    @classmethod
+    def apply_locked(cls, request, operations):
+        """apply 본문 (트랜잭션 안에서만 호출)"""
+        resolver = CalendarRoleResolver.for_request(request)
+        calendars = dict(
+            Event.objects.filter(
+                event_id__in={
+                    event_id
+                    for operation in operations
+                    for event_id in operation["event_ids"]
+                }
+            )
+            .order_by("event_id")
+            .select_for_update()
+            .values_list("event_id", "calendar_id")
+        )
+        allowed_calendar_ids = {
+            calendar_id
+            for calendar_id in set(calendars.values())
+            if resolver.is_admin(calendar_id)
+        }
+
+        results = []
+        changed_calendar_ids = set()
+        tombstones = []
+        for index, operation in enumerate(operations):
+            targets = []
+            statuses = {}
+            for event_id in dict.fromkeys(operation["event_ids"]):
+                calendar_id = calendars.get(event_id)
+                if calendar_id is None:
+                    statuses[event_id] = cls.STATUS_NOT_FOUND
+                elif calendar_id not in allowed_calendar_ids:
+                    statuses[event_id] = cls.STATUS_FORBIDDEN
+                else:
+                    statuses[event_id] = None
+                    targets.append(event_id)
+
+            if targets:
+                status = cls.apply_operation(
+                    operation,
+                    targets,
+                    calendars,
+                    resolver,
+                    changed_calendar_ids,
+                    tombstones,
+                )
+                if status == cls.STATUS_MOVED:
+                    allowed_calendar_ids.add(operation["calendar_id"])
+                statuses.update(dict.fromkeys(targets, status))
+
+            results.extend(
+                cls.make_result(index, event_id, status)
+                for event_id, status in statuses.items()
+            )
+
+        EventTombstone.objects.bulk_create(tombstones)
+        Calendar.bump_versions(changed_calendar_ids)
+        return results
+
+    @classmethod
+    def apply_operation(
+        cls, operation, targets, calendars, resolver, changed_calendar_ids, tombstones
+    ):
+        """권한 확인이 끝난 이벤트에 작업 하나를 적용하고 공통 결과 상태 반환"""
+        action = operation["action"]
+        previous_calendar_ids = {calendars[event_id] for event_id in targets}
+
+        if action == cls.ACTION_DELETE:
+            for event_id, calendar_id in delete_events(targets):
+                tombstones.append(
+                    EventTombstone(event_id=event_id, calendar_id=calendar_id)
+                )
+                calendars.pop(event_id, None)
+            changed_calendar_ids |= previous_calendar_ids
+            return cls.STATUS_DELETED
+
+        events = Event.objects.filter(event_id__in=targets)
+        now = timezone.now()
+        if action == cls.ACTION_UPDATE:
+            events.update(**operation["changes"], updated_at=now)
+            changed_calendar_ids |= previous_calendar_ids
+            return cls.STATUS_UPDATED
+
+        target_calendar_id = operation["calendar_id"]
+        no_overlap = (
+            Calendar.objects.filter(calendar_id=target_calendar_id)
+            .values_list("no_overlap", flat=True)
+            .first()
+        )
+        if no_overlap is None or not resolver.is_admin(target_calendar_id):
+            return cls.STATUS_FORBIDDEN
+        try:
+            with transaction.atomic():
+                events.update(
+                    calendar_id=target_calendar_id,
+                    enforce_no_overlap=no_overlap,
+                    updated_at=now,
+                )
+        except IntegrityError as e:
+            if EVENT_NO_OVERLAP_CONSTRAINT not in str(e):
+                raise
+            return cls.STATUS_CONFLICT
+
+        for event_id in targets:
+            # 이전 캘린더 구독자에게는 삭제로 전달
+            if calendars[event_id] != target_calendar_id:
+                tombstones.append(
+                    EventTombstone(event_id=event_id, calendar_id=calendars[event_id])
+                )
+            calendars[event_id] = target_calendar_id
+        changed_calendar_ids |= previous_calendar_ids | {target_calendar_id}
+        return cls.STATUS_MOVED
+
+    @classmethod
+    def make_result(cls, index, event_id, status):
+        result = {"operation": index, "event_id": str(event_id), "status": status}
+        if status in cls.ERROR_MESSAGES:
+            result["error"] = cls.ERROR_MESSAGES[status]
+        return result
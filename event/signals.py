@@ -0,0 +1,64 @@
+from django.db import connections
+from django.db.models.signals import post_delete, post_save, pre_migrate, pre_save
+from django.dispatch import receiver
+
+from calendars.models import Calendar
+from event.models import Event, EventTombstone
+
+
+@receiver(pre_save, sender=Event)
+def remember_previous_calendar(sender, instance, **kwargs):
+    """다른 캘린더로 이동하는 경우 이전 캘린더 버전도 증가시키기 위해 저장"""
+    if instance._state.adding:
+        instance._previous_calendar_id = None
+        return
+    instance._previous_calendar_id = (
+        Event.objects.filter(event_id=instance.event_id)
+        .values_list("calendar_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def bump_calendar_version(sender, instance, **kwargs):
+    """이벤트 변경 시 소속 캘린더 버전 증가"""
+    Calendar.bump_versions(
+        [instance.calendar_id_id, getattr(instance, "_previous_calendar_id", None)]
+    )
+
+
+@receiver(post_delete, sender=Event)
+def create_tombstone(sender, instance, **kwargs):
+    """삭제된 이벤트를 동기화용으로 기록"""
+    EventTombstone.objects.create(
+        event_id=instance.event_id, calendar_id=instance.calendar_id_id
+    )
+
+
+@receiver(post_save, sender=Event)
+def create_move_tombstone(sender, instance, created, **kwargs):
+    """다른 캘린더로 이동한 경우 이전 캘린더 구독자에게는 삭제로 전달"""
+    previous_calendar_id = getattr(instance, "_previous_calendar_id", None)
+    if previous_calendar_id and previous_calendar_id != instance.calendar_id_id:
+        EventTombstone.objects.create(
+            event_id=instance.event_id, calendar_id=previous_calendar_id
+        )
+
+
+@receiver(pre_migrate)
+def create_extensions(sender, using, **kwargs):
+    """
+    이벤트 인덱스/제약 조건에 필요한 확장 설치
+    - pg_trgm: 검색용 trigram 인덱스 (gin_trgm_ops)
+    - btree_gist: 겹침 금지 배제 제약 조건/충돌 조회 인덱스의 calendar_id (GiST)
+    - 마이그레이션 파일을 저장소에 두지 않으므로 migrate 직전에 생성
+    """
+    if sender.name != "event":
+        return
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
@@ -1 +1,253 @@
-from django.test import TestCase
+import base64
+import json
+import uuid
+from datetime import datetime, timedelta
+from itertools import islice
+from types import SimpleNamespace
+
+from django.db.models import FloatField, Q, Value
+from django.test import SimpleTestCase
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from config.pagination import EventKeysetPagination, EventSearchKeysetPagination
+
+from .freebusy import find_free_slots, merge_intervals
+from .models import Event
+from .recurrence import (
+    FREQ_DAILY,
+    FREQ_MONTHLY,
+    FREQ_WEEKLY,
+    get_recurrence_end_time,
+    iter_occurrence_starts,
+    iter_occurrences,
+)
+
+
+def aware(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+def make_event(start, freq, hours=1, interval=1, until=None, count=None):
+    return SimpleNamespace(
+        start_time=start,
+        end_time=start + timedelta(hours=hours),
+        recurrence_freq=freq,
+        recurrence_interval=interval,
+        recurrence_until=until,
+        recurrence_count=count,
+        recurrence_exceptions=[],
+    )
+
+
+class RecurrenceTests(SimpleTestCase):
+    """반복 일정 발생 계산 (DB 없이 확인)"""
+
+    def test_monthly_skips_missing_days(self):
+        event = make_event(aware(2025, 1, 31, 9), FREQ_MONTHLY, count=4)
+        starts = list(iter_occurrence_starts(event))
+        self.assertEqual(
+            starts,
+            [
+                aware(2025, 1, 31, 9),
+                aware(2025, 3, 31, 9),
+                aware(2025, 5, 31, 9),
+                aware(2025, 7, 31, 9),
+            ],
+        )
+        self.assertEqual(get_recurrence_end_time(event), aware(2025, 7, 31, 10))
+
+    def test_monthly_leap_day(self):
+        event = make_event(aware(2024, 2, 29, 9), FREQ_MONTHLY, interval=12, count=2)
+        self.assertEqual(
+            list(iter_occurrence_starts(event)),
+            [aware(2024, 2, 29, 9), aware(2028, 2, 29, 9)],
+        )
+
+    def test_count(self):
+        event = make_event(aware(2025, 1, 1, 9), FREQ_WEEKLY, interval=2, count=3)
+        self.assertEqual(
+            list(iter_occurrence_starts(event)),
+            [aware(2025, 1, 1, 9), aware(2025, 1, 15, 9), aware(2025, 1, 29, 9)],
+        )
+        self.assertEqual(get_recurrence_end_time(event), aware(2025, 1, 29, 10))
+
+    def test_until_is_inclusive(self):
+        event = make_event(aware(2025, 1, 1, 9), FREQ_DAILY, until=aware(2025, 1, 3, 9))
+        self.assertEqual(
+            list(iter_occurrence_starts(event)),
+            [aware(2025, 1, 1, 9), aware(2025, 1, 2, 9), aware(2025, 1, 3, 9)],
+        )
+        self.assertEqual(get_recurrence_end_time(event), aware(2025, 1, 3, 10))
+
+    def test_until_and_count_use_earlier_end(self):
+        event = make_event(
+            aware(2025, 1, 1, 9), FREQ_DAILY, until=aware(2025, 1, 10), count=3
+        )
+        self.assertEqual(get_recurrence_end_time(event), aware(2025, 1, 3, 10))
+
+    def test_endless_series_has_no_end_time(self):
+        event = make_event(aware(2025, 1, 1, 9), FREQ_DAILY)
+        self.assertIsNone(get_recurrence_end_time(event))
+        self.assertEqual(len(list(islice(iter_occurrence_starts(event), 100))), 100)
+
+    def test_single_event_has_no_end_time(self):
+        event = make_event(aware(2025, 1, 1, 9), None)
+        self.assertIsNone(get_recurrence_end_time(event))
+
+    def test_skip_ahead_matches_full_iteration(self):
+        event = make_event(aware(2020, 1, 1, 23), FREQ_DAILY, hours=3, interval=3)
+        after = aware(2025, 6, 10)
+        skipped = next(iter_occurrence_starts(event, after=after))
+        full = next(
+            start
+            for start in iter_occurrence_starts(event)
+            if start + timedelta(hours=3) > after
+        )
+        # 조회 시작과 겹칠 수 있는 첫 발생보다 최대 한 간격 앞에서 시작
+        self.assertLessEqual(skipped, full)
+        self.assertLessEqual(full - skipped, timedelta(days=3))
+
+        end = aware(2025, 6, 20)
+        expected = [
+            start
+            for start in islice(iter_occurrence_starts(event), 2000)
+            if start < end and start + timedelta(hours=3) > after
+        ]
+        self.assertEqual(
+            [start for start, _ in iter_occurrences(event, after, end)], expected
+        )
+
+    def test_skip_ahead_keeps_count(self):
+        event = make_event(aware(2025, 1, 1, 9), FREQ_DAILY, count=5)
+        starts = list(iter_occurrence_starts(event, after=aware(2025, 1, 4, 12)))
+        self.assertEqual(starts, [aware(2025, 1, 4, 9), aware(2025, 1, 5, 9)])
+
+    def test_iter_occurrences_window_and_exceptions(self):
+        event = make_event(aware(2025, 1, 1, 9), FREQ_DAILY, count=10)
+        event.recurrence_exceptions = [aware(2025, 1, 5, 9).isoformat()]
+        occurrences = list(
+            iter_occurrences(event, aware(2025, 1, 4, 9, 30), aware(2025, 1, 7, 9))
+        )
+        self.assertEqual(
+            [start for start, _ in occurrences],
+            [aware(2025, 1, 4, 9), aware(2025, 1, 6, 9)],
+        )
+
+
+class FreeBusyTests(SimpleTestCase):
+    """바쁜 구간 병합 / 빈 구간 계산"""
+
+    def test_merge_overlapping_and_touching(self):
+        intervals = [(5, 7), (1, 3), (2, 4), (4, 5), (9, 10), (8, 9)]
+        self.assertEqual(merge_intervals(intervals), [(1, 7), (8, 10)])
+
+    def test_merge_keeps_contained_interval(self):
+        self.assertEqual(merge_intervals([(1, 10), (2, 3), (4, 12)]), [(1, 12)])
+
+    def test_merge_empty(self):
+        self.assertEqual(merge_intervals([]), [])
+
+    def test_free_slots_between_busy(self):
+        busy = [(2, 4), (5, 6), (9, 10)]
+        self.assertEqual(find_free_slots(busy, 0, 12, 2), [(0, 2), (6, 9), (10, 12)])
+
+    def test_free_slots_min_length_is_inclusive(self):
+        self.assertEqual(find_free_slots([(3, 5)], 0, 7, 3), [(0, 3)])
+
+    def test_free_slots_busy_outside_window(self):
+        busy = [(-5, 1), (11, 20)]
+        self.assertEqual(find_free_slots(busy, 0, 12, 1), [(1, 11)])
+
+    def test_free_slots_without_busy(self):
+        start = aware(2025, 1, 1, 9)
+        end = aware(2025, 1, 1, 18)
+        self.assertEqual(
+            find_free_slots([], start, end, timedelta(minutes=30)), [(start, end)]
+        )
+
+
+class KeysetCursorTests(SimpleTestCase):
+    """커서 인코딩/디코딩 (config.pagination)"""
+
+    def request(self, **params):
+        return Request(APIRequestFactory().get("/api/events/", params))
+
+    def test_cursor_round_trip(self):
+        pagination = EventKeysetPagination()
+        start = aware(2025, 1, 1, 9)
+        event_id = uuid.uuid4()
+        cursor = pagination.encode_cursor([start, event_id])
+
+        self.assertNotIn("=", cursor)
+        self.assertEqual(
+            pagination.decode_cursor(self.request(cursor=cursor)),
+            [str(start), str(event_id)],
+        )
+
+    def test_cursor_keeps_integers(self):
+        pagination = EventSearchKeysetPagination()
+        cursor = pagination.encode_cursor([3, "a"])
+        self.assertEqual(
+            pagination.decode_cursor(self.request(cursor=cursor)), [3, "a"]
+        )
+
+    def test_missing_cursor(self):
+        self.assertIsNone(EventKeysetPagination().decode_cursor(self.request()))
+
+    def test_invalid_cursor(self):
+        pagination = EventKeysetPagination()
+        for cursor in [
+            "not base64!",
+            pagination.encode_cursor([1]),
+            pagination.encode_cursor([1, 2, 3]),
+            "e30",  # {}
+        ]:
+            with self.subTest(cursor=cursor), self.assertRaises(NotFound):
+                pagination.decode_cursor(self.request(cursor=cursor))
+
+    def test_cursor_values_are_typed(self):
+        pagination = EventKeysetPagination()
+        start = aware(2025, 1, 1, 9)
+        event_id = uuid.uuid4()
+        cursor = pagination.encode_cursor([start, event_id])
+        self.assertEqual(
+            pagination.decode_cursor(self.request(cursor=cursor), Event.objects.all()),
+            [start, event_id],
+        )
+
+    def test_invalid_cursor_values(self):
+        events = Event.objects.all()
+        searched = events.annotate(rank=Value(0.0, output_field=FloatField()))
+        cases = [
+            (EventKeysetPagination(), events, ["x", "y"]),
+            (EventKeysetPagination(), events, [str(aware(2025, 1, 1)), "not-a-uuid"]),
+            (EventKeysetPagination(), events, [None, str(uuid.uuid4())]),
+            (EventKeysetPagination(), events, [[1], {}]),
+            (EventSearchKeysetPagination(), searched, ["high", str(uuid.uuid4())]),
+        ]
+        for pagination, queryset, position in cases:
+            cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+            with self.subTest(position=position), self.assertRaises(NotFound):
+                pagination.decode_cursor(self.request(cursor=cursor), queryset)
+
+    def test_position_filter(self):
+        pagination = EventSearchKeysetPagination()
+        self.assertEqual(
+            pagination.get_position_filter([0.5, "x"]),
+            Q(rank__lt=0.5) | Q(rank=0.5) & Q(event_id__gt="x"),
+        )
+
+    def test_page_size_is_clamped(self):
+        pagination = EventKeysetPagination()
+        self.assertEqual(pagination.get_page_size(self.request(page_size=0)), 1)
+        self.assertEqual(
+            pagination.get_page_size(self.request(page_size=10_000)),
+            pagination.max_page_size,
+        )
+        self.assertEqual(
+            pagination.get_page_size(self.request(page_size="x")),
+            pagination.page_size,
+        )
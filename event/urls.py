@@ -1,7 +1,12 @@
 from django.urls import path
 
 from .views import (
+    EventBulkAPIView,
+    EventDensityAPIView,
+    EventImportJobAPIView,
     EventRetrieveUpdateDestroyAPIView,
+    EventSearchAPIView,
+    EventSyncAPIView,
     EventUploadView,
     EventViewSet,
     PrivateEventCreateAPIView,
@@ -33,8 +38,22 @@ urlpatterns = [
         EventRetrieveUpdateDestroyAPIView.as_view(),
         name="event-detail",
     ),
+    # 이벤트 일괄 삭제/이동/수정
+    path("bulk/", EventBulkAPIView.as_view(), name="event-bulk"),
     # CSV 업로드 및 업데이트
     path("upload/", EventUploadView.as_view(), name="event-upload"),
+    # 업로드 작업 진행 상황 조회
+    path(
+        "upload/<uuid:job_id>/",
+        EventImportJobAPIView.as_view(),
+        name="event-upload-job",
+    ),
     # 이벤트 ViewSet
     path("active/", EventViewSet.as_view({"get": "list"}), name="event-viewset"),
+    # 날짜별 이벤트 수
+    path("density/", EventDensityAPIView.as_view(), name="event-density"),
+    # 이벤트 검색
+    path("search/", EventSearchAPIView.as_view(), name="event-search"),
+    # 이벤트 변경분 동기화
+    path("sync/", EventSyncAPIView.as_view(), name="event-sync"),
 ]
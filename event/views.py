@@ -1,8 +1,5 @@
 import csv
 
-# 메모리 내 상태 저장소
-calendar_admin_active_status = {}
-
 with open("event_schedule.csv", "w", newline="") as file:
     writer = csv.writer(file)
     writer.writerow(["title", "description", "start_time", "end_time", "is_public"])
@@ -19,25 +16,75 @@ with open("event_schedule.csv", "w", newline="") as file:
         ]
     )
 
-import pandas as pd
+from django.conf import settings
 from django.core.exceptions import PermissionDenied
-from django.db.models import Q
 from django.http import Http404
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status, viewsets
 from rest_framework.generics import (
     CreateAPIView,
     ListAPIView,
+    RetrieveAPIView,
     RetrieveUpdateDestroyAPIView,
 )
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from calendars.models import CalendarAdmin, Subscription
+from calendars.models import CalendarAdmin
+from calendars.services import (
+    ADMIN_ROLES,
+    ROLE_SUBSCRIBER,
+    CalendarRoleResolver,
+    CalendarVersionService,
+    VisibleCalendarService,
+)
+from config.pagination import EventKeysetPagination, EventSearchKeysetPagination
+
+from .importer import SUPPORTED_EXTENSIONS, create_import_job, import_file
+from .models import Event, EventImportJob
+from .recurrence import expand_rows
+from .serializers import (
+    EventBulkSerializer,
+    EventFeedMapper,
+    EventImportJobSerializer,
+    EventSerializer,
+    PrivateEventSerializer,
+    PublicEventSerializer,
+)
+from .services import (
+    EventBulkService,
+    EventService,
+    InvalidEventImportException,
+    InvalidEventWindowException,
+    InvalidSearchQueryException,
+    InvalidSyncTokenException,
+)
+
 
-from .models import Calendar, Event
-from .serializers import EventSerializer, PrivateEventSerializer, PublicEventSerializer
+def get_active_calendar_ids(user):
+    """
+    화면에 표시 중인 관리 캘린더 / 구독 캘린더 ID 목록
+    - 관리 캘린더: 숨긴(CalendarAdmin.is_active=False) 캘린더 제외
+    - 구독 캘린더: 활성 구독(Subscription.is_active)만 역할 맵에 포함됨
+    """
+    hidden_calendar_ids = set(
+        CalendarAdmin.objects.filter(user=user, is_active=False).values_list(
+            "calendar_id", flat=True
+        )
+    )
+    admin_calendar_ids = [
+        calendar_id
+        for calendar_id in VisibleCalendarService.get_calendar_ids(
+            user, roles=ADMIN_ROLES
+        )
+        if calendar_id not in hidden_calendar_ids
+    ]
+    subscribed_calendar_ids = VisibleCalendarService.get_calendar_ids(
+        user, roles=(ROLE_SUBSCRIBER,)
+    )
+    return admin_calendar_ids, subscribed_calendar_ids
 
 
 class PublicEventListAPIView(ListAPIView):
@@ -48,6 +95,7 @@ class PublicEventListAPIView(ListAPIView):
 
     serializer_class = PublicEventSerializer
     permission_classes = [IsAuthenticated]  # JWT 인증 필수
+    pagination_class = EventKeysetPagination
 
     @extend_schema(
         # tags=["공개 이벤트"],
@@ -58,15 +106,7 @@ class PublicEventListAPIView(ListAPIView):
     def get_queryset(self):
         # 사용자가 관리자이거나 구독한 캘린더의 이벤트만 조회
         return Event.objects.filter(
-            calendar_id__in=Calendar.objects.filter(
-                Q(creator=self.request.user)  # 캘린더 생성자
-                | Q(admins=self.request.user)  # 캘린더 관리자
-                | Q(
-                    subscriptions__user=self.request.user, subscriptions__is_active=True
-                )  # 구독자
-            )
-            .distinct()
-            .values_list("calendar_id", flat=True),
+            calendar_id__in=VisibleCalendarService.get_calendar_ids(self.request.user),
             is_public=True,
         )
 
@@ -99,6 +139,7 @@ class PrivateEventListAPIView(ListAPIView):
 
     serializer_class = PrivateEventSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = EventKeysetPagination
 
     @extend_schema(
         # tags=["비공개 이벤트"],
@@ -144,19 +185,10 @@ class EventRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAPIView):
 
     def perform_destroy(self, instance):
         """이벤트 삭제 전 권한 확인"""
-        try:
-            calendar_id = instance.calendar_id_id  # ForeignKey 필드의 ID 접근
-            calendar = Calendar.objects.get(calendar_id=calendar_id)
-
-            if (
-                self.request.user == calendar.creator
-                or self.request.user in calendar.admins.all()
-            ):
-                instance.delete()
-            else:
-                raise PermissionDenied("이 이벤트를 삭제할 권한이 없습니다.")
-        except Calendar.DoesNotExist:
-            raise Http404("캘린더를 찾을 수 없습니다.")
+        resolver = CalendarRoleResolver.for_request(self.request)
+        if not resolver.is_admin(instance.calendar_id_id):
+            raise PermissionDenied("이 이벤트를 삭제할 권한이 없습니다.")
+        instance.delete()
 
     def handle_exception(self, exc):
         if isinstance(exc, Http404):
@@ -181,6 +213,63 @@ class EventRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAPIView):
         return super().delete(request, *args, **kwargs)
 
 
+class EventBulkAPIView(APIView):
+    """
+    이벤트 일괄 삭제 / 이동 / 수정
+    - POST: 작업 목록을 순서대로 적용하고 이벤트별 결과를 반환합니다.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="이벤트 일괄 작업",
+        description=(
+            "여러 이벤트를 한 번에 삭제(delete), 다른 캘린더로 이동(move), "
+            "수정(update)합니다. 작업은 순서대로 적용되며, 권한이 없거나 없는 이벤트는 "
+            "건너뛰고 이벤트별 결과(status)에 표시합니다. "
+            f"한 요청에 최대 {settings.EVENT_BULK_MAX_ITEMS}개의 이벤트를 처리합니다."
+        ),
+        request=EventBulkSerializer,
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "results": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "operation": {"type": "integer"},
+                                "event_id": {"type": "string", "format": "uuid"},
+                                "status": {
+                                    "type": "string",
+                                    "enum": [
+                                        EventBulkService.STATUS_DELETED,
+                                        EventBulkService.STATUS_MOVED,
+                                        EventBulkService.STATUS_UPDATED,
+                                        EventBulkService.STATUS_NOT_FOUND,
+                                        EventBulkService.STATUS_FORBIDDEN,
+                                        EventBulkService.STATUS_CONFLICT,
+                                    ],
+                                },
+                                "error": {"type": "string"},
+                            },
+                        },
+                    },
+                },
+            },
+            400: {"description": "요청 데이터가 유효하지 않습니다."},
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = EventBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = EventBulkService.apply(
+            request, serializer.validated_data["operations"]
+        )
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
 class EventUploadView(APIView):
     """
     CSV 또는 Excel 파일로 이벤트 일괄 업로드/업데이트
@@ -192,7 +281,13 @@ class EventUploadView(APIView):
     @extend_schema(
         # tags=["이벤트"],
         summary="이벤트 일괄 업로드/업데이트",
-        description="CSV 또는 Excel 파일을 사용하여 이벤트를 생성하거나 업데이트합니다.",
+        description=(
+            "CSV 또는 Excel 파일을 사용하여 이벤트를 생성하거나 업데이트합니다. "
+            "잘못된 행이 있으면 아무것도 저장하지 않고 모든 행의 오류를 반환합니다. "
+            "EVENT_IMPORT_SYNC_MAX_SIZE보다 큰 파일은 업로드 작업으로 저장되어 202와 함께 "
+            "작업 정보를 반환하며, 진행 상황은 /api/events/upload/<job_id>/로 조회합니다. "
+            "작업에서는 잘못된 행을 건너뛰고 나머지 행을 저장합니다."
+        ),
         request={
             "type": "object",
             "properties": {
@@ -228,6 +323,7 @@ class EventUploadView(APIView):
                     }
                 },
             },
+            202: EventImportJobSerializer,
             400: {
                 "description": "잘못된 요청",
                 "content": {
@@ -256,84 +352,70 @@ class EventUploadView(APIView):
                 {"error": "파일을 업로드하세요."}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        # 2. 파일 형식 확인 및 데이터 로드
-        try:
-            if file.name.endswith(".csv"):
-                data = pd.read_csv(file)
-            elif file.name.endswith(".xlsx"):
-                data = pd.read_excel(file)
-            else:
-                return Response(
-                    {
-                        "error": "지원하지 않는 파일 형식입니다. CSV 또는 Excel 파일을 사용하세요."
-                    },
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-        except Exception as e:
+        # 2. 파일 형식 확인
+        if not file.name.endswith(SUPPORTED_EXTENSIONS):
             return Response(
-                {"error": f"파일 처리 중 오류가 발생했습니다: {str(e)}"},
+                {
+                    "error": "지원하지 않는 파일 형식입니다. CSV 또는 Excel 파일을 사용하세요."
+                },
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # 3. 필수 필드 확인
-        required_fields = [
-            "calendar_id",
-            "title",
-            "description",
-            "start_time",
-            "end_time",
-            "is_public",
-        ]
-        missing_fields = [
-            field for field in required_fields if field not in data.columns
-        ]
-        if missing_fields:
+        # 3. 큰 파일은 작업으로 저장하고 워커가 처리 (요청 처리 시간 제한)
+        if file.size > settings.EVENT_IMPORT_SYNC_MAX_SIZE:
+            job = create_import_job(request.user, file)
             return Response(
-                {"error": f"누락된 필드: {', '.join(missing_fields)}"},
-                status=status.HTTP_400_BAD_REQUEST,
+                EventImportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED
             )
 
-        # 4. 데이터 처리
-        created_events = []
-        updated_events = []
-        for _, row in data.iterrows():
-            try:
-                # 업데이트 처리
-                event_id = row.get("event_id")
-                if event_id:
-                    event = Event.objects.get(event_id=event_id, admin_id=request.user)
-                    for attr, value in row.items():
-                        setattr(event, attr, value)
-                    event.save()
-                    updated_events.append(event)
-                else:
-                    # 생성 처리
-                    serializer = PublicEventSerializer(data=row.to_dict())
-                    if serializer.is_valid():
-                        serializer.save(admin_id=request.user)
-                        created_events.append(serializer.data)
-                    else:
-                        return Response(
-                            serializer.errors, status=status.HTTP_400_BAD_REQUEST
-                        )
-            except Event.DoesNotExist:
-                return Response(
-                    {"error": f"ID {event_id} 이벤트를 찾을 수 없습니다."},
-                    status=status.HTTP_404_NOT_FOUND,
-                )
+        # 4. 청크 단위로 읽으며 검증 및 일괄 저장
+        # (잘못된 행이 있으면 아무것도 저장하지 않고 모든 행의 오류를 함께 반환)
+        try:
+            created_events, updated_events = import_file(request.user, file)
+        except InvalidEventImportException as e:
+            response = {"error": e.message}
+            if e.errors:
+                response["errors"] = e.errors
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
         # 5. 응답 반환
         return Response(
             {
-                "created_events": created_events,
-                "updated_events": [
-                    PublicEventSerializer(event).data for event in updated_events
-                ],
+                "created_events": PublicEventSerializer(created_events, many=True).data,
+                "updated_events": PublicEventSerializer(updated_events, many=True).data,
             },
             status=status.HTTP_200_OK,
         )
 
 
+class EventImportJobAPIView(RetrieveAPIView):
+    """
+    이벤트 업로드 작업 진행 상황 조회
+    - 작업을 만든 사용자만 조회 가능
+    """
+
+    serializer_class = EventImportJobSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = "job_id"
+
+    def get_queryset(self):
+        return EventImportJob.objects.filter(user=self.request.user).defer("content")
+
+    @extend_schema(
+        summary="이벤트 업로드 작업 조회",
+        description=(
+            "업로드 작업의 상태(pending/running/succeeded/failed), 진행률, "
+            "생성/업데이트 수와 행 오류를 조회합니다."
+        ),
+        responses={
+            200: EventImportJobSerializer,
+            404: {"description": "업로드 작업을 찾을 수 없습니다."},
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
 class EventViewSet(viewsets.ModelViewSet):
     """
     이벤트 ViewSet
@@ -342,53 +424,279 @@ class EventViewSet(viewsets.ModelViewSet):
     serializer_class = EventSerializer
     permission_classes = [IsAuthenticated]
 
+    @extend_schema(
+        summary="활성 캘린더 이벤트 조회",
+        description="관리/구독 중인 캘린더에서 조회 기간과 겹치는 이벤트를 반환합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="start",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description="조회 시작 시점 (기본값: 이번 달 1일)",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="end",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description="조회 종료 시점 (기본값: start + 최대 조회 기간)",
+                required=False,
+            ),
+        ],
+        responses={
+            400: {"description": "조회 기간이 올바르지 않습니다."},
+        },
+    )
     def list(self, request, *args, **kwargs):
         user = self.request.user
         if not user.is_authenticated:
             return Response([])
 
-        # 사용자 키 설정
-        user_key = getattr(user, "id", user.username)
+        # 조회 기간 확인
+        try:
+            start, end = EventService.get_window(request.query_params)
+        except InvalidEventWindowException as e:
+            return Response(
+                {"error": e.error, "message": e.message},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        admin_calendar_ids, subscribed_calendar_ids = get_active_calendar_ids(user)
 
         # 관리자로 있는 캘린더의 이벤트 (is_active인 것만)
-        admin_calendars = CalendarAdmin.objects.filter(user=user)
-        admin_calendar_ids = [
-            admin.calendar.calendar_id
-            for admin in admin_calendars
-            if calendar_admin_active_status.get(
-                (user_key, admin.calendar.calendar_id), True
-            )
-        ]
-        admin_events = Event.objects.filter(calendar_id__in=admin_calendar_ids)
-
-        # 구독 중인 캘린더의 이벤트 (is_active인 것만, 공개 이벤트만)
-        subscribed_calendars = Subscription.objects.filter(user_id=user, is_active=True)
-        subscribed_calendar_ids = [
-            sub.calendar.calendar_id
-            for sub in subscribed_calendars
-            if calendar_admin_active_status.get(
-                (user_key, sub.calendar.calendar_id), True
-            )
-        ]
-        subscribed_events = Event.objects.filter(
-            calendar_id__in=subscribed_calendar_ids, is_public=True
+        admin_events = EventService.filter_window(
+            Event.objects.filter(calendar_id__in=admin_calendar_ids), start, end
+        )
+
+        # 피드에 포함된 캘린더와 내 즐겨찾기(is_liked)가 바뀌지 않았으면
+        # 이벤트 조회 없이 304 반환
+        calendar_ids = admin_calendar_ids + subscribed_calendar_ids
+        etag = CalendarVersionService.get_etag(
+            calendar_ids,
+            user.pk,
+            sorted(admin_calendar_ids),
+            sorted(subscribed_calendar_ids),
+            EventService.get_favorite_state(user, calendar_ids),
+            start,
+            end,
+        )
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if CalendarVersionService.is_not_modified(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        subscribed_events = EventService.filter_window(
+            Event.objects.filter(
+                calendar_id__in=subscribed_calendar_ids, is_public=True
+            ),
+            start,
+            end,
         )
 
-        # 이벤트 직렬화
-        admin_events_serialized = EventSerializer(
-            admin_events, many=True, context={"request": request}
-        ).data
-        subscribed_events_serialized = EventSerializer(
-            subscribed_events, many=True, context={"request": request}
-        ).data
+        # 이벤트 직렬화 (반복 일정은 조회 기간 안의 발생으로 펼침)
+        # 피드는 행 수가 많으므로 모델 인스턴스 대신 values() 행을 바로 변환
+        mapper = EventFeedMapper(context={"request": request})
+        admin_events_serialized = mapper.to_representation(
+            expand_rows(admin_events.values(*mapper.values_fields), start, end)
+        )
+        subscribed_events_serialized = mapper.to_representation(
+            expand_rows(subscribed_events.values(*mapper.values_fields), start, end)
+        )
 
         # 구분된 형태로 반환
         return Response(
             {
                 "admin_events": admin_events_serialized,
                 "subscription_events": subscribed_events_serialized,
-            }
+            },
+            headers=headers,
         )
 
     def perform_create(self, serializer):
         serializer.save(admin_id=self.request.user)
+
+
+class EventSearchAPIView(ListAPIView):
+    """
+    이벤트 검색
+    - GET: 볼 수 있는 이벤트의 제목/위치/설명에서 검색어를 찾아 관련도 순으로 반환합니다.
+    """
+
+    serializer_class = EventSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = EventSearchKeysetPagination
+
+    @extend_schema(
+        summary="이벤트 검색",
+        description=(
+            "관리/구독 중인 캘린더의 이벤트를 제목, 위치, 설명으로 검색합니다. "
+            "단어 단위 전문 검색과 부분 문자열 검색 결과를 합쳐 관련도 순으로 반환합니다. "
+            "반복 일정은 원본 1건으로 반환됩니다."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="q",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=f"검색어 (최대 {EventService.SEARCH_QUERY_MAX_LENGTH}자)",
+                required=True,
+            ),
+        ],
+        responses={
+            200: EventSerializer(many=True),
+            400: {"description": "검색어가 올바르지 않습니다."},
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        try:
+            return super().get(request, *args, **kwargs)
+        except InvalidSearchQueryException as e:
+            return Response(
+                {"error": e.error, "message": e.message},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+    def get_queryset(self):
+        return EventService.search(
+            self.request.user, self.request.query_params.get("q")
+        )
+
+
+class EventSyncAPIView(APIView):
+    """
+    이벤트 변경분 동기화
+    - GET: since 토큰 이후 생성/수정/삭제된 이벤트만 반환합니다.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="이벤트 변경분 동기화",
+        description=(
+            "since 토큰 이후 생성/수정된 이벤트와 삭제된 이벤트 ID를 반환합니다. "
+            "토큰이 없거나 캘린더 구성이 바뀐 경우 전체 목록을 반환하며 reset=true가 됩니다. "
+            "이벤트는 수정 시각 순으로 페이지 단위로 반환하며, next_page가 있으면 "
+            "page에 넣어 다음 페이지를 요청합니다. next_token은 마지막 페이지에서만 발급되고, "
+            "deleted와 reset은 첫 페이지에만 포함됩니다. "
+            "클라이언트는 deleted를 먼저 반영한 뒤 events를 upsert 해야 합니다."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="since",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="이전 응답의 next_token",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="page",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="이전 응답의 next_page (지정하면 since는 무시)",
+                required=False,
+            ),
+        ],
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "events": {"type": "array", "items": {"type": "object"}},
+                    "deleted": {
+                        "type": "array",
+                        "items": {"type": "string", "format": "uuid"},
+                    },
+                    "next_token": {"type": "string", "nullable": True},
+                    "next_page": {"type": "string", "nullable": True},
+                    "reset": {"type": "boolean"},
+                },
+            },
+            400: {"description": "유효하지 않은 동기화 토큰입니다."},
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        try:
+            events, deleted, next_token, next_page, reset = EventService.sync(
+                request.user,
+                request.query_params.get("since"),
+                request.query_params.get("page"),
+            )
+        except InvalidSyncTokenException as e:
+            return Response(
+                {"error": e.error, "message": e.message},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {
+                "events": EventSerializer(
+                    events, many=True, context={"request": request}
+                ).data,
+                "deleted": deleted,
+                "next_token": next_token,
+                "next_page": next_page,
+                "reset": reset,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class EventDensityAPIView(APIView):
+    """
+    날짜별 이벤트 수 조회 (월/주 달력 표시용)
+    - GET: 조회 기간 안의 날짜별/캘린더별 이벤트 수를 반환합니다.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="날짜별 이벤트 수 조회",
+        description=(
+            "화면에 표시 중인 관리/구독 캘린더에 대해 시작 날짜(Asia/Seoul 기준)별, "
+            "캘린더별 이벤트 수를 반환합니다."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="start",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description="조회 시작 시점 (기본값: 이번 달 1일)",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="end",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description="조회 종료 시점 (기본값: start + 최대 조회 기간)",
+                required=False,
+            ),
+        ],
+        responses={
+            200: {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "date": {"type": "string", "format": "date"},
+                        "calendar_id": {"type": "integer"},
+                        "count": {"type": "integer"},
+                    },
+                },
+            },
+            400: {"description": "조회 기간이 올바르지 않습니다."},
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        try:
+            start, end = EventService.get_window(request.query_params)
+        except InvalidEventWindowException as e:
+            return Response(
+                {"error": e.error, "message": e.message},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        admin_calendar_ids, subscribed_calendar_ids = get_active_calendar_ids(
+            request.user
+        )
+        density = EventService.get_density(
+            admin_calendar_ids, subscribed_calendar_ids, start, end
+        )
+        return Response(density, status=status.HTTP_200_OK)
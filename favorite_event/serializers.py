@@ -75,6 +75,7 @@ class FavoriteEventResponseSerializer(serializers.Serializer):
     """즐겨찾기 목록 응답용 시리얼라이저"""
 
     favorite_events = FavoriteEventListSerializer(many=True)
+    next = serializers.URLField(allow_null=True, help_text="다음 페이지 URL")
 
 
 # 요청 시리얼라이저들은 단순하므로 BaseSerializer 상속 불필요
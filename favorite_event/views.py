@@ -3,6 +3,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from config.pagination import FavoriteEventKeysetPagination
 from favorite_event.serializers import (
     FavoriteCreateSerializer,
     FavoriteDeleteSerializer,
@@ -16,6 +17,7 @@ from favorite_event.services import FavoriteEventService, IsSuperUserOrStaffOrOw
 class FavoriteEventList(APIView):
     # 즐겨찾기 목록 조회 View
     permission_classes = [IsSuperUserOrStaffOrOwner]
+    pagination_class = FavoriteEventKeysetPagination
 
     @extend_schema(tags=["즐겨찾기"], responses={200: FavoriteEventResponseSerializer})
     def get(self, request, user_id):
@@ -24,8 +26,13 @@ class FavoriteEventList(APIView):
         if error:
             return Response(error, status=status.HTTP_404_NOT_FOUND)
 
-        serializer = FavoriteEventListSerializer(favorites, many=True)
-        return Response({"favorite_events": serializer.data}, status=status.HTTP_200_OK)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(favorites, request, view=self)
+        serializer = FavoriteEventListSerializer(page, many=True)
+        return Response(
+            {"favorite_events": serializer.data, "next": paginator.get_next_link()},
+            status=status.HTTP_200_OK,
+        )
 
     @extend_schema(
         tags=["즐겨찾기"],
@@ -6,7 +6,9 @@ from django.contrib.auth.models import (
     BaseUserManager,
     PermissionsMixin,
 )
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 
@@ -67,3 +69,10 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     class Meta:
         db_table = "user_user"
+        indexes = [
+            # 닉네임 앞부분 검색(istartswith = UPPER(nickname) LIKE 'ABC%')용 함수 인덱스
+            models.Index(
+                OpClass(Upper("nickname"), name="text_pattern_ops"),
+                name="user_nickname_upper_idx",
+            ),
+        ]